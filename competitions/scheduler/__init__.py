@@ -25,9 +25,36 @@ class ScheduleGenerationFailed(RuntimeError):
 
     This is raised by implementations of Scheduler.generate_schedule() in the
     event that it cannot generate a schedule. This is usually because try_once
-    was passed and the first attempt failed. The method will otherwise call
-    itself until a schedule can be generated, and this will only fail if the
-    recursion limit is reached, when a different error will be raised.
+    was passed and the first attempt failed, or because the attempt budget of
+    the retry policy was exhausted.
+    """
+
+    def __init__(self, message='Schedule generation failed.', attempts=1,
+                 max_rounds=0):
+        """Constructor.
+
+        @param message: The error message
+        @type message: str
+        @param attempts: The number of attempts made
+        @type attempts: int
+        @param max_rounds: The most rounds completed by any attempt
+        @type max_rounds: int
+        """
+        super(ScheduleGenerationFailed, self).__init__(message)
+        self.attempts = attempts
+        self.max_rounds = max_rounds
+
+    def __reduce__(self):
+        """Keep the attempt counts when pickled, such as by worker processes."""
+        return (type(self), (self.args[0], self.attempts, self.max_rounds))
+
+
+class GenerationAborted(RuntimeError):
+
+    """Exception for schedule generation stopped by an observer.
+
+    Observers of generation raise this from their callbacks to stop it. It is
+    never retried, and reaches the caller of Scheduler.generate_schedule().
     """
 
     pass
@@ -0,0 +1,236 @@
+# -*- coding: utf-8  -*-
+"""Binary archives of generated schedules.
+
+An archive holds any number of schedules for leagues of the same shape. It
+starts with a header of 32 bytes, with all integers little-endian and
+unsigned::
+
+    offset  size  field
+         0     4  magic bytes CSCH
+         4     2  format version
+         6     2  number of teams
+         8     2  number of meetings
+        10     2  padding
+        12     4  number of rounds per schedule
+        16     8  number of schedules
+        24     8  reserved, written as zeros
+
+The schedules follow one after another from offset 32, each as a column of
+the home team indices of all its matches and a column of the away team
+indices, as 16-bit integers.
+
+Every schedule takes the same number of bytes, so schedules are read from
+their offsets in the file without reading the ones before them.
+"""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import mmap
+import operator
+import struct
+import sys
+
+from .cache import _from_bytes, _to_bytes
+from .schedule import Schedule
+
+MAGIC = b'CSCH'
+VERSION = 1
+HEADER = struct.Struct(str('<4sHHH2xIQ8x'))
+
+# Whether schedules can be read as views of the file, without copying
+ZERO_COPY = sys.byteorder == 'little' and hasattr(memoryview, 'cast')
+
+
+class ArchiveWriter(object):
+
+    """A writer of schedules to a new archive.
+
+    The number of schedules in the header is only written when the writer is
+    closed, and the archive cannot be read before then.
+    """
+
+    def __init__(self, path, team_count, meetings):
+        """Constructor.
+
+        @param path: The file to write the archive to, which is replaced if it
+            exists
+        @type path: str
+        @param team_count: The number of teams, including any placeholder
+        @type team_count: int
+        @param meetings: The number of times teams meet each other
+        @type meetings: int
+        """
+        self.team_count = team_count
+        self.meetings = meetings
+        self.match_count = team_count // 2
+        self.round_count = (team_count - 1) * meetings
+        self.count = 0
+        self._file = open(path, 'wb')
+        self._write_header()
+
+    def __enter__(self):
+        """Use the writer as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the writer."""
+        self.close()
+
+    def _write_header(self):
+        """Write the header at the start of the file."""
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.team_count,
+                                     self.meetings, self.round_count,
+                                     self.count))
+
+    def write(self, schedule):
+        """Add a schedule to the archive.
+
+        @param schedule: The schedule, between team indices
+        @type schedule: Schedule or list of lists of tuples
+        @raise ValueError: The schedule is not the size of the archive's
+        """
+        if not isinstance(schedule, Schedule):
+            schedule = Schedule.from_rounds(schedule, self.match_count)
+        if (schedule.match_count != self.match_count or
+                len(schedule) != self.round_count):
+            raise ValueError('Schedule does not have {} rounds of {} matches.'.format(
+                self.round_count, self.match_count))
+        self._file.write(_to_bytes(schedule.homes))
+        self._file.write(_to_bytes(schedule.aways))
+        self.count += 1
+
+    def close(self):
+        """Write the number of schedules and close the file."""
+        if not self._file.closed:
+            self._write_header()
+            self._file.close()
+
+
+def write_archive(path, schedules, team_count, meetings):
+    """Write schedules to a new archive.
+
+    @param path: The file to write the archive to
+    @type path: str
+    @param schedules: The schedules, between team indices
+    @type schedules: iterable
+    @param team_count: The number of teams, including any placeholder
+    @type team_count: int
+    @param meetings: The number of times teams meet each other
+    @type meetings: int
+    @return: The number of schedules written
+    @rtype: int
+    """
+    with ArchiveWriter(path, team_count, meetings) as writer:
+        for schedule in schedules:
+            writer.write(schedule)
+    return writer.count
+
+
+class ScheduleArchive(object):
+
+    """A reader of schedules from an archive.
+
+    The file is memory-mapped, so opening an archive does not read its
+    schedules, and each schedule is read when it is accessed. Where possible,
+    the schedules are views of the mapped file, which must then stay open
+    while they are used.
+    """
+
+    def __init__(self, path, teams=None):
+        """Constructor.
+
+        @param path: The file of the archive
+        @type path: str
+        @param teams: The teams at each index to give the schedules, or None
+            for schedules between team indices
+        @type teams: list or None
+        @raise ValueError: The file is not an archive, or is truncated
+        """
+        self.path = path
+        self.teams = teams
+        with open(path, 'rb') as archive:
+            self._map = mmap.mmap(archive.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, version, self.team_count, self.meetings, self.round_count,
+             self.count) = HEADER.unpack_from(self._map)
+        except struct.error:
+            raise ValueError('Not a schedule archive: {}'.format(path))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('Not a schedule archive: {}'.format(path))
+        self.match_count = self.team_count // 2
+        self._column_size = 2 * self.round_count * self.match_count
+        if len(self._map) < HEADER.size + 2 * self._column_size * self.count:
+            raise ValueError('Schedule archive is truncated: {}'.format(path))
+        self._view = memoryview(self._map) if ZERO_COPY else None
+
+    def __enter__(self):
+        """Use the archive as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the archive."""
+        self.close()
+
+    def __len__(self):
+        """Get the number of schedules."""
+        return self.count
+
+    def _column(self, start):
+        """Get a column of team indices starting at an offset in the file."""
+        end = start + self._column_size
+        if self._view is not None:
+            return self._view[start:end].cast(str('H'))
+        return _from_bytes(self._map[start:end])
+
+    def __getitem__(self, number):
+        """Get a schedule.
+
+        @param number: The number of the schedule, from 0
+        @type number: int
+        @rtype: Schedule
+        @raise IndexError: There is no such schedule
+        """
+        number = operator.index(number)
+        if number < 0:
+            number += self.count
+        if not 0 <= number < self.count:
+            raise IndexError('Schedule archive index out of range.')
+        start = HEADER.size + 2 * self._column_size * number
+        return Schedule(self._column(start),
+                        self._column(start + self._column_size),
+                        self.match_count, self.teams)
+
+    def __iter__(self):
+        """Iterate over the schedules."""
+        for number in range(self.count):
+            yield self[number]
+
+    def close(self):
+        """Close the archive.
+
+        If views of the file are still in use, it is only unmapped once they
+        are no longer used.
+        """
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        try:
+            self._map.close()
+        except BufferError:
+            pass
@@ -0,0 +1,247 @@
+# -*- coding: utf-8  -*-
+"""Backtracking round construction."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import random
+
+from . import ScheduleGenerationFailed
+
+
+class BacktrackingRoundBuilder(object):
+
+    """Build the rounds of a season by depth-first search.
+
+    Teams are identified by their indices. Each round is searched for by
+    pairing the free team with the fewest possible opponents with each of
+    them in turn, backing out of a pairing when it leaves a team without an
+    opponent. When a round cannot be completed, only the last few rounds are
+    searched for again, so dead ends late in the season are repaired without
+    discarding the earlier rounds.
+
+    Whether a pair of teams can meet in a round does not depend on which team
+    is at home, so the search works on pairs of teams, and the orientations of
+    their matches are handed out in random order.
+    """
+
+    def __init__(self, team_count, matches, lookahead=True, max_nodes=None,
+                 rng=random, observer=None):
+        """Constructor.
+
+        @param team_count: The number of teams, including any placeholder
+        @type team_count: int
+        @param matches: The matches to schedule, as pairs of team indices
+        @type matches: list of tuples
+        @param lookahead: Whether to reject rounds after which the remaining
+            matches cannot be split into rounds
+        @type lookahead: bool
+        @param max_nodes: The number of search steps allowed, or None for no
+            limit
+        @type max_nodes: int or None
+        @param rng: The random number generator to use
+        @type rng: random.Random
+        @param observer: The observer to tell about each try at a round
+        @type observer: GenerationObserver
+        """
+        self.team_count = team_count
+        self.match_count = team_count // 2
+        self.round_count = len(matches) // self.match_count
+        self.lookahead = lookahead
+        self.max_nodes = max_nodes
+        self.rng = rng
+        self.observer = observer
+        self.nodes = 0
+        self.deepest = 0  # The most rounds built at any point
+        self._remaining = {}  # Orientations remaining for each pair of teams
+        self._opponents = [set() for __ in range(team_count)]
+        for match in matches:
+            (team, opp) = match
+            self._remaining.setdefault(tuple(sorted(match)), []).append(match)
+            self._opponents[team].add(opp)
+            self._opponents[opp].add(team)
+        for orientations in self._remaining.values():
+            rng.shuffle(orientations)
+
+    def _pair(self, team, opp):
+        """Get the remaining orientations of a pair of teams."""
+        return self._remaining[(team, opp) if team < opp else (opp, team)]
+
+    def _candidates(self, free):
+        """Get the possible matches for the most constrained free team."""
+        team = min(free, key=lambda team: len(self._opponents[team] & free))
+        opps = list(self._opponents[team] & free)
+        self.rng.shuffle(opps)
+        return iter([(team, opp) for opp in opps])
+
+    def _take(self, free, pair):
+        """Schedule a pair of teams, returning the match played."""
+        (team, opp) = pair
+        free.difference_update(pair)
+        orientations = self._pair(team, opp)
+        if len(orientations) == 1:
+            self._opponents[team].discard(opp)
+            self._opponents[opp].discard(team)
+        return orientations.pop()
+
+    def _restore(self, free, match):
+        """Return a scheduled match to the remaining matches."""
+        (team, opp) = match
+        free.update(match)
+        self._opponents[team].add(opp)
+        self._opponents[opp].add(team)
+        self._pair(team, opp).append(match)
+
+    def iter_rounds(self, max_nodes=None):
+        """Iterate over possible next rounds.
+
+        The matches of the round last yielded are removed from the remaining
+        matches until the next round is requested or the iteration is closed.
+
+        @param max_nodes: The number of search steps allowed for this round, or
+            None for no limit
+        @type max_nodes: int or None
+        @return: The possible rounds
+        @rtype: generator of lists of tuples
+        @raise ScheduleGenerationFailed: The overall search step limit was
+            reached
+        """
+        free = set(range(self.team_count))
+        frames = [self._candidates(free)]
+        round = []
+        nodes = 0
+        try:
+            while frames:
+                if len(round) == len(frames):  # Withdraw the last choice
+                    self._restore(free, round.pop())
+                nodes += 1
+                self.nodes += 1
+                if self.max_nodes is not None and self.nodes > self.max_nodes:
+                    raise ScheduleGenerationFailed('Search step limit reached.')
+                if max_nodes is not None and nodes > max_nodes:
+                    return
+                try:
+                    pair = next(frames[-1])
+                except StopIteration:
+                    frames.pop()
+                    continue
+                round.append(self._take(free, pair))
+                if len(round) == self.match_count:
+                    yield list(round)
+                else:
+                    frames.append(self._candidates(free))
+        finally:
+            while round:
+                self._restore(free, round.pop())
+
+    def can_complete(self):
+        """Check whether the remaining matches may be split into rounds.
+
+        Every round pairs all teams, so each connected group of teams that
+        still have matches to play must contain an even number of teams.
+        Passing this check does not guarantee that the rounds exist.
+
+        @rtype: bool
+        """
+        parents = list(range(self.team_count))
+
+        def find(team):
+            while parents[team] != team:
+                parents[team] = parents[parents[team]]
+                team = parents[team]
+            return team
+
+        for (team, opps) in enumerate(self._opponents):
+            for opp in opps:
+                parents[find(team)] = find(opp)
+        sizes = {}
+        for team in range(self.team_count):
+            root = find(team)
+            sizes[root] = sizes.get(root, 0) + 1
+        return all(size % 2 == 0 for size in sizes.values())
+
+    def iter_build(self, window=None):
+        """Build the rounds of the season, yielding each one once it is final.
+
+        When no next round can be found, the search backs up by one round and
+        tries that round again. Further dead ends before the season gets any
+        further than before back up twice as far each time.
+
+        Only the last window rounds built may be backed out of. Earlier rounds
+        are final and are yielded as soon as they are built, and the rest once
+        the season is complete.
+
+        @param window: The number of rounds to hold back, or None to hold back
+            all of them until the season is complete
+        @type window: int or None
+        @return: The rounds
+        @rtype: generator of lists of tuples
+        @raise ScheduleGenerationFailed: No schedule could be found within the
+            search step limit, or without backing out of a final round
+        """
+        round_nodes = 4 * self.team_count * self.match_count
+        searches = []
+        rounds = []
+        final = 0  # The number of rounds that are final
+        backup = 1
+        while len(rounds) < self.round_count:
+            if len(searches) == len(rounds):
+                searches.append(self.iter_rounds(round_nodes))
+            if self.observer is not None:
+                self.observer.on_round_started(len(rounds))
+            try:
+                round = next(searches[-1])
+            except StopIteration:  # Dead end, so back up
+                searches.pop()
+                if self.observer is not None:
+                    self.observer.on_round_failed(len(rounds))
+                if not rounds:
+                    raise ScheduleGenerationFailed('No first round found.')
+                if len(rounds) == final:
+                    raise ScheduleGenerationFailed(
+                        'No round found after the final rounds.')
+                if len(rounds) > self.deepest:
+                    (self.deepest, backup) = (len(rounds), 1)
+                else:
+                    backup *= 2
+                for __ in range(min(backup, len(rounds) - final)):
+                    rounds.pop()
+                    searches.pop().close()
+                continue
+            if (self.lookahead and len(rounds) + 1 < self.round_count and
+                    not self.can_complete()):
+                if self.observer is not None:
+                    self.observer.on_round_failed(len(rounds))
+                continue
+            if self.observer is not None:
+                self.observer.on_round_completed(len(rounds), round)
+            rounds.append(round)
+            if window is not None and len(rounds) - final > window:
+                final += 1
+                yield rounds[final - 1]
+        for round in rounds[final:]:
+            yield round
+
+    def build(self):
+        """Build all the rounds of the season.
+
+        @return: The rounds
+        @rtype: list of lists of tuples
+        @raise ScheduleGenerationFailed: No schedule could be found within the
+            search step limit
+        """
+        return list(self.iter_build())
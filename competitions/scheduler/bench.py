@@ -0,0 +1,257 @@
+# -*- coding: utf-8  -*-
+"""Benchmarks for the round-robin scheduler.
+
+Run with C{python -m competitions.scheduler.bench}, which prints the results
+as JSON. Each benchmark is run for every combination of team and meeting
+counts, and reports its fastest and mean wall time, the mean number of
+restarts of schedule generation, and the peak memory allocated during an extra
+run, which is only measured on Python 3.4 and later.
+"""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    tracemalloc = None
+
+from .pool import MatchPool
+from .roundrobin import RoundRobinScheduler
+from .scheduler import GenerationStats, Scheduler
+
+TEAM_COUNTS = (4, 8, 16, 32, 64, 128, 256, 500)
+MEETING_COUNTS = (1, 2, 3, 4, 5, 6)
+
+# The largest leagues Scheduler.find_unique_match() is benchmarked for
+SEARCH_LIMIT = 128
+
+# The largest leagues each schedule generation engine is benchmarked for
+ENGINE_LIMITS = {
+    'random': 16,
+    'backtrack': 64,
+    'circle': None,
+    'matching': None,
+    'template': None,
+}
+
+
+def _build_round_by_search(scheduler, matches):
+    """Build a round with Scheduler.find_unique_match()."""
+    rest = list(matches)
+    round = []
+    for __ in range(scheduler.match_count):
+        round.append(Scheduler.find_unique_match(round, rest))
+    return round
+
+
+def _build_round_by_masks(scheduler, matches):
+    """Build a round with Scheduler.find_unique_match_mask()."""
+    masks = [1 << idx for idx in range(len(scheduler.teams))]
+    rest = iter(matches)
+    used = 0
+    round = []
+    for __ in range(scheduler.match_count):
+        (match, mask) = Scheduler.find_unique_match_mask(used, rest, masks)
+        used |= mask
+        round.append(match)
+    return round
+
+
+def _cases(team_counts, meeting_counts, engines, seed):
+    """Generate the benchmark cases.
+
+    Each case is a tuple of the benchmark name, its parameters, a function
+    taking a random number generator and returning the generation statistics,
+    if any, and a function to call before each run outside of the timing, or
+    None.
+    """
+    for teams in team_counts:
+        for meetings in meeting_counts:
+            scheduler = RoundRobinScheduler(teams, meetings=meetings)
+            params = {'teams': teams, 'meetings': meetings}
+
+            if meetings % 2 == 1:
+                yield ('generate_matrix', params,
+                       lambda rng, scheduler=scheduler:
+                       scheduler.generate_matrix(rng=rng), None)
+            yield ('generate_matches', params,
+                   lambda rng, scheduler=scheduler:
+                   scheduler.generate_matches(rng=rng), None)
+
+            matches = scheduler.generate_matches(rng=seed)
+            pool = MatchPool(matches)
+            full = pool.snapshot()
+            yield ('generate_round', params,
+                   lambda rng, scheduler=scheduler, pool=pool:
+                   scheduler.generate_round(pool, rng=rng),
+                   lambda pool=pool, full=full: pool.rollback(full))
+            if teams <= SEARCH_LIMIT:
+                yield ('find_unique_match', params,
+                       lambda rng, scheduler=scheduler, matches=matches:
+                       _build_round_by_search(scheduler, matches), None)
+            index_matches = list(zip(*scheduler.generate_index_matches(rng=seed)))
+            yield ('find_unique_match_mask', params,
+                   lambda rng, scheduler=scheduler, matches=index_matches:
+                   _build_round_by_masks(scheduler, matches), None)
+
+            for engine in engines:
+                limit = ENGINE_LIMITS.get(engine)
+                if limit is not None and teams > limit:
+                    continue
+
+                def generate(rng, scheduler=scheduler, engine=engine):
+                    stats = GenerationStats()
+                    scheduler.generate_schedule(engine=engine, indices=True,
+                                                rng=rng, stats=stats)
+                    return stats
+
+                yield ('generate_schedule', dict(params, engine=engine),
+                       generate, None)
+
+
+def run_case(function, repeat, seed, setup=None):
+    """Run a benchmark case.
+
+    @param function: The function to benchmark, as yielded by _cases()
+    @type function: callable
+    @param repeat: The number of runs
+    @type repeat: int
+    @param seed: The seed for the random number generator of each run
+    @type seed: int
+    @param setup: The function to call before each run, which is not timed
+    @type setup: callable or None
+    @return: The measurements
+    @rtype: dict
+    """
+    times = []
+    restarts = []
+    for run in range(repeat):
+        rng = random.Random(seed + run)
+        if setup is not None:
+            setup()
+        start = timeit.default_timer()
+        result = function(rng)
+        times.append(timeit.default_timer() - start)
+        if isinstance(result, GenerationStats):
+            restarts.append(result.restarts)
+
+    peak = None
+    if tracemalloc is not None:  # Traced separately, as tracing is slow
+        if setup is not None:
+            setup()
+        tracemalloc.start()
+        try:
+            function(random.Random(seed))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    result = {
+        'best': min(times),
+        'mean': sum(times) / len(times),
+        'peak_memory': peak,
+    }
+    if restarts:
+        result['restarts'] = sum(restarts) / len(restarts)
+    return result
+
+
+def run(team_counts=TEAM_COUNTS, meeting_counts=MEETING_COUNTS,
+        engines=RoundRobinScheduler.ENGINES, benchmarks=None, repeat=3, seed=0):
+    """Run the benchmarks.
+
+    @param team_counts: The numbers of teams
+    @type team_counts: iterable
+    @param meeting_counts: The numbers of meetings
+    @type meeting_counts: iterable
+    @param engines: The engines to benchmark schedule generation with
+    @type engines: iterable
+    @param benchmarks: The names of the benchmarks to run, or None for all
+    @type benchmarks: iterable or None
+    @param repeat: The number of runs of each benchmark
+    @type repeat: int
+    @param seed: The seed for the first run of each benchmark
+    @type seed: int
+    @return: The results, with details of the Python interpreter
+    @rtype: dict
+    """
+    results = []
+    for (name, params, function, setup) in _cases(team_counts, meeting_counts,
+                                                  engines, seed):
+        if benchmarks is None or name in benchmarks:
+            result = dict(params, benchmark=name)
+            result.update(run_case(function, repeat, seed, setup))
+            results.append(result)
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'seed': seed,
+        'results': results,
+    }
+
+
+def _int_list(text):
+    """Parse a comma-separated list of integers."""
+    return [int(item) for item in text.split(',')]
+
+
+def main(args=None):
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(
+        prog='python -m competitions.scheduler.bench',
+        description='Benchmark the round-robin scheduler.')
+    parser.add_argument('--teams', type=_int_list, default=TEAM_COUNTS,
+                        help='comma-separated team counts')
+    parser.add_argument('--meetings', type=_int_list, default=MEETING_COUNTS,
+                        help='comma-separated meeting counts')
+    parser.add_argument('--engines', type=lambda text: text.split(','),
+                        default=RoundRobinScheduler.ENGINES,
+                        help='comma-separated schedule generation engines')
+    parser.add_argument('--benchmark', action='append', dest='benchmarks',
+                        help='a benchmark to run, which may be repeated '
+                             '(default: all)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='runs of each benchmark (default: 3)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed for the first run (default: 0)')
+    parser.add_argument('--output', help='file to write the JSON results to')
+    options = parser.parse_args(args)
+
+    for engine in options.engines:
+        RoundRobinScheduler._check_engine(engine)
+    report = run(options.teams, options.meetings, options.engines,
+                 options.benchmarks, options.repeat, options.seed)
+    text = json.dumps(report, indent=2, separators=(',', ': '), sort_keys=True)
+    if options.output:
+        with open(options.output, 'w') as output:
+            output.write(text + '\n')
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,170 @@
+# -*- coding: utf-8  -*-
+"""Caching of generated schedules."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import collections
+import json
+import sqlite3
+import sys
+
+from array import array
+
+
+def _to_bytes(values):
+    """Pack team indices as little-endian 16-bit integers."""
+    values = array('H', values)
+    if sys.byteorder == 'big':  # pragma: no cover
+        values.byteswap()
+    return values.tobytes() if hasattr(values, 'tobytes') else values.tostring()
+
+
+def _from_bytes(data):
+    """Unpack team indices packed by _to_bytes()."""
+    values = array('H')
+    if hasattr(values, 'frombytes'):
+        values.frombytes(bytes(data))
+    else:  # pragma: no cover
+        values.fromstring(str(data))
+    if sys.byteorder == 'big':  # pragma: no cover
+        values.byteswap()
+    return values
+
+
+class ScheduleCache(object):
+
+    """A cache of schedules between team indices.
+
+    Schedules are kept in memory, up to a maximum number of them, with the
+    least recently used schedule dropped first. They may also be stored in an
+    SQLite database file, which keeps every schedule and may be shared between
+    processes and runs.
+
+    Keys are tuples of numbers, strings and None, and each schedule is stored
+    with the indices of its home teams, as two arrays of team indices.
+    """
+
+    def __init__(self, maxsize=128, path=None):
+        """Constructor.
+
+        @param maxsize: The number of schedules to keep in memory
+        @type maxsize: int
+        @param path: The database file to store schedules in, or None to keep
+            them in memory only
+        @type path: str or None
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self._memory = collections.OrderedDict()
+        self._connection = None
+
+    def __getstate__(self):
+        """Leave out the schedules in memory and the database connection."""
+        return {'maxsize': self.maxsize, 'path': self.path}
+
+    def __setstate__(self, state):
+        """Restore a cache from its settings."""
+        self.__init__(**state)
+
+    def __len__(self):
+        """Get the number of schedules in memory."""
+        return len(self._memory)
+
+    @property
+    def _database(self):
+        """The database connection, opened when first needed."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            with self._connection:
+                self._connection.execute(
+                    'CREATE TABLE IF NOT EXISTS schedules '
+                    '(key TEXT PRIMARY KEY, homes BLOB, matches BLOB)')
+        return self._connection
+
+    @staticmethod
+    def _key_text(key):
+        """Get the text of a key for the database."""
+        return json.dumps(list(key))
+
+    def _remember(self, key, entry):
+        """Keep an entry in memory as the most recently used."""
+        self._memory.pop(key, None)
+        self._memory[key] = entry
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def get(self, key, match_count):
+        """Get a schedule from the cache.
+
+        @param key: The key of the schedule
+        @type key: tuple
+        @param match_count: The number of matches per round
+        @type match_count: int
+        @return: The indices of the home teams and the rounds of the schedule,
+            or None if the schedule is not cached
+        @rtype: tuple or None
+        """
+        entry = self._memory.get(key)
+        if entry is None and self.path is not None:
+            row = self._database.execute(
+                'SELECT homes, matches FROM schedules WHERE key = ?',
+                (self._key_text(key),)).fetchone()
+            if row:
+                entry = (_from_bytes(row[0]), _from_bytes(row[1]))
+        if entry is None:
+            return None
+        self._remember(key, entry)
+
+        (homes, matches) = entry
+        pairs = list(zip(matches[::2], matches[1::2]))
+        return (list(homes), [pairs[start:start + match_count]
+                              for start in range(0, len(pairs), match_count)])
+
+    def put(self, key, homes, rounds):
+        """Add a schedule to the cache.
+
+        @param key: The key of the schedule
+        @type key: tuple
+        @param homes: The indices of the home teams
+        @type homes: list
+        @param rounds: The rounds of the schedule, as pairs of team indices
+        @type rounds: list of lists of tuples
+        """
+        entry = (array('H', homes),
+                 array('H', [team for round in rounds
+                             for match in round for team in match]))
+        self._remember(key, entry)
+        if self.path is not None:
+            with self._database:
+                self._database.execute(
+                    'INSERT OR REPLACE INTO schedules VALUES (?, ?, ?)',
+                    (self._key_text(key), sqlite3.Binary(_to_bytes(entry[0])),
+                     sqlite3.Binary(_to_bytes(entry[1]))))
+
+    def clear(self):
+        """Remove all schedules from memory and from the database."""
+        self._memory.clear()
+        if self.path is not None:
+            with self._database:
+                self._database.execute('DELETE FROM schedules')
+
+    def close(self):
+        """Close the database connection, if it is open."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
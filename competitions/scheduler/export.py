@@ -0,0 +1,130 @@
+# -*- coding: utf-8  -*-
+"""Export of schedules as fixture feeds.
+
+Schedules are written as CSV or JSON Lines, one row for each match, with the
+number of the round and of the match slot within it, both counted from 1, the
+home and away teams, and whether the match is a bye against the blank
+placeholder. Rounds are taken one at a time from any iterable, such as
+iter_schedule(), and rows are written in batches, so memory use does not grow
+with the size of the schedule.
+"""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import json
+
+FIELDS = ('round', 'slot', 'home', 'away', 'bye')
+
+
+def _iter_rows(rounds, byes):
+    """Generate the rows of the matches of a schedule."""
+    for (number, round) in enumerate(rounds, 1):
+        for (slot, (home, away)) in enumerate(round, 1):
+            bye = home is None or away is None
+            if byes or not bye:
+                yield (number, slot, home, away, bye)
+
+
+def _write_lines(output, lines, buffer_size):
+    """Write lines in batches, returning the number written."""
+    buffer = []
+    count = 0
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= buffer_size:
+            output.write(''.join(buffer))
+            count += len(buffer)
+            del buffer[:]
+    if buffer:
+        output.write(''.join(buffer))
+        count += len(buffer)
+    return count
+
+
+def _csv_field(value):
+    """Format a value as a CSV field, quoting it if needed."""
+    text = '' if value is None else '{}'.format(value)
+    if any(char in text for char in ',"\r\n'):
+        return '"{}"'.format(text.replace('"', '""'))
+    return text
+
+
+def export_csv(rounds, output, header=True, byes=True, buffer_size=1024):
+    """Write a schedule as CSV.
+
+    Teams are written as text, and the blank placeholder as an empty field.
+    Fields are quoted when they contain commas, quotes or line breaks.
+
+    @param rounds: The rounds of the schedule
+    @type rounds: iterable of lists of tuples
+    @param output: The text file to write to
+    @type output: file
+    @param header: Whether to write a header row with the field names
+    @type header: bool
+    @param byes: Whether to write matches against the blank placeholder
+    @type byes: bool
+    @param buffer_size: The number of rows to write at a time
+    @type buffer_size: int
+    @return: The number of matches written
+    @rtype: int
+    """
+    if header:
+        output.write(','.join(FIELDS) + '\n')
+    teams = {}  # The field of each team, formatted once
+
+    def lines():
+        for (number, slot, home, away, bye) in _iter_rows(rounds, byes):
+            for team in (home, away):
+                if team not in teams:
+                    teams[team] = _csv_field(team)
+            yield '{},{},{},{},{}\n'.format(number, slot, teams[home],
+                                            teams[away], int(bye))
+
+    return _write_lines(output, lines(), buffer_size)
+
+
+def export_jsonl(rounds, output, byes=True, buffer_size=1024):
+    """Write a schedule as JSON Lines.
+
+    Each match is written as an object with the fields of a row. Teams that
+    are not JSON values are written as text, and the blank placeholder as
+    null.
+
+    @param rounds: The rounds of the schedule
+    @type rounds: iterable of lists of tuples
+    @param output: The text file to write to
+    @type output: file
+    @param byes: Whether to write matches against the blank placeholder
+    @type byes: bool
+    @param buffer_size: The number of rows to write at a time
+    @type buffer_size: int
+    @return: The number of matches written
+    @rtype: int
+    """
+    teams = {}  # The JSON of each team, encoded once
+
+    def lines():
+        for (number, slot, home, away, bye) in _iter_rows(rounds, byes):
+            for team in (home, away):
+                if team not in teams:
+                    teams[team] = json.dumps(team, default='{}'.format)
+            yield ('{{"round": {}, "slot": {}, "home": {}, "away": {}, '
+                   '"bye": {}}}\n').format(number, slot, teams[home],
+                                           teams[away], 'true' if bye else 'false')
+
+    return _write_lines(output, lines(), buffer_size)
@@ -0,0 +1,298 @@
+# -*- coding: utf-8  -*-
+"""Minimization of home and away breaks in schedules.
+
+A team has a break when it plays at home, or away, in two rounds in a row.
+Rounds in which a team has a bye, a match against the blank placeholder, do
+not count towards its breaks.
+
+Breaks are minimized by simulated annealing, starting from a valid schedule
+and making moves that keep it valid:
+
+- swapping two rounds,
+- flipping the venues of two matches between the same teams that are played
+  at each team's home once, and
+- swapping the matches of a cycle of teams between two rounds, so that each
+  of these teams plays its match of one round in the other.
+
+Only the breaks next to the rounds a move changes, for the teams it changes
+them for, are counted again after each move.
+"""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import division, unicode_literals
+
+import math
+import timeit
+
+from array import array
+
+from .scheduler import Scheduler
+
+
+def count_breaks(schedule, bye=None):
+    """Count the breaks in a schedule.
+
+    @param schedule: The rounds of the schedule
+    @type schedule: iterable of lists of tuples
+    @param bye: The team whose opponents have a bye, by default the blank
+        placeholder
+    @return: The number of breaks of all teams
+    @rtype: int
+    """
+    venues = {}  # The venue of each team's last match, if not a bye
+    breaks = 0
+    for round in schedule:
+        for (home, away) in round:
+            is_bye = home == bye or away == bye
+            for (team, venue) in ((home, True), (away, False)):
+                if is_bye:
+                    venue = None
+                elif venues.get(team) is venue:
+                    breaks += 1
+                venues[team] = venue
+    return breaks
+
+
+class _BreakSearch(object):
+
+    """A schedule between team indices with moves that keep it valid.
+
+    Rounds keep their places in the list of rounds, and the order in which
+    they are played is kept separately, so that swapping two rounds does not
+    move their matches. Transition i is from the round played i-th to the one
+    played after it.
+    """
+
+    def __init__(self, rounds, team_count, bye=None):
+        """Constructor.
+
+        @param rounds: The rounds, as lists of pairs of team indices, which
+            are changed in place
+        @type rounds: list of lists of tuples
+        @param team_count: The number of teams
+        @type team_count: int
+        @param bye: The index of the blank placeholder, if any
+        @type bye: int or None
+        """
+        self.rounds = rounds
+        self.team_count = team_count
+        self.match_count = team_count // 2
+        self.bye = bye
+        self.order = list(range(len(rounds)))  # The round played at each place
+        self.places = list(range(len(rounds)))  # The place of each round
+        self.slots = array('l', [0]) * (len(rounds) * team_count)
+        self.match_rounds = {}  # The numbers of the rounds of each match
+        for (number, round) in enumerate(rounds):
+            for (slot, match) in enumerate(round):
+                self.match_rounds.setdefault(match, []).append(number)
+                for team in match:
+                    self.slots[number * team_count + team] = slot
+
+    def _venue(self, team, number):
+        """Get whether a team is at home in a round, or None for a bye."""
+        (home, away) = self.rounds[number][self.slots[number * self.team_count + team]]
+        if home == self.bye or away == self.bye:
+            return None
+        return home == team
+
+    def count(self, teams, transitions):
+        """Count the breaks of teams at transitions between rounds."""
+        breaks = 0
+        order = self.order
+        for transition in transitions:
+            (before, after) = (order[transition], order[transition + 1])
+            for team in teams:
+                venue = self._venue(team, before)
+                if venue is not None and venue is self._venue(team, after):
+                    breaks += 1
+        return breaks
+
+    def total(self):
+        """Count all the breaks."""
+        return self.count(range(self.team_count), range(len(self.rounds) - 1))
+
+    def _transitions(self, *places):
+        """Get the transitions next to rounds at places."""
+        last = len(self.rounds) - 2
+        return set(transition for place in places
+                   for transition in (place - 1, place)
+                   if 0 <= transition <= last)
+
+    def propose_round_swap(self, rng):
+        """Propose swapping two rounds."""
+        (place, other) = rng.sample(range(len(self.rounds)), 2)
+        return (range(self.team_count), self._transitions(place, other),
+                ('rounds', place, other))
+
+    def propose_flip(self, rng):
+        """Propose flipping the venues of two matches between two teams."""
+        number = rng.randrange(len(self.rounds))
+        slot = rng.randrange(self.match_count)
+        (home, away) = self.rounds[number][slot]
+        if home == self.bye or away == self.bye:
+            return None
+        returns = self.match_rounds.get((away, home))
+        if not returns:
+            return None
+        other = rng.choice(returns)
+        other_slot = self.slots[other * self.team_count + home]
+        return ((home, away),
+                self._transitions(self.places[number], self.places[other]),
+                ('flip', number, slot, other, other_slot))
+
+    def propose_cycle(self, rng):
+        """Propose swapping a cycle of matches between two rounds."""
+        (place, other_place) = rng.sample(range(len(self.rounds)), 2)
+        (number, other) = (self.order[place], self.order[other_place])
+        (first, second) = (self.rounds[number], self.rounds[other])
+        slot = rng.randrange(self.match_count)
+        (cycle, other_cycle, teams) = ([], [], [])
+        start = first[slot][0]
+        team = start
+        while True:
+            cycle.append(slot)
+            opp = first[slot][1] if first[slot][0] == team else first[slot][0]
+            teams.extend((team, opp))
+            other_slot = self.slots[other * self.team_count + opp]
+            other_cycle.append(other_slot)
+            team = (second[other_slot][1] if second[other_slot][0] == opp
+                    else second[other_slot][0])
+            if team == start:
+                break
+            slot = self.slots[number * self.team_count + team]
+        return (teams, self._transitions(place, other_place),
+                ('cycle', number, other, cycle, other_cycle))
+
+    def apply(self, move):
+        """Make a move, or undo it, as each move undoes itself."""
+        kind = move[0]
+        if kind == 'rounds':
+            (place, other) = move[1:]
+            order = self.order
+            (order[place], order[other]) = (order[other], order[place])
+            (self.places[order[place]], self.places[order[other]]) = (place, other)
+        elif kind == 'flip':
+            (number, slot, other, other_slot) = move[1:]
+            (home, away) = self.rounds[number][slot]
+            self.rounds[number][slot] = (away, home)
+            self.rounds[other][other_slot] = (home, away)
+            self._move((home, away), number, other)
+            self._move((away, home), other, number)
+        else:
+            (number, other, cycle, other_cycle) = move[1:]
+            (first, second) = (self.rounds[number], self.rounds[other])
+            matches = [first[slot] for slot in cycle]
+            for (slot, other_slot) in zip(cycle, other_cycle):
+                first[slot] = second[other_slot]
+            for (other_slot, match) in zip(other_cycle, matches):
+                self._move(second[other_slot], other, number)
+                self._move(match, number, other)
+                second[other_slot] = match
+            for (round_number, round, slots) in ((number, first, cycle),
+                                                 (other, second, other_cycle)):
+                for slot in slots:
+                    for team in round[slot]:
+                        self.slots[round_number * self.team_count + team] = slot
+
+    def _move(self, match, number, other):
+        """Record that a match has moved from one round to another."""
+        numbers = self.match_rounds[match]
+        numbers[numbers.index(number)] = other
+
+    def played_rounds(self):
+        """Get the rounds in the order they are played."""
+        return [list(self.rounds[number]) for number in self.order]
+
+
+def minimize_breaks(schedule, time_limit=1.0, max_steps=None, rng=None,
+                    bye=None, temperature=1.0, final_temperature=0.05):
+    """Rearrange a schedule to have as few home and away breaks as possible.
+
+    The search starts from the schedule and stops when the time limit or the
+    number of steps runs out, or when there are no breaks left. Moves that add
+    breaks are accepted with a probability that falls as the search cools from
+    the starting temperature to the final one, and the schedule with the
+    fewest breaks found is returned. Every pair of teams meets as often as
+    before, with the same numbers of home and away matches for each team.
+
+    @param schedule: The schedule, which is not changed
+    @type schedule: list of lists of tuples, or Schedule
+    @param time_limit: The time to search for in seconds, or None for no limit
+    @type time_limit: float or None
+    @param max_steps: The number of moves to try, or None for no limit
+    @type max_steps: int or None
+    @param rng: The random number generator or seed to use, by default the
+        random module
+    @type rng: random.Random or int
+    @param bye: The team whose opponents have a bye, by default the blank
+        placeholder
+    @param temperature: The starting temperature
+    @type temperature: float
+    @param final_temperature: The temperature at the end of the search
+    @type final_temperature: float
+    @return: The rearranged rounds and their number of breaks
+    @rtype: tuple
+    @raise ValueError: Neither the time nor the steps are limited
+    """
+    if time_limit is None and max_steps is None:
+        raise ValueError('Either the time or the steps must be limited.')
+    rng = Scheduler.get_rng(rng)
+    rounds = [list(round) for round in schedule]
+    if len(rounds) < 2:
+        return (rounds, 0)
+    teams = [team for match in rounds[0] for team in match]
+    indices = dict((team, index) for (index, team) in enumerate(teams))
+    search = _BreakSearch([[(indices[home], indices[away]) for (home, away) in round]
+                           for round in rounds], len(teams), indices.get(bye))
+    proposals = (search.propose_round_swap, search.propose_flip,
+                 search.propose_flip, search.propose_cycle, search.propose_cycle)
+
+    breaks = best = search.total()
+    best_rounds = None  # The best schedule, saved when the search leaves it
+    start = timeit.default_timer()
+    step = 0
+    progress = 0.0
+    while best > 0 and progress < 1:
+        if max_steps is not None:
+            progress = step / max_steps
+        if time_limit is not None and step % 64 == 0:
+            progress = max(progress, (timeit.default_timer() - start) / time_limit)
+        step += 1
+        proposal = rng.choice(proposals)(rng)
+        if proposal is None:
+            continue
+        (move_teams, transitions, move) = proposal
+        before = search.count(move_teams, transitions)
+        search.apply(move)
+        delta = search.count(move_teams, transitions) - before
+        heat = temperature * (final_temperature / temperature) ** progress
+        if delta <= 0 or rng.random() < math.exp(-delta / heat):
+            if delta > 0 and breaks == best and best_rounds is None:
+                search.apply(move)
+                best_rounds = search.played_rounds()
+                search.apply(move)
+            breaks += delta
+            if breaks < best:
+                best = breaks
+                best_rounds = None
+        else:
+            search.apply(move)
+    if best_rounds is None:
+        best_rounds = search.played_rounds()
+
+    return ([[(teams[home], teams[away]) for (home, away) in round]
+             for round in best_rounds], best)
@@ -0,0 +1,226 @@
+# -*- coding: utf-8  -*-
+"""Schedule generation in parallel worker processes.
+
+Batches of schedules are generated in worker processes managed with
+concurrent.futures, which is part of the standard library from Python 3.2, and
+is available for Python 2 from the futures package. When it is not installed,
+futures is None and schedules are generated one after another in the calling
+process. Races use a multiprocessing pool, so that the workers still making
+losing attempts can be terminated.
+"""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import multiprocessing
+import random
+
+from . import ScheduleGenerationFailed
+
+try:
+    from concurrent import futures
+except ImportError:  # pragma: no cover
+    futures = None
+
+# The seconds between checks for finished attempts of a race
+POLL_INTERVAL = 0.01
+
+
+def generate_seeded_schedule(scheduler, seed, kwargs):
+    """Generate a schedule from a seed.
+
+    @param scheduler: The scheduler to generate the schedule with
+    @type scheduler: Scheduler
+    @param seed: The seed for the random number generator
+    @type seed: int
+    @param kwargs: Arguments passed to generate_schedule()
+    @type kwargs: dict
+    @return: The seed and the generated schedule
+    @rtype: tuple
+    """
+    return (seed, scheduler.generate_schedule(rng=seed, **kwargs))
+
+
+def schedule_seeds(count, seed=None):
+    """Get the seeds for a batch of schedules.
+
+    @param count: The number of seeds
+    @type count: int
+    @param seed: The seed from which the seeds are drawn, or None to draw them
+        from the operating system's source of randomness
+    @type seed: int or None
+    @rtype: list of ints
+    """
+    source = random.Random(seed)
+    return [source.getrandbits(32) for __ in range(count)]
+
+
+def generate_schedules(scheduler, count, workers=None, seed=None, **kwargs):
+    """Generate many schedules in worker processes.
+
+    Each schedule is generated from its own seed, so the schedules do not
+    depend on the number of workers or on which worker generates them, and any
+    of them may be generated again by passing its seed to generate_schedule()
+    with the same arguments.
+
+    The scheduler and its teams are sent to the worker processes, so they must
+    be picklable. Changes the workers make to the scheduler, such as to its
+    home teams, are not seen by the calling process. At most two schedules
+    per worker are submitted at a time, and each is dropped once it has been
+    yielded, so large batches do not take up more memory.
+
+    @param scheduler: The scheduler to generate the schedules with
+    @type scheduler: Scheduler
+    @param count: The number of schedules to generate
+    @type count: int
+    @param workers: The number of worker processes, or None for one per
+        processor. With a single worker, or if concurrent.futures is not
+        installed, the schedules are generated in the calling process.
+    @type workers: int or None
+    @param seed: The seed from which the seed of each schedule is drawn, or
+        None to draw them from the operating system's source of randomness
+    @type seed: int or None
+    @param kwargs: Arguments passed to generate_schedule()
+    @return: Pairs of the seed and the schedule, in order of completion
+    @rtype: generator of tuples
+    @raise ScheduleGenerationFailed: A schedule could not be generated
+    """
+    seeds = schedule_seeds(count, seed)
+    if futures is None or workers == 1:
+        for schedule_seed in seeds:
+            yield generate_seeded_schedule(scheduler, schedule_seed, kwargs)
+        return
+
+    workers = workers or multiprocessing.cpu_count()
+    executor = futures.ProcessPoolExecutor(workers)
+    seeds = iter(seeds)
+    running = set()  # At most two jobs per worker, so that none waits for work
+    try:
+        while True:
+            for schedule_seed in seeds:
+                running.add(executor.submit(generate_seeded_schedule, scheduler,
+                                            schedule_seed, kwargs))
+                if len(running) == 2 * workers:
+                    break
+            if not running:
+                break
+            (done, running) = futures.wait(
+                running, return_when=futures.FIRST_COMPLETED)
+            for job in done:
+                yield job.result()
+    finally:
+        for job in running:
+            job.cancel()
+        executor.shutdown()
+
+
+def _wait_first(jobs):
+    """Wait for the first of the jobs of a pool to finish.
+
+    Finished jobs are polled for, as Python 2 pools have no callback for
+    failed jobs. A job also fails, and its error is raised by its get(), when
+    its arguments cannot be pickled to send them to a worker.
+
+    @param jobs: The jobs, with any other value
+    @type jobs: list of tuples of AsyncResult and any value
+    @return: A finished job with its value
+    @rtype: tuple
+    """
+    while True:
+        for entry in jobs:
+            if entry[0].ready():
+                return entry
+        jobs[0][0].wait(POLL_INTERVAL)
+
+
+def race_schedule(scheduler, workers, seed, retry, **kwargs):
+    """Generate a schedule by racing attempts in worker processes.
+
+    Each attempt allowed by the retry policy is made on its own from its own
+    seed and with its own single-attempt policy, with one attempt running in
+    each worker process at a time. Once an attempt succeeds, the worker
+    processes are terminated, stopping the attempts that are still running.
+
+    The schedule is generated again by passing the seed and the policy
+    returned with it to generate_schedule(), with the same arguments.
+
+    @param scheduler: The scheduler to generate the schedule with
+    @type scheduler: Scheduler
+    @param workers: The number of worker processes, or None for one per
+        processor. With a single worker, the attempts are made in turn in the
+        calling process.
+    @type workers: int or None
+    @param seed: The seed from which the seed of each attempt is drawn, or
+        None to draw them from the operating system's source of randomness
+    @type seed: int or None
+    @param retry: The retry policy for the attempts
+    @type retry: RetryPolicy
+    @param kwargs: Arguments passed to generate_schedule()
+    @return: The seed, the retry policy and the schedule of the first
+        successful attempt
+    @rtype: tuple
+    @raise ScheduleGenerationFailed: Every attempt failed
+    """
+    source = random.Random(seed)
+    policies = retry.split()
+    attempts = 0
+    max_rounds = 0
+
+    def attempt(policy):
+        return (source.getrandbits(32), dict(kwargs, retry=policy))
+
+    if workers == 1:
+        for policy in policies:
+            attempts += 1
+            (attempt_seed, attempt_kwargs) = attempt(policy)
+            try:
+                (attempt_seed, schedule) = generate_seeded_schedule(
+                    scheduler, attempt_seed, attempt_kwargs)
+            except ScheduleGenerationFailed as error:
+                max_rounds = max(max_rounds, error.max_rounds)
+                continue
+            return (attempt_seed, policy, schedule)
+    else:
+        workers = workers or multiprocessing.cpu_count()
+        pool = multiprocessing.Pool(workers)
+        running = []  # The jobs of the attempts in flight, with their policies
+        try:
+            while True:
+                for policy in policies:
+                    running.append((pool.apply_async(
+                        generate_seeded_schedule,
+                        (scheduler,) + attempt(policy)), policy))
+                    if len(running) == workers:
+                        break
+                if not running:
+                    break
+                (job, policy) = _wait_first(running)
+                running.remove((job, policy))
+                attempts += 1
+                try:
+                    (attempt_seed, schedule) = job.get()
+                except ScheduleGenerationFailed as error:
+                    max_rounds = max(max_rounds, error.max_rounds)
+                    continue
+                return (attempt_seed, policy, schedule)
+        finally:
+            pool.terminate()
+            pool.join()
+
+    raise ScheduleGenerationFailed(
+        'Schedule generation failed after {} attempts.'.format(attempts),
+        attempts=attempts, max_rounds=max_rounds)
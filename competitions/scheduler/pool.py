@@ -0,0 +1,158 @@
+# -*- coding: utf-8  -*-
+"""Match pools for schedule generation."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import random
+
+
+class MatchPool(object):
+
+    """A multiset of matches waiting to be scheduled.
+
+    Matches are kept in a list, along with the positions of each distinct
+    match in that list. Removing a match moves the last match into its place,
+    so that picking, adding and removing matches all take constant time.
+
+    Every change is logged, so the pool can be rolled back to an earlier
+    snapshot in time proportional to the number of changes since then.
+    """
+
+    def __init__(self, matches=()):
+        """Constructor.
+
+        @param matches: The initial matches
+        @type matches: iterable
+        """
+        self._matches = []
+        self._positions = {}
+        self._log = []
+        for match in matches:
+            self._add(match)
+        del self._log[:]
+
+    def __len__(self):
+        """Get the number of matches in the pool."""
+        return len(self._matches)
+
+    def __iter__(self):
+        """Iterate over the matches in the pool in no particular order."""
+        return iter(list(self._matches))
+
+    def __contains__(self, match):
+        """Check whether a match is in the pool."""
+        return bool(self._positions.get(match))
+
+    def count(self, match):
+        """Get the number of copies of a match in the pool."""
+        return len(self._positions.get(match, ()))
+
+    def _add(self, match):
+        """Add a match to the end of the list."""
+        self._positions.setdefault(match, set()).add(len(self._matches))
+        self._matches.append(match)
+        self._log.append((True, match))
+
+    def add(self, match):
+        """Add a match to the pool.
+
+        @param match: The match to add
+        @type match: tuple
+        """
+        self._add(match)
+
+    def remove(self, match):
+        """Remove a copy of a match from the pool.
+
+        @param match: The match to remove
+        @type match: tuple
+        @raise KeyError: The match is not in the pool
+        """
+        positions = self._positions.get(match)
+        if not positions:
+            raise KeyError(match)
+        position = positions.pop()
+        last = self._matches.pop()
+        if position != len(self._matches):  # Fill the hole with the last match
+            self._positions[last].remove(len(self._matches))
+            self._positions[last].add(position)
+            self._matches[position] = last
+        self._log.append((False, match))
+
+    def pick(self, rng=random):
+        """Get a random match from the pool without removing it.
+
+        @param rng: The random number generator to use
+        @type rng: random.Random
+        @rtype: tuple
+        @raise IndexError: The pool is empty
+        """
+        if not self._matches:
+            raise IndexError('pick from empty pool')
+        return self._matches[rng.randrange(len(self._matches))]
+
+    def _swap(self, first, second):
+        """Swap two matches in the list."""
+        matches = self._matches
+        (one, other) = (matches[first], matches[second])
+        if one != other:
+            self._positions[one].remove(first)
+            self._positions[one].add(second)
+            self._positions[other].remove(second)
+            self._positions[other].add(first)
+            (matches[first], matches[second]) = (other, one)
+
+    def iter_random(self, rng=random):
+        """Iterate over the matches in the pool in random order.
+
+        The order is drawn one match at a time, by moving a random match that
+        has not been visited to the end of the unvisited part of the list, so
+        stopping early costs nothing for the matches not visited. The pool must
+        not be changed until the iteration is finished or abandoned.
+
+        @param rng: The random number generator to use
+        @type rng: random.Random
+        @rtype: generator of tuples
+        """
+        unvisited = len(self._matches)
+        while unvisited:
+            self._swap(rng.randrange(unvisited), unvisited - 1)
+            unvisited -= 1
+            yield self._matches[unvisited]
+
+    def snapshot(self):
+        """Get a token for the current contents of the pool.
+
+        @return: A token for rollback()
+        @rtype: int
+        """
+        return len(self._log)
+
+    def rollback(self, snapshot):
+        """Undo all changes made to the pool since a snapshot.
+
+        @param snapshot: A token from snapshot()
+        @type snapshot: int
+        """
+        changes = self._log[snapshot:]
+        for (added, match) in reversed(changes):
+            if added:
+                self.remove(match)
+            else:
+                self._add(match)
+        del self._log[snapshot:]
@@ -0,0 +1,171 @@
+# -*- coding: utf-8  -*-
+"""Repair of schedules after matches are postponed.
+
+Matches are moved out of their rounds by swapping them with matches of
+another round. Between any two rounds, the matches of the teams form cycles
+alternating between the rounds, and swapping the matches of one cycle leaves
+both rounds complete. The cycle through a postponed match is swapped, which
+changes the rounds of as few matches as possible, and the rest of the schedule
+is left as it was. Every team still plays once in each round, every pair of
+teams meets as often as before, and home and away matches are unchanged.
+"""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from . import ScheduleGenerationFailed
+
+
+class _Repair(object):
+
+    """The state of a schedule being repaired."""
+
+    def __init__(self, rounds, frozen, forbidden):
+        """Constructor.
+
+        @param rounds: The rounds, which are changed in place
+        @type rounds: list of lists of tuples
+        @param frozen: The round numbers and matches that may not be moved
+        @type frozen: set of tuples
+        @param forbidden: The round numbers and pairs of teams that may not
+            meet in those rounds
+        @type forbidden: set of tuples of an int and a frozenset
+        """
+        self.rounds = rounds
+        self.frozen = frozen
+        self.forbidden = forbidden
+        self._slots = {}  # The slot of each team in each round, when needed
+
+    def slots(self, number):
+        """Get the slot of each team's match in a round."""
+        if number not in self._slots:
+            self._slots[number] = dict(
+                (team, slot) for (slot, match) in enumerate(self.rounds[number])
+                for team in match)
+        return self._slots[number]
+
+    def cycle(self, number, other, slot):
+        """Find the cycle of matches between two rounds through a match.
+
+        @return: The slots of the cycle's matches in both rounds, or None if
+            they cannot be swapped
+        @rtype: tuple of lists, or None
+        """
+        (first, second) = (self.rounds[number], self.rounds[other])
+        (first_slots, second_slots) = (self.slots(number), self.slots(other))
+        (cycle, other_cycle) = ([], [])
+        start = first[slot][0]
+        team = start
+        while True:
+            cycle.append(slot)
+            opp = first[slot][1] if first[slot][0] == team else first[slot][0]
+            other_slot = second_slots[opp]
+            other_cycle.append(other_slot)
+            team = (second[other_slot][1] if second[other_slot][0] == opp
+                    else second[other_slot][0])
+            if team == start:
+                break
+            slot = first_slots[team]
+        for (source, target, slots) in ((number, other, cycle),
+                                        (other, number, other_cycle)):
+            for match in (self.rounds[source][slot] for slot in slots):
+                if ((source, match) in self.frozen or
+                        (target, frozenset(match)) in self.forbidden):
+                    return None
+        return (cycle, other_cycle)
+
+    def swap(self, number, other, cycles):
+        """Swap the matches of a cycle between two rounds."""
+        (first, second) = (self.rounds[number], self.rounds[other])
+        (cycle, other_cycle) = cycles
+        matches = [first[slot] for slot in cycle]
+        for (slot, other_slot) in zip(cycle, other_cycle):
+            first[slot] = second[other_slot]
+        for (other_slot, match) in zip(other_cycle, matches):
+            second[other_slot] = match
+        self._slots.pop(number, None)
+        self._slots.pop(other, None)
+
+
+def repair_schedule(schedule, disrupted, frozen_rounds=(), frozen_matches=(),
+                    rounds=None):
+    """Move disrupted matches out of their rounds with as few changes as possible.
+
+    Each disrupted match is moved to another round by swapping the cycle of
+    matches through it with that round, choosing the round for which the
+    fewest matches change, and then the nearest round. Matches in frozen
+    rounds and frozen matches are never moved, and the teams of disrupted
+    matches never meet again in the rounds they were moved out of, neither in
+    the same match nor with home and away reversed. Each move only looks at the
+    rounds it may move a match to.
+
+    Matches are given with the numbers of their rounds, counted from 0, as the
+    same match may be played more than once in a season. A whole round is
+    moved by disrupting all of its matches.
+
+    @param schedule: The schedule, which is not changed
+    @type schedule: list of lists of tuples, or Schedule
+    @param disrupted: The round numbers and matches to move
+    @type disrupted: iterable of tuples
+    @param frozen_rounds: The numbers of the rounds that may not change
+    @type frozen_rounds: iterable of ints
+    @param frozen_matches: The round numbers and matches that may not move
+    @type frozen_matches: iterable of tuples
+    @param rounds: The numbers of the rounds disrupted matches may be moved
+        to, by default all rounds
+    @type rounds: iterable of ints or None
+    @return: The repaired schedule
+    @rtype: list of lists of tuples
+    @raise ValueError: A disrupted match is not in its round, or is frozen
+    @raise ScheduleGenerationFailed: A disrupted match cannot be moved without
+        moving a frozen match
+    """
+    repaired = [list(round) for round in schedule]
+    frozen_rounds = set(frozen_rounds)
+    disrupted = [(number, tuple(match)) for (number, match) in disrupted]
+    frozen = set((number, tuple(match)) for (number, match) in frozen_matches)
+    frozen.update((number, match) for number in frozen_rounds
+                  for match in repaired[number])
+    targets = (range(len(repaired)) if rounds is None else sorted(set(rounds)))
+    targets = [number for number in targets if number not in frozen_rounds]
+
+    for (number, match) in disrupted:
+        if match not in repaired[number]:
+            raise ValueError('Match {!r} is not in round {}.'.format(match, number))
+        if (number, match) in frozen:
+            raise ValueError('Match {!r} in round {} is frozen.'.format(match, number))
+    repair = _Repair(repaired, frozen, set((number, frozenset(match))
+                                           for (number, match) in disrupted))
+
+    for (number, match) in disrupted:
+        if match not in repaired[number]:  # Already moved with another match
+            continue
+        slot = repaired[number].index(match)
+        best = None
+        for other in targets:
+            if other == number:
+                continue
+            cycles = repair.cycle(number, other, slot)
+            if cycles is not None:
+                cost = (len(cycles[0]), abs(other - number), other)
+                if best is None or cost < best[0]:
+                    best = (cost, other, cycles)
+        if best is None:
+            raise ScheduleGenerationFailed(
+                'Match {!r} cannot be moved out of round {}.'.format(match, number))
+        repair.swap(number, best[1], best[2])
+    return repaired
@@ -18,24 +18,68 @@
 
 from __future__ import print_function, unicode_literals
 
-import copy
+import itertools
+import numbers
 import random
+import sys
 
-from . import NoMatchFound, ScheduleGenerationFailed
-from .scheduler import Scheduler
+from array import array
+
+from . import NoMatchFound, ScheduleGenerationFailed, parallel, vectorized
+from .backtrack import BacktrackingRoundBuilder
+from .pool import MatchPool
+from .schedule import Schedule
+from .scheduler import ObserverGroup, RetryPolicy, Scheduler
+from .templates import default_library
 
 
 class RoundRobinScheduler(Scheduler):
 
-    """A standard round-robin scheduler."""
+    """A standard round-robin scheduler.
+
+    Schedules can be generated by one of several engines:
+
+    - C{'random'} (the default) builds each round from a pool of matches in
+      random order, restarting the season if it reaches a dead end.
+    - C{'circle'} uses the circle method (Berger tables) to construct a valid
+      schedule in a single pass, with team labels and round order randomized.
+    - C{'backtrack'} builds rounds by depth-first search, replacing earlier
+      rounds when the season reaches a dead end instead of restarting it.
+    - C{'matching'} is the circle method with a fresh random labelling of
+      the teams for each meeting, so that meetings are not paired alike.
+    - C{'template'} follows single round-robin templates from a template
+      library, with team labels, round order and home teams randomized.
+    """
+
+    ENGINES = ('random', 'circle', 'backtrack', 'matching', 'template')
+    MATRIX_BACKENDS = ('python', 'numpy')
 
-    def __init__(self, teams, meetings=0):
+    def __init__(self, teams, meetings=0, engine='random', retry=None,
+                 matrix_backend='python', cache=None, template_library=None,
+                 observer=None):
         """Constructor.
 
         @param teams: A list of teams or the number of teams
         @type teams: list or int
         @param meetings: The number of times teams meet each other
         @type meetings: int
+        @param engine: The default schedule generation engine
+        @type engine: str
+        @param retry: The default policy for retrying failed generation
+        @type retry: RetryPolicy
+        @param matrix_backend: The backend for matrix generation, either
+            'python' or 'numpy', which falls back to 'python' if NumPy is not
+            installed. The NumPy backend only generates rotational matrices,
+            a much narrower family than the random trails of the Python
+            backend, so the choice changes the schedules as well as the speed.
+        @type matrix_backend: str
+        @param cache: The cache for schedules generated from seeds
+        @type cache: ScheduleCache
+        @param template_library: The templates for the template engine, by
+            default those of templates.default_library
+        @type template_library: TemplateLibrary
+        @param observer: The observer to tell about each phase of generation
+        @type observer: GenerationObserver
         """
         if not isinstance(teams, list):
             teams = list(range(1, teams + 1))
@@ -43,6 +87,21 @@ class RoundRobinScheduler(Scheduler):
             teams.append(None)
         self.teams = teams
         self.meetings = meetings
+        self.engine = self._check_engine(engine)
+        self.retry = retry or RetryPolicy()
+        if matrix_backend not in self.MATRIX_BACKENDS:
+            raise ValueError('Unknown matrix backend: {!r}'.format(matrix_backend))
+        self.matrix_backend = matrix_backend
+        self.cache = cache
+        self.template_library = template_library or default_library
+        self.observer = observer
+
+    @classmethod
+    def _check_engine(cls, engine):
+        """Check that an engine name is supported."""
+        if engine not in cls.ENGINES:
+            raise ValueError('Unknown schedule generation engine: {!r}'.format(engine))
+        return engine
 
     @property
     def match_count(self):
@@ -62,7 +121,7 @@ class RoundRobinScheduler(Scheduler):
         else:
             return ()
 
-    def _generate_home_teams(self, home_teams=None):
+    def _generate_home_teams(self, home_teams=None, rng=random):
         """Generate the list of home teams for a matrix."""
         team_count = len(self.teams)  # Number of teams
         odd_team_count = None in self.teams  # Whether there is a blank placeholder
@@ -70,11 +129,11 @@ class RoundRobinScheduler(Scheduler):
         if not home_teams:  # Randomly select home teams
             if odd_team_count:
                 home_count = (team_count - 1) // 2
-                homes = random.sample(range(team_count - 1), home_count)
+                homes = rng.sample(range(team_count - 1), home_count)
                 homes.append(team_count - 1)  # Spacer is always home
             else:
                 home_count = team_count // 2
-                homes = random.sample(range(team_count), home_count)
+                homes = rng.sample(range(team_count), home_count)
             self._home_teams = [self.teams[i] for i in homes]
         else:  # if home_teams. Use provided teams.
             self._home_teams = home_teams
@@ -82,125 +141,724 @@ class RoundRobinScheduler(Scheduler):
 
         return homes
 
-    def generate_matrix(self, home_teams=None):
-        """Generate a schedule matrix for odd meeting counts."""
+    @property
+    def _use_numpy(self):
+        """Whether matrices are generated with NumPy."""
+        return self.matrix_backend == 'numpy' and vectorized.numpy is not None
+
+    def _generate_hub(self, rng=random):
+        """Choose the team whose matches are oriented by home team status.
+
+        This is the blank placeholder if there is one, so that the extra home
+        match of each home team is its bye.
+        """
+        if None in self.teams:
+            return len(self.teams) - 1
+        return rng.randrange(len(self.teams))
+
+    def generate_matrix_array(self, home_teams=None, rng=None):
+        """Generate a schedule matrix for odd meeting counts with NumPy.
+
+        Unlike generate_matrix(), which orients matches along random trails,
+        every matrix is rotational: apart from the hub, the teams sit around
+        a circle in random order, and each is at home to the half of the
+        circle following it. Only the order around the circle, the hub and
+        the home teams are random.
+
+        @param rng: The random number generator or seed to use, by default the
+            random module
+        @type rng: random.Random or int
+        @return: A matrix of 1 where the row team is at home to the column team,
+            0 where it is away, and -1 on the diagonal
+        @rtype: numpy.ndarray of int8
+        @raise ImportError: NumPy is not installed
+        @raise ValueError: Not exactly half of the teams are home teams
+        """
+        vectorized._require_numpy()
+        rng = self.get_rng(rng)
+        homes = self._generate_home_teams(home_teams, rng)
+        self._check_home_count(homes)
+        return vectorized.generate_matrix_array(len(self.teams), homes,
+                                                self._generate_hub(rng), rng)
+
+    def _generate_odd_matrix(self, home_teams=None, rng=random, observer=None):
+        """Generate a matrix for odd meeting counts with the chosen backend.
+
+        This is the match generation phase of the constructive engines, so
+        observers are told about the matches of the whole season, also when
+        the meeting count is even and no matrix is needed.
+
+        With NumPy, matches are marked 1 or 0 instead of True or False.
+
+        @return: The matrix, or None for even meeting counts
+        """
+        if observer is not None:
+            observer.on_matches_started()
+        matrix = None
+        if self.meetings % 2 == 1:
+            if self._use_numpy:
+                matrix = self.generate_matrix_array(home_teams, rng).tolist()
+            else:
+                matrix = self.generate_matrix(home_teams, rng)
+            if observer is not None:
+                observer.on_matrix_generated(matrix)
+        if observer is not None:
+            observer.on_matches_generated(self.match_count * self.round_count)
+        return matrix
+
+    def _check_home_count(self, homes):
+        """Check that half of the teams are home teams."""
+        if len(set(homes)) != len(self.teams) // 2:
+            raise ValueError('Exactly half of the teams must be home teams.')
+
+    def generate_matrix(self, home_teams=None, rng=None):
+        """Generate a schedule matrix for odd meeting counts.
+
+        One team, the hub, is set aside. The other teams, of which there are
+        an odd number, each have an even number of matches between them, so
+        these matches can be split into closed trails, which are found by
+        walking from team to team at random. Playing each match at the home
+        of the team the trail leaves from gives each of these teams the same
+        number of home and away matches. Matches against the hub are then
+        played at the homes of the home teams, giving them their extra home
+        match.
+
+        @param rng: The random number generator or seed to use, by default the
+            random module
+        @type rng: random.Random or int
+        @raise ValueError: Not exactly half of the teams are home teams
+        """
+        rng = self.get_rng(rng)
+        if self._use_numpy:
+            return vectorized.matrix_to_list(self.generate_matrix_array(home_teams, rng))
         team_count = len(self.teams)  # Number of teams
-        home_at_home = team_count // 2  # "Home" teams have ceiling(half) of their matches at home
-        away_at_home = (team_count - 1) // 2  # "Away" teams have floor(half) at home
-        odd_team_count = None in self.teams  # Whether there is a blank placeholder
-        homes = self._generate_home_teams(home_teams)
+        homes = self._generate_home_teams(home_teams, rng)
+        self._check_home_count(homes)
+        homes = set(homes)
+        hub = self._generate_hub(rng)
+        others = [team for team in range(team_count) if team != hub]
         matrix = [[None] * team_count for __ in range(team_count)]
-        for i in range(team_count - 1):
-            home_team = i in homes  # Whether the team is a home team
-            home_count = (away_at_home
-                          if not home_team or odd_team_count else home_at_home)
-            home_count -= matrix[i].count(True)  # Check previously assigned match pairings
-            try:
-                if odd_team_count:
-                    home_opps = random.sample(list(range(i + 1, team_count - 1)),
-                                              home_count)
-                    if home_team:
-                        home_opps.append(team_count - 1)
-                else:
-                    home_opps = random.sample(list(range(i + 1, team_count)),
-                                              home_count)
-                for opp in range(i + 1, team_count):
-                    is_home = opp in home_opps
-                    matrix[i][opp] = is_home
-                    matrix[opp][i] = not is_home
-            except ValueError:  # Recurse
-                return self.generate_matrix(home_teams=home_teams)
+        for team in others:
+            matrix[team][hub] = team in homes
+            matrix[hub][team] = team not in homes
+        self._orient_trails(matrix, others, rng)
         return matrix
 
-    def _generate_even_matches(self, evens):
-        """Generate a list of matches for even meeting counts."""
+    @staticmethod
+    def _orient_trails(matrix, teams, rng=random):
+        """Orient the matches between teams along random closed trails.
+
+        Each team must have an even number of opponents among the teams. A
+        trail can then only get stuck at the team it started from.
+        """
+        opponents = {}
+        for team in teams:
+            opps = [opp for opp in teams if opp != team]
+            rng.shuffle(opps)
+            opponents[team] = opps
+        for team in teams:
+            while True:
+                opps = opponents[team]
+                while opps and matrix[team][opps[-1]] is not None:  # Played
+                    opps.pop()
+                if not opps:
+                    break
+                opp = opps.pop()
+                matrix[team][opp] = True
+                matrix[opp][team] = False
+                team = opp
+
+    def _generate_even_index_matches(self, evens):
+        """Generate a list of index matches for even meeting counts."""
+        team_count = len(self.teams)
         return [(team, opp)
-                for team in self.teams
-                for opp in self.teams
+                for team in range(team_count)
+                for opp in range(team_count)
                 if team != opp] * evens
 
-    def _generate_odd_matches(self, home_teams=None):
-        """Generate a list of matches for odd meeting counts."""
-        matrix = self.generate_matrix(home_teams=home_teams)
+    def _generate_odd_index_matches(self, home_teams=None, rng=random,
+                                    observer=None):
+        """Generate a list of index matches for odd meeting counts."""
+        if self._use_numpy:
+            matrix = self.generate_matrix_array(home_teams, rng)
+            if observer is not None:
+                observer.on_matrix_generated(matrix)
+            return vectorized.matrix_index_matches(matrix)
+        matrix = self.generate_matrix(home_teams, rng)
+        if observer is not None:
+            observer.on_matrix_generated(matrix)
         matches = []
         for team_idx in range(len(self.teams)):
             for opp_idx in range(team_idx + 1, len(self.teams)):
                 if matrix[team_idx][opp_idx]:
-                    matches.append((self.teams[team_idx],
-                                    self.teams[opp_idx]))
+                    matches.append((team_idx, opp_idx))
                 else:
-                    matches.append((self.teams[opp_idx],
-                                    self.teams[team_idx]))
+                    matches.append((opp_idx, team_idx))
         return matches
 
-    def generate_matches(self, home_teams=None):
-        """Generate the matches for the season.
-
-        @return: The matches to schedule
-        @rtype: list
-        """
+    def _generate_index_matches(self, home_teams=None, rng=random,
+                                observer=None):
+        """Generate the matches for the season as pairs of team indices."""
         is_odd = self.meetings % 2 == 1
         evens = self.meetings // 2
+        if observer is not None:
+            observer.on_matches_started()
 
-        matches = self._generate_even_matches(evens) if evens > 0 else []
+        matches = self._generate_even_index_matches(evens) if evens > 0 else []
         if is_odd:
-            matches.extend(self._generate_odd_matches(home_teams))
+            matches.extend(self._generate_odd_index_matches(home_teams, rng,
+                                                            observer))
 
+        if observer is not None:
+            observer.on_matches_generated(len(matches))
         return matches
 
-    def generate_round(self, matches):
-        """Generate a round.
+    def generate_index_matches(self, home_teams=None, rng=None):
+        """Generate the matches for the season in compact index form.
 
-        @param matches: The generated matches
-        @type matches: list
-        @return: The generated round
+        Teams are given by their indices in the teams attribute.
+
+        @param rng: The random number generator or seed to use, by default the
+            random module
+        @type rng: random.Random or int
+        @return: The home and away team indices of the matches to schedule
+        @rtype: tuple of two arrays
+        """
+        matches = self._generate_index_matches(home_teams, self.get_rng(rng))
+        return (array('H', [home for (home, away) in matches]),
+                array('H', [away for (home, away) in matches]))
+
+    def _team_matches(self, matches):
+        """Convert index matches to matches between teams."""
+        teams = self.teams
+        return [(teams[home], teams[away]) for (home, away) in matches]
+
+    def _team_rounds(self, rounds):
+        """Convert rounds of index matches to rounds of matches between teams."""
+        return [self._team_matches(round) for round in rounds]
+
+    def generate_matches(self, home_teams=None, rng=None):
+        """Generate the matches for the season.
+
+        @param rng: The random number generator or seed to use, by default the
+            random module
+        @type rng: random.Random or int
+        @return: The matches to schedule
         @rtype: list
         """
+        return self._team_matches(
+            self._generate_index_matches(home_teams, self.get_rng(rng)))
+
+    def _generate_round(self, pool, masks, rng=random):
+        """Generate a round from a pool, using team bitmasks."""
+        rest = pool.iter_random(rng)
+        used = 0  # The teams in the round so far
         round = []
         try:
-            random.shuffle(matches)
-            round.append(matches.pop(0))
-            poss = copy.copy(matches)
-            for __ in range(1, self.match_count):
-                match = Scheduler.find_unique_match(round, poss)
+            for __ in range(self.match_count):
+                (match, mask) = Scheduler.find_unique_match_mask(used, rest, masks)
+                used |= mask
                 round.append(match)
-                matches.remove(match)
-            return round
         except NoMatchFound:
-            matches.extend(round)
             return None
+        finally:
+            rest.close()
+        for match in round:
+            pool.remove(match)
+        return round
+
+    def generate_round(self, matches, rng=None):
+        """Generate a round.
+
+        The matches in the round are removed from the pool. If no round could
+        be generated, the pool is left unchanged.
 
-    def _generate_schedule_round(self, matches):
-        """Fully generate a round for a schedule."""
-        for ___ in range(10):
-            next_round = self.generate_round(matches)
+        A list of matches is paired by the indices of its teams, so its teams
+        need not be hashable, unlike those of a MatchPool.
+
+        @param matches: The generated matches
+        @type matches: MatchPool or list
+        @param rng: The random number generator or seed to use, by default the
+            random module
+        @type rng: random.Random or int
+        @return: The generated round
+        @rtype: list
+        """
+        rng = self.get_rng(rng)
+        if isinstance(matches, MatchPool):
+            return self._generate_round(matches, Scheduler.team_masks(self.teams),
+                                        rng)
+        try:
+            index = dict((team, idx) for (idx, team) in enumerate(self.teams)).__getitem__
+        except TypeError:  # Unhashable teams
+            index = self.teams.index
+        pool = MatchPool([(index(home), index(away)) for (home, away) in matches])
+        round = self._generate_round(pool, [1 << idx for idx in range(len(self.teams))],
+                                     rng)
+        if not round:
+            return round
+        matches[:] = self._team_matches(pool)
+        return self._team_matches(round)
+
+    def _generate_schedule_round(self, pool, tries=10, rng=random,
+                                 observer=None, number=0):
+        """Fully generate a round of index matches for a schedule."""
+        masks = [1 << idx for idx in range(len(self.teams))]
+        for ___ in range(tries):
+            if observer is not None:
+                observer.on_round_started(number)
+            next_round = self._generate_round(pool, masks, rng)
             if next_round:
+                if observer is not None:
+                    observer.on_round_completed(number, next_round)
                 return next_round
+            if observer is not None:
+                observer.on_round_failed(number)
         else:
             raise ScheduleGenerationFailed('Schedule generation failed.')
 
-    def generate_schedule(self, try_once=False, home_teams=None):
+    @staticmethod
+    def _circle_round(order, number):
+        """Get a round of a single round-robin by the circle method.
+
+        The first team stays fixed while the others rotate around it by one
+        place each round, so every pair of teams meets exactly once over
+        len(order) - 1 rounds.
+
+        @param order: The teams to pair, of even length
+        @type order: list
+        @param number: The number of the round, from 0 to len(order) - 2
+        @type number: int
+        @return: The round, as pairs from order
+        @rtype: list of tuples
+        """
+        size = len(order) - 1
+        half = len(order) // 2
+        wheel = order[1:] * 2  # The rotations of the others are slices of it
+        circle = order[:1] + wheel[size - number:2 * size - number]
+        return list(zip(circle[:half], circle[:half - 1:-1]))
+
+    @staticmethod
+    def _circle_first(places, team, opp):
+        """Check whether a team comes first in its circle method pairing.
+
+        Two teams on the wheel are paired in the round in which they sit
+        opposite each other, and which of them comes first then depends only
+        on the parity of the distance between them, so it is found without
+        generating the rounds.
+
+        @param places: The position of each team in the order that was paired
+        @type places: list
+        @param team: The team to check
+        @type team: int
+        @param opp: Its opponent
+        @type opp: int
+        @rtype: bool
+        """
+        (place, opp_place) = (places[team], places[opp])
+        return place == 0 or (opp_place != 0 and
+                              (place - opp_place) % (len(places) - 1) % 2 == 0)
+
+    def _iter_circle_rounds(self, home_teams=None, rng=random, observer=None):
+        """Generate the rounds of a schedule with the circle method.
+
+        The rounds are put in random order first, and each one is only paired
+        when it is reached.
+        """
+        team_count = len(self.teams)
+        order = rng.sample(range(team_count), team_count)  # Random labels
+        plan = []
+        for __ in range(self.meetings // 2):
+            plan.extend((True, number) for number in range(team_count - 1))
+            plan.extend((False, number) for number in range(team_count - 1))
+        matrix = self._generate_odd_matrix(home_teams, rng, observer)
+        if matrix is not None:
+            plan.extend((None, number) for number in range(team_count - 1))
+        rng.shuffle(plan)
+
+        for (index, (forward, number)) in enumerate(plan):
+            if observer is not None:
+                observer.on_round_started(index)
+            round = self._circle_round(order, number)
+            if forward is None:
+                round = [(team, opp) if matrix[team][opp] else (opp, team)
+                         for (team, opp) in round]
+            elif not forward:
+                round = [(opp, team) for (team, opp) in round]
+            if observer is not None:
+                observer.on_round_completed(index, round)
+            yield round
+
+    def _iter_matching_rounds(self, home_teams=None, rng=random, observer=None):
+        """Generate the rounds of a schedule from perfect matchings.
+
+        The season's matches form a multigraph made of one complete graph per
+        meeting. Each of these is split into perfect matchings on its own with
+        the circle method, under a fresh random labelling of the teams. Pairs
+        of meetings are oriented in opposite directions, and any odd meeting
+        is oriented by the matrix for odd meeting counts. The rounds are put
+        in random order first, and each one is only paired when it is reached.
+
+        This only differs from the circle engine in the labellings, as that
+        engine pairs every meeting alike. Rounds are cut from a doubled copy
+        of each order, and mirrored meetings look up the places of the
+        previous meeting's order, so the time taken grows with the number of
+        matches in the season. For odd meeting counts, most of it is spent
+        generating the matrix.
+        """
+        team_count = len(self.teams)
+        order = list(range(team_count))
+        orders = []
+        for __ in range(self.meetings):
+            rng.shuffle(order)
+            orders.append(array('H', order))
+        matrix = self._generate_odd_matrix(home_teams, rng, observer)
+        plan = [(leg, number) for leg in range(self.meetings)
+                for number in range(team_count - 1)]
+        rng.shuffle(plan)
+
+        places = {}  # The place of each team in the order of each mirrored meeting
+        size = team_count - 1
+        for (index, (leg, number)) in enumerate(plan):
+            if observer is not None:
+                observer.on_round_started(index)
+            round = self._circle_round(orders[leg], number)
+            if matrix is not None and leg == self.meetings - 1:
+                round = [(team, opp) if matrix[team][opp] else (opp, team)
+                         for (team, opp) in round]
+            elif leg % 2 == 1:  # Mirror the pairing of the previous meeting
+                if leg not in places:
+                    places[leg] = array('H', order)
+                    for (place, team) in enumerate(orders[leg - 1]):
+                        places[leg][team] = place
+                place = places[leg]
+                # Inlined _circle_first(), as it is checked for every match
+                round = [(opp, team)
+                         if place[team] == 0 or (
+                             place[opp] != 0 and
+                             (place[team] - place[opp]) % size % 2 == 0)
+                         else (team, opp)
+                         for (team, opp) in round]
+            if observer is not None:
+                observer.on_round_completed(index, round)
+            yield round
+
+    def _iter_template_rounds(self, home_teams=None, rng=random, observer=None):
+        """Generate the rounds of a schedule from templates.
+
+        Each meeting between all teams follows a template picked at random,
+        under a fresh random labelling of the teams. Pairs of meetings are
+        oriented in opposite directions, and any odd meeting is oriented by
+        the matrix for odd meeting counts. The rounds are put in random order
+        first, and each one is only labelled when it is reached.
+        """
+        team_count = len(self.teams)
+        templates = self.template_library.templates(team_count)
+        order = list(range(team_count))
+        legs = []
+        for __ in range(self.meetings):
+            rng.shuffle(order)
+            legs.append((rng.choice(templates), array('H', order)))
+        matrix = self._generate_odd_matrix(home_teams, rng, observer)
+        plan = [(leg, number) for leg in range(self.meetings)
+                for number in range(team_count - 1)]
+        rng.shuffle(plan)
+
+        first_home = {}  # Home teams of the meetings that are mirrored
+        for (index, (leg, number)) in enumerate(plan):
+            if observer is not None:
+                observer.on_round_started(index)
+            (template, labels) = legs[leg]
+            round = [(labels[team], labels[opp]) for (team, opp) in template[number]]
+            if matrix is not None and leg == self.meetings - 1:
+                round = [(team, opp) if matrix[team][opp] else (opp, team)
+                         for (team, opp) in round]
+            elif leg % 2 == 1:  # Mirror the previous meeting
+                if leg not in first_home:
+                    (template, labels) = legs[leg - 1]
+                    homes = first_home[leg] = bytearray(team_count * team_count)
+                    for (team, opp) in itertools.chain.from_iterable(template):
+                        homes[labels[team] * team_count + labels[opp]] = 1
+                homes = first_home[leg]
+                round = [(opp, team) if homes[team * team_count + opp]
+                         else (team, opp)
+                         for (team, opp) in round]
+            if observer is not None:
+                observer.on_round_completed(index, round)
+            yield round
+
+    def _iter_backtrack_rounds(self, matches, retry, window=None, rng=random,
+                               observer=None):
+        """Generate the rounds of a schedule by depth-first search.
+
+        Each attempt may take as many search steps as the tries per round
+        allow for every match of the season. Once a round has been yielded,
+        failed attempts are no longer retried.
+        """
+        attempts = 0
+        max_rounds = 0
+        for tries in retry:
+            attempts += 1
+            if observer is not None and attempts > 1:
+                observer.on_restart(attempts)
+            builder = BacktrackingRoundBuilder(len(self.teams), matches,
+                                               max_nodes=tries * len(matches),
+                                               rng=rng, observer=observer)
+            yielded = 0
+            try:
+                for round in builder.iter_build(window):
+                    yield round
+                    yielded += 1
+            except ScheduleGenerationFailed:
+                if yielded:
+                    raise
+                max_rounds = max(max_rounds, builder.deepest)
+                continue
+            return
+
+        raise ScheduleGenerationFailed(
+            'Schedule generation failed after {} attempts.'.format(attempts),
+            attempts=attempts, max_rounds=max_rounds)
+
+    def _iter_random_rounds(self, matches, retry, window=None, rng=random,
+                            observer=None):
+        """Generate the rounds of a schedule from randomly ordered matches.
+
+        Rounds that have not been yielded are discarded and generated again on
+        each new attempt. Once a round has been yielded, failed attempts are
+        no longer retried.
+        """
+        pool = MatchPool(matches)
+        marks = [pool.snapshot()]  # Before each of the rounds held back
+        committed = 0
+        attempts = 0
+        max_rounds = 0
+        for tries in retry:
+            attempts += 1
+            if observer is not None and attempts > 1:
+                observer.on_restart(attempts)
+            pool.rollback(marks[0])
+            del marks[1:]
+            rounds = []
+            try:
+                while committed + len(rounds) < self.round_count:
+                    rounds.append(self._generate_schedule_round(
+                        pool, tries, rng, observer, committed + len(rounds)))
+                    marks.append(pool.snapshot())
+                    if window is not None and len(rounds) > window:
+                        committed += 1
+                        marks.pop(0)
+                        yield rounds.pop(0)
+            except ScheduleGenerationFailed:
+                if committed:
+                    raise ScheduleGenerationFailed(
+                        'Schedule generation failed after {} rounds were '
+                        'yielded.'.format(committed), attempts=attempts,
+                        max_rounds=committed + len(rounds))
+                max_rounds = max(max_rounds, len(rounds))
+                continue
+            break
+        else:
+            raise ScheduleGenerationFailed(
+                'Schedule generation failed after {} attempts.'.format(attempts),
+                attempts=attempts, max_rounds=max_rounds)
+
+        for round in rounds:
+            yield round
+
+    def _iter_index_rounds(self, home_teams=None, engine=None, retry=None,
+                           window=None, rng=random, observer=None):
+        """Generate the rounds of a schedule between team indices."""
+        if engine == 'circle':
+            return self._iter_circle_rounds(home_teams, rng, observer)
+        elif engine == 'matching':
+            return self._iter_matching_rounds(home_teams, rng, observer)
+        elif engine == 'template':
+            return self._iter_template_rounds(home_teams, rng, observer)
+        matches = self._generate_index_matches(home_teams, rng, observer)
+        if engine == 'backtrack':
+            return self._iter_backtrack_rounds(matches, retry, window, rng,
+                                               observer)
+        else:
+            return self._iter_random_rounds(matches, retry, window, rng,
+                                            observer)
+
+    def _get_observer(self, stats=None):
+        """Get the observer of a generation run, or None if there is none."""
+        observers = [observer for observer in (self.observer, stats)
+                     if observer is not None]
+        if len(observers) > 1:
+            return ObserverGroup(observers)
+        return observers[0] if observers else None
+
+    def _cache_key(self, home_teams, engine, retry, seed):
+        """Get the key for a schedule in the cache.
+
+        Everything that the schedule generated from a seed depends on is part
+        of the key, except for the teams themselves. This includes the major
+        version of Python, as the random module differs between versions, and
+        the settings of the template library for the template engine.
+        """
+        homes = None
+        if home_teams and self.meetings % 2 == 1:
+            homes = tuple(sorted(self.teams.index(home) for home in home_teams))
+        library = None
+        if engine == 'template':
+            library = (self.template_library.count, self.template_library.max_teams)
+        return (len(self.teams), self.meetings, homes, seed, engine,
+                'numpy' if self._use_numpy else 'python', retry.max_attempts,
+                retry.round_tries, retry.backoff, retry.max_round_tries,
+                sys.version_info[0], library)
+
+    def generate_schedule(self, try_once=False, home_teams=None, engine=None,
+                          retry=None, indices=False, rng=None, stats=None,
+                          compact=False):
         """Generate the schedule.
 
+        Failed attempts are retried according to the retry policy, reusing
+        the same pool of matches for every attempt.
+
+        Schedules are generated with teams represented by their indices in the
+        teams attribute, and only converted to matches between teams at the
+        end, unless indices is set.
+
+        If the scheduler has a cache, schedules generated from a seed are
+        stored in it, and the same schedule for another league of the same
+        size is taken from the cache and given the teams of this league.
+
+        A compact schedule is stored in flat arrays of team indices, and only
+        converted to matches as its rounds are accessed.
+
         @param try_once: Whether to only try once to generate a schedule
         @type try_once: bool
+        @param engine: The generation engine to use instead of the default
+        @type engine: str
+        @param retry: The retry policy to use instead of the default
+        @type retry: RetryPolicy
+        @param indices: Whether to return matches between team indices
+        @type indices: bool
+        @param rng: The random number generator or seed to use, by default the
+            random module
+        @type rng: random.Random or int
+        @param stats: Statistics to fill in, also when generation fails
+        @type stats: GenerationStats
+        @param compact: Whether to return a Schedule instead of a list
+        @type compact: bool
         @return: The generated schedule
-        @rtype: list of lists of tuples
-        @raise RuntimeError: Failed to create schedule within limits
+        @rtype: list of lists of tuples, or Schedule
+        @raise ScheduleGenerationFailed: Failed to create schedule within limits
+        @raise GenerationAborted: An observer stopped generation
         """
-        rounds = []
-        matches = self.generate_matches(home_teams=home_teams)
-
-        try:
-            for __ in range(self.round_count):
-                rounds.append(self._generate_schedule_round(matches))
-        except ScheduleGenerationFailed as ex:
-            if try_once:
-                raise ex
-            else:
-                return self.generate_schedule(try_once, home_teams)
+        engine = self._check_engine(engine) if engine else self.engine
+        retry = retry or self.retry
+        if try_once:
+            retry = retry.once()
+        key = None
+        if (self.cache is not None and isinstance(rng, numbers.Integral) and
+                not isinstance(rng, bool)):
+            key = self._cache_key(home_teams, engine, retry, rng)
+            cached = self.cache.get(key, self.match_count)
+            if cached:
+                if stats is not None:
+                    stats.cache_hit = True
+                (homes, rounds) = cached
+                if self.meetings % 2 == 1:
+                    self._home_teams = (home_teams or
+                                        [self.teams[home] for home in homes])
+                return self._schedule_result(rounds, indices, compact)
+
+        rounds = list(self._iter_index_rounds(
+            home_teams, engine, retry, rng=self.get_rng(rng),
+            observer=self._get_observer(stats)))
+        if key is not None:
+            homes = []
+            if self.meetings % 2 == 1:
+                homes = [self.teams.index(home) for home in self._home_teams]
+            self.cache.put(key, homes, rounds)
+        return self._schedule_result(rounds, indices, compact)
+
+    def _schedule_result(self, rounds, indices, compact):
+        """Convert rounds between team indices to a generated schedule."""
+        if compact:
+            return Schedule.from_rounds(rounds, self.match_count,
+                                        None if indices else list(self.teams))
+        return rounds if indices else self._team_rounds(rounds)
+
+    def iter_schedule(self, try_once=False, home_teams=None, engine=None,
+                      retry=None, indices=False, window=None, rng=None,
+                      stats=None):
+        """Generate the schedule one round at a time.
+
+        Each round is yielded as soon as it is final, so it may be used while
+        the later rounds are still being generated. Up to window finished
+        rounds are held back, and only these may still be discarded when
+        generation runs into a dead end. Generation never goes back on a round
+        once it has been yielded, so a dead end that cannot be repaired within
+        the window raises ScheduleGenerationFailed part way through the season.
+
+        The random engine can only discard the rounds held back by starting a
+        new attempt before the first round is yielded, and its dead ends are
+        usually in the last rounds, so by default it holds back every round.
+
+        The circle, matching and template engines never run into dead ends,
+        and yield every round as soon as it is paired.
 
-        return rounds
+        @param try_once: Whether to only try once to generate a schedule
+        @type try_once: bool
+        @param engine: The generation engine to use instead of the default
+        @type engine: str
+        @param retry: The retry policy to use instead of the default
+        @type retry: RetryPolicy
+        @param indices: Whether to yield matches between team indices
+        @type indices: bool
+        @param window: The number of finished rounds to hold back, by default
+            half the rounds, or every round with the random engine
+        @type window: int
+        @param rng: The random number generator or seed to use, by default the
+            random module
+        @type rng: random.Random or int
+        @param stats: Statistics to fill in, also when generation fails
+        @type stats: GenerationStats
+        @return: The rounds of the generated schedule
+        @rtype: generator of lists of tuples
+        @raise ScheduleGenerationFailed: Failed to create schedule within limits
+        @raise GenerationAborted: An observer stopped generation
+        """
+        engine = self._check_engine(engine) if engine else self.engine
+        retry = retry or self.retry
+        if try_once:
+            retry = retry.once()
+        if window is None:
+            window = (self.round_count if engine == 'random'
+                      else self.round_count // 2)
+        rounds = self._iter_index_rounds(home_teams, engine, retry, window,
+                                         self.get_rng(rng),
+                                         self._get_observer(stats))
+        for round in rounds:
+            yield round if indices else self._team_matches(round)
+
+    def race_schedule(self, workers=None, seed=None, retry=None, **kwargs):
+        """Generate a schedule by racing attempts in parallel worker processes.
+
+        Each attempt is made from its own seed, and the first schedule found
+        is returned. Which attempt finishes first depends on timing, but the
+        schedule may be generated again by passing the seed and the
+        single-attempt retry policy returned with it to generate_schedule().
+
+        @param workers: The number of worker processes, or None for one per
+            processor
+        @type workers: int or None
+        @param seed: The seed for the attempts, or None for random attempts
+        @type seed: int or None
+        @param retry: The retry policy to use instead of the default
+        @type retry: RetryPolicy
+        @param kwargs: Arguments passed to generate_schedule()
+        @return: The seed, the retry policy and the schedule
+        @rtype: tuple
+        @raise ScheduleGenerationFailed: Failed to create schedule within limits
+        """
+        return parallel.race_schedule(self, workers, seed, retry or self.retry,
+                                      **kwargs)
 
 
 # Aliases for common meeting counts
@@ -211,13 +869,14 @@ class SingleRoundRobinScheduler(RoundRobinScheduler):
     This is an alias of RoundRobinScheduler, with meetings=1.
     """
 
-    def __init__(self, teams):
+    def __init__(self, teams, **kwargs):
         """Constructor.
 
         @param teams: A list of teams or the number of teams
         @type teams: list or int
+        @param kwargs: Other arguments passed to RoundRobinScheduler
         """
-        super(SingleRoundRobinScheduler, self).__init__(teams, meetings=1)
+        super(SingleRoundRobinScheduler, self).__init__(teams, meetings=1, **kwargs)
 
 
 class DoubleRoundRobinScheduler(RoundRobinScheduler):
@@ -227,13 +886,14 @@ class DoubleRoundRobinScheduler(RoundRobinScheduler):
     This is an alias of RoundRobinScheduler, with meetings=2.
     """
 
-    def __init__(self, teams):
+    def __init__(self, teams, **kwargs):
         """Constructor.
 
         @param teams: A list of teams or the number of teams
         @type teams: list or int
+        @param kwargs: Other arguments passed to RoundRobinScheduler
         """
-        super(DoubleRoundRobinScheduler, self).__init__(teams, meetings=2)
+        super(DoubleRoundRobinScheduler, self).__init__(teams, meetings=2, **kwargs)
 
 
 class TripleRoundRobinScheduler(RoundRobinScheduler):
@@ -243,13 +903,14 @@ class TripleRoundRobinScheduler(RoundRobinScheduler):
     This is an alias of RoundRobinScheduler, with meetings=3.
     """
 
-    def __init__(self, teams):
+    def __init__(self, teams, **kwargs):
         """Constructor.
 
         @param teams: A list of teams or the number of teams
         @type teams: list or int
+        @param kwargs: Other arguments passed to RoundRobinScheduler
         """
-        super(TripleRoundRobinScheduler, self).__init__(teams, meetings=3)
+        super(TripleRoundRobinScheduler, self).__init__(teams, meetings=3, **kwargs)
 
 
 class QuadrupleRoundRobinScheduler(RoundRobinScheduler):
@@ -259,10 +920,11 @@ class QuadrupleRoundRobinScheduler(RoundRobinScheduler):
     This is an alias of RoundRobinScheduler, with meetings=4.
     """
 
-    def __init__(self, teams):
+    def __init__(self, teams, **kwargs):
         """Constructor.
 
         @param teams: A list of teams or the number of teams
         @type teams: list or int
+        @param kwargs: Other arguments passed to RoundRobinScheduler
         """
-        super(QuadrupleRoundRobinScheduler, self).__init__(teams, meetings=4)
+        super(QuadrupleRoundRobinScheduler, self).__init__(teams, meetings=4, **kwargs)
@@ -0,0 +1,327 @@
+# -*- coding: utf-8  -*-
+"""Compact storage of generated schedules."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import operator
+
+from array import array
+
+try:
+    from collections.abc import Sequence
+except ImportError:  # pragma: no cover
+    from collections import Sequence
+
+
+class Schedule(object):
+
+    """A schedule stored as two flat arrays of team indices.
+
+    The home and away team indices of every match are stored in order, round
+    after round, with the same number of matches in each round. This takes a
+    small fraction of the memory of a list of lists of tuples, and a schedule
+    can still be used like one: indexing gives a round as a list of tuples,
+    and iteration yields each round in turn. Rounds are built when they are
+    accessed, so changing them does not change the schedule.
+
+    If the schedule has teams, matches are given between the teams at the
+    indices stored, and otherwise between the indices themselves.
+
+    The opponent and venue of each team in each round are looked up in an
+    index, which is built from the arrays the first time it is needed.
+    """
+
+    __slots__ = ('homes', 'aways', 'match_count', 'teams', '_opponents',
+                 '_at_home', '_team_indices')
+
+    NO_MATCH = 0xFFFF  # The opponent of a team without a match in a round
+
+    def __init__(self, homes, aways, match_count, teams=None):
+        """Constructor.
+
+        @param homes: The indices of the home teams of the matches
+        @type homes: array.array
+        @param aways: The indices of the away teams of the matches
+        @type aways: array.array
+        @param match_count: The number of matches in each round
+        @type match_count: int
+        @param teams: The teams at each index, or None for matches between
+            team indices
+        @type teams: list or None
+        """
+        if len(homes) != len(aways):
+            raise ValueError('There must be as many away teams as home teams.')
+        if match_count < 1 or len(homes) % match_count != 0:
+            raise ValueError('Every round must have {} matches.'.format(match_count))
+        self.homes = homes
+        self.aways = aways
+        self.match_count = match_count
+        self.teams = teams
+        self._clear_index()
+
+    def _clear_index(self):
+        """Forget the index of fixtures, to be built again when needed."""
+        self._opponents = None
+        self._at_home = None
+        self._team_indices = None
+
+    @classmethod
+    def from_rounds(cls, rounds, match_count, teams=None):
+        """Store rounds of matches between team indices.
+
+        @param rounds: The rounds, as pairs of team indices
+        @type rounds: iterable of lists of tuples
+        @param match_count: The number of matches in each round
+        @type match_count: int
+        @param teams: The teams at each index, or None for matches between
+            team indices
+        @type teams: list or None
+        @rtype: Schedule
+        """
+        homes = array('H')
+        aways = array('H')
+        for round in rounds:
+            for (home, away) in round:
+                homes.append(home)
+                aways.append(away)
+        return cls(homes, aways, match_count, teams)
+
+    def __getstate__(self):
+        """Get the state of the schedule for pickling.
+
+        Columns that are not arrays, such as views of an archive file, are
+        copied to arrays, as they cannot be pickled.
+        """
+        (homes, aways) = [column if isinstance(column, array) else array('H', column)
+                          for column in (self.homes, self.aways)]
+        return (homes, aways, self.match_count, self.teams)
+
+    def __setstate__(self, state):
+        """Restore a pickled schedule."""
+        (self.homes, self.aways, self.match_count, self.teams) = state
+        self._clear_index()
+
+    @property
+    def round_count(self):
+        """The number of rounds."""
+        return len(self.homes) // self.match_count
+
+    def __len__(self):
+        """Get the number of rounds."""
+        return self.round_count
+
+    def _round(self, number):
+        """Build a round, given a number that is in range."""
+        start = number * self.match_count
+        end = start + self.match_count
+        pairs = zip(self.homes[start:end], self.aways[start:end])
+        if self.teams is None:
+            return list(pairs)
+        teams = self.teams
+        return [(teams[home], teams[away]) for (home, away) in pairs]
+
+    def __getitem__(self, number):
+        """Get a round, or a list of rounds for a slice.
+
+        @param number: The number of the round, from 0, or a slice
+        @type number: int or slice
+        @rtype: list of tuples, or list of lists of tuples
+        @raise IndexError: There is no such round
+        """
+        if isinstance(number, slice):
+            return [self._round(index)
+                    for index in range(*number.indices(self.round_count))]
+        return self._round(self._round_number(number))
+
+    def _round_number(self, number):
+        """Check a round number, counting negative numbers from the end."""
+        number = operator.index(number)
+        if number < 0:
+            number += self.round_count
+        if not 0 <= number < self.round_count:
+            raise IndexError('Schedule round out of range.')
+        return number
+
+    def __iter__(self):
+        """Iterate over the rounds."""
+        for number in range(self.round_count):
+            yield self._round(number)
+
+    def __reversed__(self):
+        """Iterate over the rounds in reverse order."""
+        for number in reversed(range(self.round_count)):
+            yield self._round(number)
+
+    def index(self, round):
+        """Get the number of the first round with the same matches.
+
+        @param round: The round to find
+        @type round: list of tuples
+        @rtype: int
+        @raise ValueError: No round has the same matches
+        """
+        for (number, other) in enumerate(self):
+            if other == round:
+                return number
+        raise ValueError('Round not in schedule.')
+
+    def count(self, round):
+        """Count the rounds with the same matches.
+
+        @param round: The round to count
+        @type round: list of tuples
+        @rtype: int
+        """
+        return sum(1 for other in self if other == round)
+
+    def __eq__(self, other):
+        """Check whether another schedule has the same rounds.
+
+        Schedules compare equal to lists of rounds with the same matches.
+        """
+        if isinstance(other, Schedule):
+            if self.teams is other.teams:
+                return (self.match_count == other.match_count and
+                        self.homes == other.homes and self.aways == other.aways)
+        elif not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        """Check whether another schedule has different rounds."""
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Get a representation of the schedule."""
+        return '<Schedule of {} rounds of {} matches>'.format(self.round_count,
+                                                              self.match_count)
+
+    def to_list(self):
+        """Get the rounds as a list of lists of tuples.
+
+        @rtype: list of lists of tuples
+        """
+        return list(self)
+
+    @property
+    def team_count(self):
+        """The number of teams, including any placeholder."""
+        return 2 * self.match_count
+
+    def _build_index(self):
+        """Build the index of the opponent and venue of each team by round.
+
+        Both are stored for round after round, with an entry for each team in
+        each round, so every lookup is a single array access.
+        """
+        team_count = self.team_count
+        opponents = array('H', [self.NO_MATCH]) * (team_count * self.round_count)
+        at_home = bytearray(len(opponents))
+        base = 0
+        for (match, (home, away)) in enumerate(zip(self.homes, self.aways)):
+            if match % self.match_count == 0 and match:
+                base += team_count
+            opponents[base + home] = away
+            opponents[base + away] = home
+            at_home[base + home] = 1
+        (self._opponents, self._at_home) = (opponents, at_home)
+
+    def _team_index(self, team):
+        """Get the index of a team."""
+        if self.teams is None:
+            index = operator.index(team)
+            if not 0 <= index < self.team_count:
+                raise ValueError('Unknown team: {!r}'.format(team))
+            return index
+        if self._team_indices is None:
+            self._team_indices = dict((team, index)
+                                      for (index, team) in enumerate(self.teams))
+        try:
+            return self._team_indices[team]
+        except KeyError:
+            raise ValueError('Unknown team: {!r}'.format(team))
+
+    def _position(self, team, number):
+        """Get the position of a team in a round in the index."""
+        if self._opponents is None:
+            self._build_index()
+        return (self._round_number(number) * self.team_count +
+                self._team_index(team))
+
+    def opponent(self, team, number):
+        """Get the opponent of a team in a round.
+
+        @param team: The team, or its index for a schedule without teams
+        @param number: The number of the round, from 0
+        @type number: int
+        @return: The opponent, or None if the team has no match in the round
+        @raise ValueError: The team is not in the schedule
+        @raise IndexError: There is no such round
+        """
+        position = self._position(team, number)
+        opp = self._opponents[position]
+        if opp == self.NO_MATCH:
+            return None
+        return opp if self.teams is None else self.teams[opp]
+
+    def is_home(self, team, number):
+        """Check whether a team is at home in a round.
+
+        @param team: The team, or its index for a schedule without teams
+        @param number: The number of the round, from 0
+        @type number: int
+        @rtype: bool
+        @raise ValueError: The team is not in the schedule
+        @raise IndexError: There is no such round
+        """
+        return bool(self._at_home[self._position(team, number)])
+
+    def fixtures(self, team):
+        """Get the fixtures of a team, round by round.
+
+        @param team: The team, or its index for a schedule without teams
+        @return: The number of each round the team plays in, its opponent and
+            whether it is at home
+        @rtype: list of tuples
+        @raise ValueError: The team is not in the schedule
+        """
+        index = self._team_index(team)
+        if self._opponents is None:
+            self._build_index()
+        (opponents, at_home, teams) = (self._opponents, self._at_home, self.teams)
+        fixtures = []
+        for number in range(self.round_count):
+            position = number * self.team_count + index
+            opp = opponents[position]
+            if opp != self.NO_MATCH:
+                fixtures.append((number, opp if teams is None else teams[opp],
+                                 bool(at_home[position])))
+        return fixtures
+
+    def indices(self):
+        """Get the schedule between team indices, sharing the same arrays.
+
+        @rtype: Schedule
+        """
+        return Schedule(self.homes, self.aways, self.match_count)
+
+
+Sequence.register(Schedule)
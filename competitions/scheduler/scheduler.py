@@ -18,7 +18,11 @@
 
 from __future__ import unicode_literals
 
-from . import NoMatchFound
+import itertools
+import random
+import timeit
+
+from . import NoMatchFound, parallel
 
 
 class Scheduler(object):
@@ -66,14 +70,355 @@ class Scheduler(object):
             except IndexError:  # We've run out of possibilities.
                 raise NoMatchFound  # Raise exception to caller
 
-    def generate_schedule(self, try_once=False):
+    @staticmethod
+    def get_rng(rng=None):
+        """Get a random number generator.
+
+        The same seed always gives the same generator, and so the same results
+        from the same inputs.
+
+        @param rng: A random number generator, a seed for a new one, or None
+            for the random module
+        @type rng: random.Random, module, int or None
+        @return: The random number generator
+        @rtype: random.Random or module
+        """
+        if rng is None:
+            return random
+        if rng is random or isinstance(rng, random.Random):
+            return rng
+        return random.Random(rng)
+
+    @staticmethod
+    def team_masks(teams):
+        """Map teams to bitmasks for fast conflict checks.
+
+        @param teams: The teams
+        @type teams: list
+        @return: A distinct single-bit mask for each team
+        @rtype: dict
+        """
+        return dict((team, 1 << idx) for (idx, team) in enumerate(teams))
+
+    @staticmethod
+    def find_unique_match_mask(used, rest, masks):
+        """Find a unique match using bitmasks.
+
+        This is a faster alternative to find_unique_match(), checking each
+        possibility against a bitmask of the teams already matched instead of
+        against each match.
+
+        @param used: The bitmask of the teams already matched
+        @type used: int
+        @param rest: The matches to check for a unique match, which are
+            consumed up to and including the match found
+        @type rest: iterator
+        @param masks: The bitmasks of the teams, from team_masks()
+        @type masks: dict
+        @return: The first unique match found, and its bitmask
+        @rtype: tuple
+        @raise NoMatchFound: If no unique match is found
+        """
+        for possibility in rest:
+            (team, opp) = possibility
+            mask = masks[team] | masks[opp]
+            if not used & mask:
+                return (possibility, mask)
+        raise NoMatchFound
+
+    def generate_schedule(self, try_once=False, rng=None):
         """Generate the schedule.
 
         This method must be overridden by subclasses.
 
         @param try_once: Whether to only try once to generate a schedule
         @type try_once: bool
+        @param rng: The random number generator or seed to use, by default the
+            random module
+        @type rng: random.Random or int
         @return: The generated schedule
         @rtype: list of lists of tuples
         """
         raise NotImplementedError
+
+    def generate_schedules(self, count, workers=None, seed=None, **kwargs):
+        """Generate many schedules in parallel worker processes.
+
+        Each schedule is generated from its own seed, drawn from the given
+        seed, so the batch is reproducible whatever the number of workers.
+
+        @param count: The number of schedules to generate
+        @type count: int
+        @param workers: The number of worker processes, or None for one per
+            processor
+        @type workers: int or None
+        @param seed: The seed for the batch, or None for a random batch
+        @type seed: int or None
+        @param kwargs: Arguments passed to generate_schedule()
+        @return: Pairs of the seed and the schedule, in order of completion
+        @rtype: generator of tuples
+        @raise ScheduleGenerationFailed: A schedule could not be generated
+        """
+        return parallel.generate_schedules(self, count, workers, seed, **kwargs)
+
+
+class RetryPolicy(object):
+
+    """Policy for retrying randomized schedule generation.
+
+    Each attempt at generating a schedule may try each round a limited number
+    of times before the attempt is abandoned and generation restarts. After
+    every failed attempt, that limit is multiplied by the backoff factor (up to
+    max_round_tries), so later attempts work harder before giving up.
+    """
+
+    def __init__(self, max_attempts=None, round_tries=10, backoff=1,
+                 max_round_tries=1000):
+        """Constructor.
+
+        @param max_attempts: The maximum number of attempts, or None for no limit
+        @type max_attempts: int or None
+        @param round_tries: The number of tries per round in the first attempt
+        @type round_tries: int
+        @param backoff: The factor applied to round_tries after each attempt
+        @type backoff: int or float
+        @param max_round_tries: The upper limit on tries per round
+        @type max_round_tries: int
+        """
+        self.max_attempts = max_attempts
+        self.round_tries = round_tries
+        self.backoff = backoff
+        self.max_round_tries = max_round_tries
+
+    def once(self):
+        """Return a copy of this policy allowing a single attempt."""
+        return RetryPolicy(1, self.round_tries, self.backoff,
+                           self.max_round_tries)
+
+    def attempts(self):
+        """Iterate over the attempt numbers allowed by this policy."""
+        if self.max_attempts is None:
+            return itertools.count()
+        return iter(range(self.max_attempts))
+
+    def split(self):
+        """Iterate over policies allowing a single attempt each.
+
+        Each policy allows the tries per round of the attempt it stands for,
+        so that the attempts may be made independently of each other.
+        """
+        for tries in self:
+            yield RetryPolicy(1, tries, self.backoff, self.max_round_tries)
+
+    def __iter__(self):
+        """Iterate over the number of tries per round for each attempt."""
+        tries = self.round_tries
+        for __ in self.attempts():
+            yield int(tries)
+            tries = min(tries * self.backoff, self.max_round_tries)
+
+
+class GenerationObserver(object):
+
+    """Base class for observers of schedule generation.
+
+    An observer is told about each phase of generation as it happens, with
+    rounds and matches between team indices. The methods of this class do
+    nothing, and subclasses override those they need. Raising
+    GenerationAborted from any of them stops generation.
+    """
+
+    def on_matches_started(self):
+        """Called before the matches of the season are generated."""
+
+    def on_matrix_generated(self, matrix):
+        """Called when a matrix for odd meeting counts has been generated.
+
+        @param matrix: The matrix, as a list of lists or a NumPy array
+        @type matrix: list or numpy.ndarray
+        """
+
+    def on_matches_generated(self, count):
+        """Called when the matches of the season have been generated.
+
+        Every engine reports the matches of the whole season, including
+        matches against the blank placeholder.
+
+        @param count: The number of matches generated
+        @type count: int
+        """
+
+    def on_round_started(self, number):
+        """Called before each try at building a round.
+
+        @param number: The index of the round in the season
+        @type number: int
+        """
+
+    def on_round_failed(self, number):
+        """Called when a try at building a round has failed.
+
+        @param number: The index of the round in the season
+        @type number: int
+        """
+
+    def on_round_completed(self, number, round):
+        """Called when a round has been built.
+
+        Rounds may still be discarded later by engines that back up or
+        restart.
+
+        @param number: The index of the round in the season
+        @type number: int
+        @param round: The round
+        @type round: list of tuples
+        """
+
+    def on_restart(self, attempt):
+        """Called when generation of the season starts again.
+
+        @param attempt: The number of the new attempt, counting from 1
+        @type attempt: int
+        """
+
+
+class ObserverGroup(GenerationObserver):
+
+    """A group of observers, each told about generation in turn."""
+
+    def __init__(self, observers):
+        """Constructor.
+
+        @param observers: The observers
+        @type observers: list of GenerationObserver
+        """
+        self.observers = list(observers)
+
+    def on_matches_started(self):
+        """Tell each observer that matches are being generated."""
+        for observer in self.observers:
+            observer.on_matches_started()
+
+    def on_matrix_generated(self, matrix):
+        """Tell each observer that a matrix has been generated."""
+        for observer in self.observers:
+            observer.on_matrix_generated(matrix)
+
+    def on_matches_generated(self, count):
+        """Tell each observer that matches have been generated."""
+        for observer in self.observers:
+            observer.on_matches_generated(count)
+
+    def on_round_started(self, number):
+        """Tell each observer that a round is being built."""
+        for observer in self.observers:
+            observer.on_round_started(number)
+
+    def on_round_failed(self, number):
+        """Tell each observer that a round could not be built."""
+        for observer in self.observers:
+            observer.on_round_failed(number)
+
+    def on_round_completed(self, number, round):
+        """Tell each observer that a round has been built."""
+        for observer in self.observers:
+            observer.on_round_completed(number, round)
+
+    def on_restart(self, attempt):
+        """Tell each observer that generation starts again."""
+        for observer in self.observers:
+            observer.on_restart(attempt)
+
+
+class GenerationStats(GenerationObserver):
+
+    """Statistics of schedule generation.
+
+    Pass an instance to generate_schedule() to have it filled in. Timings are
+    in seconds, and split between generating the matches of the season,
+    including any matrix for odd meeting counts, and building the rounds.
+    Dead ends are tries at rounds that failed.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self.matrix_attempts = 0
+        self.round_attempts = []  # Tries at each round, over all attempts
+        self.restarts = 0
+        self.dead_ends = 0
+        self.cache_hit = False
+        self.timings = {'matches': 0.0, 'rounds': 0.0}
+        self._started = None
+
+    def count_round_attempt(self, number):
+        """Count a try at building a round.
+
+        @param number: The index of the round in the season
+        @type number: int
+        """
+        attempts = self.round_attempts
+        if number >= len(attempts):
+            attempts.extend([0] * (number + 1 - len(attempts)))
+        attempts[number] += 1
+
+    def add_time(self, phase, seconds):
+        """Add time spent in a phase of generation.
+
+        @param phase: The phase, either 'matches' or 'rounds'
+        @type phase: str
+        @param seconds: The time spent
+        @type seconds: float
+        """
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+    def _finish(self, phase):
+        """Add the time since the current phase started."""
+        self.add_time(phase, timeit.default_timer() - self._started)
+
+    def on_matches_started(self):
+        """Start timing match generation."""
+        self._started = timeit.default_timer()
+
+    def on_matrix_generated(self, matrix):
+        """Count a matrix."""
+        self.matrix_attempts += 1
+
+    def on_matches_generated(self, count):
+        """Finish timing match generation."""
+        self._finish('matches')
+
+    def on_round_started(self, number):
+        """Count a try at a round, and start timing it."""
+        self.count_round_attempt(number)
+        self._started = timeit.default_timer()
+
+    def on_round_failed(self, number):
+        """Count a dead end, and finish timing the round."""
+        self.dead_ends += 1
+        self._finish('rounds')
+
+    def on_round_completed(self, number, round):
+        """Finish timing a round."""
+        self._finish('rounds')
+
+    def on_restart(self, attempt):
+        """Count a restart."""
+        self.restarts += 1
+
+    def as_dict(self):
+        """Get the statistics as a dictionary, such as for JSON.
+
+        @rtype: dict
+        """
+        return {
+            'matrix_attempts': self.matrix_attempts,
+            'round_attempts': list(self.round_attempts),
+            'restarts': self.restarts,
+            'dead_ends': self.dead_ends,
+            'cache_hit': self.cache_hit,
+            'timings': dict(self.timings),
+        }
+
+    def __repr__(self):
+        """Get a representation of the statistics."""
+        return 'GenerationStats({!r})'.format(self.as_dict())
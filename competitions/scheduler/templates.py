@@ -0,0 +1,101 @@
+# -*- coding: utf-8  -*-
+"""Libraries of round-robin templates."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import itertools
+import random
+
+from .backtrack import BacktrackingRoundBuilder
+
+
+def circle_template(team_count):
+    """Get the single round-robin of the circle method between team indices.
+
+    @param team_count: The number of teams, which must be even
+    @type team_count: int
+    @rtype: list of lists of tuples
+    """
+    size = team_count - 1
+    rounds = []
+    for number in range(size):
+        circle = [0] + [1 + (place - number) % size for place in range(size)]
+        rounds.append([(circle[i], circle[-1 - i])
+                       for i in range(team_count // 2)])
+    return rounds
+
+
+class TemplateLibrary(object):
+
+    """A library of single round-robin templates between team indices.
+
+    The first template for each number of teams is that of the circle method.
+    For leagues of up to max_teams teams, the others are found by depth-first
+    search from fixed seeds, so a library always holds the same templates.
+    Templates are built when first needed, and may be kept in a cache so that
+    they are only searched for once.
+    """
+
+    def __init__(self, count=4, max_teams=64, cache=None):
+        """Constructor.
+
+        @param count: The number of templates for each number of teams
+        @type count: int
+        @param max_teams: The largest league with more than one template
+        @type max_teams: int
+        @param cache: A cache to store the templates in
+        @type cache: ScheduleCache
+        """
+        self.count = count
+        self.max_teams = max_teams
+        self.cache = cache
+        self._templates = {}
+
+    def _search(self, team_count, number):
+        """Find a template by depth-first search."""
+        key = ('template', team_count, number)
+        if self.cache is not None:
+            cached = self.cache.get(key, team_count // 2)
+            if cached:
+                return cached[1]
+        builder = BacktrackingRoundBuilder(
+            team_count, list(itertools.combinations(range(team_count), 2)),
+            rng=random.Random(team_count * self.count + number))
+        rounds = builder.build()
+        if self.cache is not None:
+            self.cache.put(key, [], rounds)
+        return rounds
+
+    def templates(self, team_count):
+        """Get the templates for a number of teams.
+
+        @param team_count: The number of teams, which must be even
+        @type team_count: int
+        @return: The templates, each a list of rounds of pairs of team indices
+        @rtype: list
+        """
+        if team_count not in self._templates:
+            templates = [circle_template(team_count)]
+            if team_count <= self.max_teams:
+                templates.extend(self._search(team_count, number)
+                                 for number in range(1, self.count))
+            self._templates[team_count] = templates
+        return self._templates[team_count]
+
+
+default_library = TemplateLibrary()
@@ -0,0 +1,278 @@
+# -*- coding: utf-8  -*-
+"""Validation of round-robin schedules.
+
+Schedules are checked on flat arrays of team indices, with a pass over the
+matches for each check, so validation takes time in proportion to the size of
+the schedule. The checks may also be run with NumPy, which is optional.
+"""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import collections
+import itertools
+
+from array import array
+
+from . import vectorized
+from .schedule import Schedule
+
+BACKENDS = ('python', 'numpy')
+
+
+class Violation(collections.namedtuple(
+        'Violation', ['kind', 'round', 'teams', 'expected', 'actual'])):
+
+    """A way in which a schedule is not a valid round-robin schedule.
+
+    The kinds of violations are:
+
+    - C{'round_count'}: The schedule has the wrong number of rounds.
+    - C{'round_size'}: A round has the wrong number of matches. Only these
+      violations are reported when there are any, as the other checks need
+      every round to be complete.
+    - C{'round_team'}: A team does not play exactly once in a round.
+    - C{'unknown_team'}: A team that is not in the league plays in a round.
+    - C{'meetings'}: Two teams do not meet the right number of times.
+    - C{'home_matches'}: A team has the wrong number of home matches.
+
+    The round is None for violations that concern the whole season, and the
+    teams are those the violation concerns. The expected and actual values are
+    numbers of rounds, matches or meetings.
+    """
+
+    __slots__ = ()
+
+
+def _home_limits(team_count, meetings, extra_homes):
+    """Get the fewest and most home matches allowed for each team.
+
+    Teams have the same number of home and away matches against each other
+    for each pair of meetings, and half of them have one more home than away
+    match in an odd meeting. These are the extra home teams, if known.
+    """
+    base = meetings // 2 * (team_count - 1)
+    if meetings % 2 == 0:
+        return ([base] * team_count, [base] * team_count)
+    more = base + team_count // 2
+    if extra_homes is None:
+        return ([more - 1] * team_count, [more] * team_count)
+    limits = [more if team in extra_homes else more - 1
+              for team in range(team_count)]
+    return (limits, limits)
+
+
+def _python_violations(homes, aways, team_count, match_count, meetings,
+                       extra_homes):
+    """Find the violations of a schedule between team indices in Python.
+
+    Violations are given as tuples, with the teams as indices.
+    """
+    violations = []
+    round_count = len(homes) // match_count
+
+    seen = array('l', [-1]) * team_count  # The last round each team played
+    for number in range(round_count):
+        start = number * match_count
+        round = itertools.chain(homes[start:start + match_count],
+                                aways[start:start + match_count])
+        for team in round:
+            if team >= team_count or seen[team] == number:
+                break
+            seen[team] = number
+        else:  # All teams in the round are different, so each plays once
+            continue
+        counts = collections.Counter(
+            itertools.chain(homes[start:start + match_count],
+                            aways[start:start + match_count]))
+        for team in sorted(set(counts) | set(range(team_count))):
+            if team >= team_count:
+                violations.append(('unknown_team', number, (team,), 0,
+                                   counts[team]))
+            elif counts[team] != 1:
+                violations.append(('round_team', number, (team,), 1,
+                                   counts[team]))
+
+    pairs = array('l', [0]) * (team_count * team_count)
+    home_counts = array('l', [0]) * team_count
+    for (home, away) in zip(homes, aways):
+        if home < team_count and away < team_count:
+            if home < away:
+                pairs[home * team_count + away] += 1
+            else:
+                pairs[away * team_count + home] += 1
+            home_counts[home] += 1
+    for team in range(team_count):
+        start = team * team_count + team + 1
+        row = pairs[start:(team + 1) * team_count]
+        if row.count(meetings) != len(row):
+            for (offset, count) in enumerate(row):
+                if count != meetings:
+                    violations.append(('meetings', None,
+                                       (team, team + 1 + offset), meetings,
+                                       count))
+
+    (fewest, most) = _home_limits(team_count, meetings, extra_homes)
+    for team in range(team_count):
+        count = home_counts[team]
+        if not fewest[team] <= count <= most[team]:
+            violations.append(('home_matches', None, (team,),
+                               fewest[team] if count < fewest[team]
+                               else most[team], count))
+    return violations
+
+
+def _numpy_violations(homes, aways, team_count, match_count, meetings,
+                      extra_homes):
+    """Find the violations of a schedule between team indices with NumPy.
+
+    The violations are the same as those of _python_violations(), in the same
+    order.
+    """
+    numpy = vectorized.numpy
+    round_count = len(homes) // match_count
+    homes = numpy.asarray(homes, dtype=numpy.int64)
+    aways = numpy.asarray(aways, dtype=numpy.int64)
+    violations = []
+
+    slots = numpy.concatenate((homes.reshape(round_count, match_count),
+                               aways.reshape(round_count, match_count)), axis=1)
+    width = max(team_count, int(slots.max()) + 1) if slots.size else team_count
+    counts = numpy.bincount(
+        (numpy.arange(round_count)[:, None] * width + slots).ravel(),
+        minlength=round_count * width).reshape(round_count, width)
+    wrong = counts != 0
+    wrong[:, :team_count] = counts[:, :team_count] != 1
+    for (number, team) in numpy.argwhere(wrong).tolist():
+        if team >= team_count:
+            violations.append(('unknown_team', number, (team,), 0,
+                               int(counts[number, team])))
+        else:
+            violations.append(('round_team', number, (team,), 1,
+                               int(counts[number, team])))
+
+    known = (homes < team_count) & (aways < team_count)
+    (known_homes, known_aways) = (homes[known], aways[known])
+    keys = (numpy.minimum(known_homes, known_aways) * team_count +
+            numpy.maximum(known_homes, known_aways))
+    pairs = numpy.bincount(keys, minlength=team_count * team_count).reshape(
+        team_count, team_count)
+    (teams, opps) = numpy.triu_indices(team_count, 1)
+    meeting_counts = pairs[teams, opps]
+    for index in numpy.flatnonzero(meeting_counts != meetings).tolist():
+        violations.append(('meetings', None, (int(teams[index]), int(opps[index])),
+                           meetings, int(meeting_counts[index])))
+
+    home_counts = numpy.bincount(known_homes, minlength=team_count)
+    (fewest, most) = (numpy.array(limits)
+                      for limits in _home_limits(team_count, meetings, extra_homes))
+    for team in numpy.flatnonzero((home_counts < fewest) |
+                                  (home_counts > most)).tolist():
+        count = int(home_counts[team])
+        violations.append(('home_matches', None, (team,),
+                           int(fewest[team]) if count < fewest[team]
+                           else int(most[team]), count))
+    return violations
+
+
+def validate_schedule(schedule, teams, meetings, home_teams=None,
+                      backend='python'):
+    """Check that a schedule is a valid round-robin schedule.
+
+    A valid schedule has as many rounds as the number of teams less one for
+    each meeting, and every team plays exactly once in each round. Each pair
+    of teams meets the given number of times, and each team has as many home
+    matches as away matches, apart from one extra home or away match for odd
+    meeting counts. Any blank placeholder in the teams is treated as a team,
+    so byes only count as matches against it.
+
+    @param schedule: The schedule, as a list of rounds of matches between the
+        teams, or as a Schedule, which is checked between its team indices
+    @type schedule: list of lists of tuples, or Schedule
+    @param teams: The teams, including any blank placeholder, or the number
+        of teams for a schedule between team indices
+    @type teams: list or int
+    @param meetings: The number of times teams meet each other
+    @type meetings: int
+    @param home_teams: The teams with an extra home match for odd meeting
+        counts, or None to allow any half of the teams to have one
+    @type home_teams: list or None
+    @param backend: The backend for the checks, either 'python' or 'numpy',
+        which falls back to 'python' if NumPy is not installed
+    @type backend: str
+    @return: The violations, none of them for a valid schedule
+    @rtype: list of Violation
+    """
+    if backend not in BACKENDS:
+        raise ValueError('Unknown validation backend: {!r}'.format(backend))
+    if isinstance(teams, list):
+        team_count = len(teams)
+        indices = dict((team, index) for (index, team) in enumerate(teams))
+    else:
+        (team_count, teams, indices) = (teams, None, None)
+    match_count = team_count // 2
+    round_count = (team_count - 1) * meetings
+    violations = []
+
+    if isinstance(schedule, Schedule):
+        (homes, aways) = (schedule.homes, schedule.aways)
+        rounds = len(schedule)
+        if schedule.match_count != match_count:
+            violations.extend(
+                ('round_size', number, (), match_count, schedule.match_count)
+                for number in range(len(schedule)))
+    else:
+        unknown = []  # Teams that are not in the league, given extra indices
+        (homes, aways) = (array('l'), array('l'))
+        number = -1
+        for (number, round) in enumerate(schedule):
+            if len(round) != match_count:
+                violations.append(('round_size', number, (), match_count,
+                                   len(round)))
+            for (home, away) in round:
+                if indices is not None:
+                    for team in (home, away):
+                        if team not in indices:
+                            indices[team] = team_count + len(unknown)
+                            unknown.append(team)
+                    (home, away) = (indices[home], indices[away])
+                homes.append(home)
+                aways.append(away)
+        rounds = number + 1
+        if teams is not None:
+            teams = teams + unknown
+
+    if rounds != round_count:
+        violations.insert(0, ('round_count', None, (), round_count, rounds))
+    if not any(violation[0] == 'round_size' for violation in violations):
+        extra_homes = None
+        if home_teams is not None:
+            extra_homes = set(indices[team] if indices is not None else team
+                              for team in home_teams)
+        if backend == 'numpy' and vectorized.numpy is not None:
+            find_violations = _numpy_violations
+        else:
+            find_violations = _python_violations
+        violations.extend(find_violations(homes, aways, team_count,
+                                          match_count, meetings, extra_homes))
+
+    if teams is not None:
+        violations = [(kind, number, tuple(teams[team] for team in team_indices),
+                       expected, actual)
+                      for (kind, number, team_indices, expected, actual)
+                      in violations]
+    return [Violation(*violation) for violation in violations]
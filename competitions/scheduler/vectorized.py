@@ -0,0 +1,103 @@
+# -*- coding: utf-8  -*-
+"""Vectorized schedule generation with NumPy.
+
+NumPy is optional. When it is not installed, numpy is None and the functions
+in this module raise ImportError.
+"""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import random
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def _require_numpy():
+    """Raise ImportError if NumPy is not installed."""
+    if numpy is None:
+        raise ImportError('NumPy is required for vectorized generation.')
+
+
+def generate_matrix_array(team_count, homes, hub, rng=random):
+    """Generate a schedule matrix for odd meeting counts as an array.
+
+    One team, the hub, is set aside, and the other teams, of which there are
+    an odd number, are placed around a circle in random order. Each of them
+    is at home against the teams in the half of the circle following it, and
+    so has the same number of home and away matches. Matches against the hub
+    are then played at the homes of the home teams, giving them their extra
+    home match.
+
+    These rotational matrices are a much narrower family than those of the
+    random trails of RoundRobinScheduler.generate_matrix(): only the order of
+    the circle, the hub and the home teams are random.
+
+    @param team_count: The number of teams, which must be even
+    @type team_count: int
+    @param homes: The indices of the home teams, half of all teams
+    @type homes: list
+    @param hub: The index of the team to set aside
+    @type hub: int
+    @param rng: The random number generator to seed NumPy's from
+    @type rng: random.Random
+    @return: A matrix of 1 where the row team is at home to the column team,
+        0 where it is away, and -1 on the diagonal
+    @rtype: numpy.ndarray of int8
+    """
+    _require_numpy()
+    state = numpy.random.RandomState(rng.getrandbits(32))
+    others = numpy.array([team for team in range(team_count) if team != hub])
+    circle_size = len(others)
+    position = state.permutation(circle_size)
+    gap = (position[None, :] - position[:, None]) % circle_size
+    is_home = numpy.zeros(team_count, dtype=bool)
+    is_home[numpy.asarray(homes, dtype=int)] = True
+
+    matrix = numpy.empty((team_count, team_count), dtype=numpy.int8)
+    matrix[numpy.ix_(others, others)] = (gap >= 1) & (gap <= circle_size // 2)
+    matrix[others, hub] = is_home[others]
+    matrix[hub, others] = ~is_home[others]
+    numpy.fill_diagonal(matrix, -1)
+    return matrix
+
+
+def matrix_to_list(matrix):
+    """Convert a schedule matrix array to the list form of generate_matrix().
+
+    @param matrix: A matrix from generate_matrix_array()
+    @type matrix: numpy.ndarray
+    @return: The matrix as lists of True, False and None
+    @rtype: list of lists
+    """
+    return [[None if cell < 0 else bool(cell) for cell in row]
+            for row in matrix.tolist()]
+
+
+def matrix_index_matches(matrix):
+    """Get the matches of a schedule matrix array as pairs of team indices.
+
+    @param matrix: A matrix from generate_matrix_array()
+    @type matrix: numpy.ndarray
+    @return: The matches, with the home team first
+    @rtype: list of tuples
+    """
+    (homes, aways) = numpy.nonzero(matrix == 1)
+    return list(zip(homes.tolist(), aways.tolist()))
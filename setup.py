@@ -54,5 +54,10 @@ setup(
 
     namespace_packages=['competitions'],
 
+    extras_require={
+        'numpy': ['numpy'],
+        'parallel:python_version < "3"': ['futures'],
+    },
+
     test_suite='tests',
 )
@@ -0,0 +1,89 @@
+# -*- coding: utf-8  -*-
+"""Tests for schedule archives."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import os
+import pickle
+import shutil
+import tempfile
+
+from . import TestCase
+
+from competitions.scheduler.archive import (
+    ArchiveWriter,
+    ScheduleArchive,
+    write_archive,
+)
+from competitions.scheduler.roundrobin import RoundRobinScheduler
+
+
+class TestScheduleArchive(TestCase):
+
+    """Tests for schedule archives."""
+
+    def setUp(self):
+        """Set up a directory for archive files."""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'schedules.bin')
+
+    def tearDown(self):
+        """Remove the directory for archive files."""
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        """Test that schedules are read back from an archive."""
+        scheduler = RoundRobinScheduler(7, meetings=3, engine='matching')
+        schedules = [scheduler.generate_schedule(rng=seed, indices=True,
+                                                 compact=seed % 2 == 0)
+                     for seed in range(5)]
+        self.assertEqual(5, write_archive(self.path, schedules, 8, 3))
+        self.assertEqual(32 + 5 * 2 * 2 * 21 * 4, os.path.getsize(self.path))
+        archive = ScheduleArchive(self.path, teams=scheduler.teams)
+        try:
+            self.assertEqual((5, 8, 3, 21),
+                             (len(archive), archive.team_count,
+                              archive.meetings, archive.round_count))
+            self.assertEqual(scheduler._team_rounds(schedules[3]),
+                             archive[3].to_list())
+            self.assertEqual(schedules[4], archive[-1].indices())
+            self.assertEqual(schedules, [schedule.indices()
+                                         for schedule in archive])
+            self.assertEqual(schedules[1][2][3][0],
+                             archive[1].indices()[2][3][0])
+            self.assertRaises(IndexError, archive.__getitem__, 5)
+            self.assertEqual(schedules[1], pickle.loads(
+                pickle.dumps(archive[1], pickle.HIGHEST_PROTOCOL)).indices())
+        finally:
+            archive.close()
+
+    def test_writer(self):
+        """Test that schedules of the wrong size are rejected."""
+        with ArchiveWriter(self.path, 4, 1) as writer:
+            writer.write([[(0, 1), (2, 3)], [(3, 0), (1, 2)],
+                          [(0, 2), (3, 1)]])
+            self.assertRaises(ValueError, writer.write, [[(0, 1), (2, 3)]])
+        with ScheduleArchive(self.path) as archive:
+            self.assertEqual(1, len(archive))
+            self.assertEqual([(3, 0), (1, 2)], archive[0][1])
+
+    def test_invalid(self):
+        """Test that other files are not read as archives."""
+        with open(self.path, 'wb') as output:
+            output.write(b'not an archive' * 4)
+        self.assertRaises(ValueError, ScheduleArchive, self.path)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8  -*-
+"""Tests for the round-robin scheduler benchmarks."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import json
+import os
+import shutil
+import tempfile
+
+from . import TestCase
+
+from competitions.scheduler import bench
+
+
+class TestBenchmarks(TestCase):
+
+    """Tests for the benchmarks."""
+
+    def test_results(self):
+        """Test the benchmarks for a small league."""
+        report = bench.run(team_counts=[6], meeting_counts=[1, 2],
+                           engines=['random', 'circle'], repeat=2)
+        benchmarks = [(result['benchmark'], result['meetings'])
+                      for result in report['results']]
+        self.assertIn(('generate_matrix', 1), benchmarks)
+        self.assertNotIn(('generate_matrix', 2), benchmarks)
+        self.assertEqual(4, benchmarks.count(('generate_schedule', 2)) +
+                         benchmarks.count(('generate_schedule', 1)))
+        for result in report['results']:
+            self.assertLessEqual(result['best'], result['mean'])
+            if result['benchmark'] == 'generate_schedule':
+                self.assertGreaterEqual(result['restarts'], 0)
+
+    def test_command_line(self):
+        """Test writing the results of the command line to a file."""
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'results.json')
+            self.assertEqual(0, bench.main(['--teams', '4,5', '--meetings', '3',
+                                            '--benchmark', 'generate_schedule',
+                                            '--repeat', '1', '--output', path]))
+            with open(path) as results:
+                report = json.load(results)
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(2 * len(bench.ENGINE_LIMITS), len(report['results']))
+        self.assertEqual(set(['generate_schedule']),
+                         set(result['benchmark'] for result in report['results']))
@@ -0,0 +1,103 @@
+# -*- coding: utf-8  -*-
+"""Tests for schedule caches."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+
+from . import TestCase
+
+from competitions.scheduler.cache import ScheduleCache
+from competitions.scheduler.roundrobin import RoundRobinScheduler
+from competitions.scheduler.templates import TemplateLibrary
+
+
+class TestScheduleCache(TestCase):
+
+    """Tests for schedule caches."""
+
+    def setUp(self):
+        """Set up a directory for cache files."""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'schedules.db')
+
+    def tearDown(self):
+        """Remove the directory for cache files."""
+        shutil.rmtree(self.directory)
+
+    def test_memory(self):
+        """Test that the least recently used schedules are dropped."""
+        cache = ScheduleCache(maxsize=2)
+        for key in ('a', 'b', 'c'):
+            cache.put((key,), [0], [[(0, 1)], [(1, 0)]])
+            cache.get(('a',), 1)
+        self.assertEqual(2, len(cache))
+        self.assertEqual(([0], [[(0, 1)], [(1, 0)]]), cache.get(('a',), 1))
+        self.assertIsNone(cache.get(('b',), 1))
+
+    def test_database(self):
+        """Test that schedules are kept in the database."""
+        cache = ScheduleCache(maxsize=0, path=self.path)
+        cache.put((4, None), [], [[(0, 1), (2, 3)], [(3, 0), (1, 2)]])
+        cache.close()
+        cache = ScheduleCache(path=self.path)
+        self.assertEqual(([], [[(0, 1), (2, 3)], [(3, 0), (1, 2)]]),
+                         cache.get((4, None), 2))
+        cache.clear()
+        self.assertIsNone(cache.get((4, None), 2))
+        cache.close()
+
+    def test_relabelled_schedules(self):
+        """Test that cached schedules are given the teams of each league."""
+        cache = ScheduleCache(path=self.path)
+        scheduler = RoundRobinScheduler(7, meetings=3, cache=cache)
+        schedule = scheduler.generate_schedule(rng=9)
+        home_teams = scheduler.home_teams
+        self.assertEqual(1, len(cache))
+        self.assertNotEqual(schedule, scheduler.generate_schedule(rng=10))
+
+        teams = ['A', 'B', 'C', 'D', 'E', 'F', 'G']
+        scheduler = RoundRobinScheduler(teams, meetings=3,
+                                        cache=ScheduleCache(path=self.path))
+        relabel = dict(zip(range(1, 8), teams))
+        relabel[None] = None
+        self.assertListEqual([[(relabel[home], relabel[away])
+                               for (home, away) in round]
+                              for round in schedule],
+                             scheduler.generate_schedule(rng=9))
+        self.assertEqual(tuple(relabel[home] for home in home_teams),
+                         scheduler.home_teams)
+        scheduler.cache.close()
+        cache.close()
+
+    def test_template_libraries(self):
+        """Test that schedules of different template libraries are kept apart."""
+        cache = ScheduleCache(path=self.path)
+        for count in (1, 4):
+            library = TemplateLibrary(count=count)
+            scheduler = RoundRobinScheduler(8, engine='template', cache=cache,
+                                            template_library=library)
+            uncached = RoundRobinScheduler(8, engine='template',
+                                           template_library=library)
+            for seed in range(5):
+                self.assertListEqual(uncached.generate_schedule(rng=seed),
+                                     scheduler.generate_schedule(rng=seed))
+        self.assertEqual(10, len(cache))
+        cache.close()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8  -*-
+"""Tests for schedule export."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import csv
+import io
+import json
+
+from . import TestCase, PY2
+
+from competitions.scheduler.export import export_csv, export_jsonl
+from competitions.scheduler.roundrobin import RoundRobinScheduler
+
+
+class TestExport(TestCase):
+
+    """Tests for schedule export."""
+
+    def setUp(self):
+        """Set up a schedule with a bye and awkward team names."""
+        self.rounds = [[('a, b', 'c "d"'), (None, 'e')],
+                       [('e', 'a, b'), ('c "d"', None)]]
+
+    def test_csv(self):
+        """Test that rows are written as CSV."""
+        output = io.StringIO()
+        self.assertEqual(4, export_csv(iter(self.rounds), output, buffer_size=3))
+        text = output.getvalue()
+        if PY2:
+            text = text.encode('utf-8')
+        rows = list(csv.reader(io.BytesIO(text) if PY2 else io.StringIO(text)))
+        self.assertEqual(['round', 'slot', 'home', 'away', 'bye'], rows[0])
+        self.assertEqual(['1', '1', 'a, b', 'c "d"', '0'], rows[1])
+        self.assertEqual(['1', '2', '', 'e', '1'], rows[2])
+        self.assertEqual(5, len(rows))
+
+    def test_csv_without_byes(self):
+        """Test that byes are left out."""
+        output = io.StringIO()
+        self.assertEqual(2, export_csv(self.rounds, output, header=False,
+                                       byes=False))
+        self.assertEqual('1,1,"a, b","c ""d""",0\n2,1,e,"a, b",0\n',
+                         output.getvalue())
+
+    def test_jsonl(self):
+        """Test that rows are written as JSON Lines."""
+        output = io.StringIO()
+        self.assertEqual(4, export_jsonl(self.rounds, output, buffer_size=1))
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual({'round': 2, 'slot': 2, 'home': 'c "d"', 'away': None,
+                          'bye': True}, rows[3])
+        self.assertEqual([1, 1, 2, 2], [row['round'] for row in rows])
+
+    def test_stream(self):
+        """Test exporting rounds as they are generated."""
+        scheduler = RoundRobinScheduler(5, meetings=2, engine='circle')
+        output = io.StringIO()
+        count = export_jsonl(scheduler.iter_schedule(rng=1), output)
+        self.assertEqual(scheduler.round_count * scheduler.match_count, count)
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(scheduler.round_count, sum(row['bye'] for row in rows))
+        self.assertEqual(scheduler.generate_schedule(rng=1)[0],
+                         [(row['home'], row['away']) for row in rows
+                          if row['round'] == 1])
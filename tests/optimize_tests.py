@@ -0,0 +1,65 @@
+# -*- coding: utf-8  -*-
+"""Tests for break minimization."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from . import TestCase
+
+from competitions.scheduler.optimize import count_breaks, minimize_breaks
+from competitions.scheduler.roundrobin import RoundRobinScheduler
+from competitions.scheduler.validation import validate_schedule
+
+
+class TestMinimizeBreaks(TestCase):
+
+    """Tests for break minimization."""
+
+    def test_count_breaks(self):
+        """Test counting breaks, leaving out byes."""
+        schedule = [[(1, 2), (3, None)],
+                    [(1, 3), (None, 2)],
+                    [(2, 3), (None, 1)],
+                    [(3, 2), (1, None)]]
+        self.assertEqual(2, count_breaks(schedule))
+        self.assertEqual(4, count_breaks(schedule, bye=4))
+
+    def test_minimize(self):
+        """Test that breaks are reduced and the schedule stays valid."""
+        for (teams, meetings) in ((8, 2), (7, 3)):
+            scheduler = RoundRobinScheduler(teams, meetings=meetings)
+            schedule = scheduler.generate_schedule(rng=8)
+            home_teams = list(scheduler.home_teams) or None
+            (rounds, breaks) = minimize_breaks(schedule, time_limit=None,
+                                               max_steps=3000, rng=1)
+            self.assertEqual(count_breaks(rounds), breaks)
+            self.assertLess(breaks, count_breaks(schedule))
+            self.assertEqual([], validate_schedule(rounds, scheduler.teams,
+                                                   meetings, home_teams))
+            self.assertEqual((rounds, breaks),
+                             minimize_breaks(schedule, time_limit=None,
+                                             max_steps=3000, rng=1))
+
+    def test_time_limit(self):
+        """Test that the search stops when the time runs out."""
+        scheduler = RoundRobinScheduler(12, meetings=2, engine='circle')
+        schedule = scheduler.generate_schedule(rng=2)
+        (rounds, breaks) = minimize_breaks(schedule, time_limit=0.2, rng=3)
+        self.assertLessEqual(breaks, count_breaks(schedule))
+        self.assertEqual(count_breaks(rounds), breaks)
+        self.assertRaises(ValueError, minimize_breaks, schedule,
+                          time_limit=None)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8  -*-
+"""Tests for parallel schedule generation."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import multiprocessing
+import pickle
+import random
+import threading
+
+from . import TestCase
+
+from competitions.scheduler import ScheduleGenerationFailed, parallel
+from competitions.scheduler.roundrobin import DoubleRoundRobinScheduler
+from competitions.scheduler.scheduler import GenerationObserver, RetryPolicy
+
+
+class TestBatchGeneration(TestCase):
+
+    """Tests for generating batches of schedules."""
+
+    def setUp(self):
+        """Set up a scheduler."""
+        self.scheduler = DoubleRoundRobinScheduler(6)
+
+    def test_reproducible_batch(self):
+        """Test that batches do not depend on the number of workers."""
+        serial = list(self.scheduler.generate_schedules(6, workers=1, seed=8))
+        self.assertEqual(parallel.schedule_seeds(6, 8),
+                         [seed for (seed, schedule) in serial])
+        batch = self.scheduler.generate_schedules(6, workers=2, seed=8)
+        self.assertCountEqual(serial, list(batch))
+
+    def test_schedule_seeds(self):
+        """Test generating a schedule of a batch again from its seed."""
+        state = random.getstate()
+        (seed, schedule) = next(self.scheduler.generate_schedules(
+            1, workers=1, engine='backtrack'))
+        self.assertEqual(state, random.getstate())
+        random.seed(seed)
+        self.assertListEqual(schedule,
+                             self.scheduler.generate_schedule(engine='backtrack'))
+
+
+class TestRaceGeneration(TestCase):
+
+    """Tests for racing schedule generation attempts."""
+
+    def setUp(self):
+        """Set up a scheduler."""
+        self.scheduler = DoubleRoundRobinScheduler(12)
+
+    def test_race(self):
+        """Test generating a schedule again from the winning seed."""
+        for workers in (1, 2):
+            (seed, retry, schedule) = self.scheduler.race_schedule(
+                workers, seed=5, retry=RetryPolicy(round_tries=2, backoff=2))
+            self.assertEqual(1, retry.max_attempts)
+            self.assertListEqual(schedule, self.scheduler.generate_schedule(
+                rng=seed, retry=retry))
+            self.assertEqual([], multiprocessing.active_children())
+
+    def test_failed_race(self):
+        """Test that every attempt allowed by the retry policy is made."""
+        for workers in (1, 2):
+            with self.assertRaises(ScheduleGenerationFailed) as context:
+                self.scheduler.race_schedule(
+                    workers, seed=5, retry=RetryPolicy(3, round_tries=0))
+            self.assertEqual(3, context.exception.attempts)
+
+    def test_unpicklable_scheduler(self):
+        """Test that a scheduler that cannot be sent to workers is an error."""
+        observer = GenerationObserver()
+        observer.lock = threading.Lock()
+        self.scheduler.observer = observer
+        self.assertRaises((TypeError, pickle.PicklingError),
+                          self.scheduler.race_schedule, 2, seed=1)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8  -*-
+"""Tests for match pools."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import itertools
+
+from . import TestCase
+
+from competitions.scheduler.pool import MatchPool
+
+
+class TestMatchPool(TestCase):
+
+    """Tests for match pools."""
+
+    def setUp(self):
+        """Set up a pool with repeated matches."""
+        self.matches = list(itertools.permutations(range(1, 5), 2)) * 2
+        self.pool = MatchPool(self.matches)
+
+    def test_contents(self):
+        """Test adding and removing matches."""
+        pool = self.pool
+        self.assertEqual(len(self.matches), len(pool))
+        self.assertCountEqual(self.matches, list(pool))
+        pool.remove((1, 2))
+        self.assertIn((1, 2), pool)
+        self.assertEqual(1, pool.count((1, 2)))
+        pool.remove((1, 2))
+        self.assertNotIn((1, 2), pool)
+        self.assertRaises(KeyError, pool.remove, (1, 2))
+        pool.add((1, 2))
+        self.assertEqual(1, pool.count((1, 2)))
+        self.assertEqual(len(self.matches) - 1, len(pool))
+
+    def test_random_order(self):
+        """Test iterating over and picking matches in random order."""
+        self.assertCountEqual(self.matches, list(self.pool.iter_random()))
+        self.assertCountEqual(self.matches, list(self.pool))
+        self.assertIn(self.pool.pick(), self.matches)
+        self.assertRaises(IndexError, MatchPool().pick)
+
+    def test_rollback(self):
+        """Test rolling back changes to a snapshot."""
+        pool = self.pool
+        snapshot = pool.snapshot()
+        for match in self.matches[:5]:
+            pool.remove(match)
+        pool.add((5, 6))
+        later = pool.snapshot()
+        pool.remove((4, 3))
+        pool.rollback(later)
+        self.assertEqual(2, pool.count((4, 3)))
+        pool.rollback(snapshot)
+        self.assertCountEqual(self.matches, list(pool))
@@ -0,0 +1,102 @@
+# -*- coding: utf-8  -*-
+"""Tests for schedule repair."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from . import TestCase
+
+from competitions.scheduler import ScheduleGenerationFailed
+from competitions.scheduler.repair import repair_schedule
+from competitions.scheduler.roundrobin import RoundRobinScheduler
+from competitions.scheduler.validation import validate_schedule
+
+
+class TestRepairSchedule(TestCase):
+
+    """Tests for schedule repair."""
+
+    def setUp(self):
+        """Set up a schedule to repair."""
+        self.scheduler = RoundRobinScheduler(9, meetings=3)
+        self.schedule = self.scheduler.generate_schedule(rng=6)
+        self.home_teams = list(self.scheduler.home_teams)
+
+    def assertValid(self, schedule):
+        """Assert that a repaired schedule is valid."""
+        self.assertEqual([], validate_schedule(schedule, self.scheduler.teams,
+                                               3, self.home_teams))
+
+    def test_postpone(self):
+        """Test that a postponed match is moved with few changes."""
+        match = self.schedule[4][2]
+        repaired = repair_schedule(self.schedule, [(4, match)])
+        self.assertValid(repaired)
+        self.assertNotIn(match, repaired[4])
+        changed = [number for number in range(len(self.schedule))
+                   if repaired[number] != self.schedule[number]]
+        self.assertEqual(2, len(changed))
+        self.assertIn(4, changed)
+        self.assertIn(match, repaired[changed[0] + changed[1] - 4])
+
+    def test_frozen(self):
+        """Test that frozen rounds and matches are not changed."""
+        last = set(frozenset(match) for match in self.schedule[-1])
+        match = next(match for match in self.schedule[0]
+                     if frozenset(match) not in last)
+        frozen_match = next(match for match in self.schedule[0]
+                            if frozenset(match) in last)
+        frozen_rounds = range(1, len(self.schedule) - 1)
+        repaired = repair_schedule(self.schedule, [(0, match)],
+                                   frozen_rounds=frozen_rounds,
+                                   frozen_matches=[(0, frozen_match)])
+        self.assertValid(repaired)
+        self.assertEqual(self.schedule[1:-1], repaired[1:-1])
+        self.assertIn(frozen_match, repaired[0])
+        self.assertIn(match, repaired[-1])
+
+    def test_move_round(self):
+        """Test moving every match out of a round."""
+        disrupted = [(3, match) for match in self.schedule[3]]
+        repaired = repair_schedule(self.schedule, disrupted, rounds=range(3, 12))
+        self.assertValid(repaired)
+        self.assertFalse(set(self.schedule[3]) & set(repaired[3]))
+        self.assertEqual(self.schedule[:3], repaired[:3])
+
+    def test_return_match(self):
+        """Test that teams do not meet again with home and away reversed."""
+        for teams in (6, 8):
+            scheduler = RoundRobinScheduler(teams, meetings=2, engine='circle')
+            schedule = scheduler.generate_schedule(rng=3)
+            for disrupted in ([(0, schedule[0][0])],
+                              [(0, match) for match in schedule[0]]):
+                repaired = repair_schedule(schedule, disrupted)
+                self.assertEqual([], validate_schedule(repaired, scheduler.teams, 2))
+                pairs = set(frozenset(match) for match in repaired[0])
+                for (number, match) in disrupted:
+                    self.assertNotIn(frozenset(match), pairs)
+
+    def test_failure(self):
+        """Test that a match is not moved if every round is frozen."""
+        match = self.schedule[2][0]
+        self.assertRaises(ScheduleGenerationFailed, repair_schedule,
+                          self.schedule, [(2, match)],
+                          frozen_rounds=[0, 1] + list(range(3, 27)))
+        self.assertRaises(ValueError, repair_schedule, self.schedule,
+                          [(3, match)])
+        self.assertRaises(ValueError, repair_schedule, self.schedule,
+                          [(2, match)], frozen_rounds=[2])
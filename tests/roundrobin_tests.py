@@ -21,11 +21,21 @@ from __future__ import unicode_literals
 import collections
 import itertools
 import random
-# import unittest
+import unittest
 
 from . import TestCase, PY2, PY3
 
-from competitions.scheduler import ScheduleGenerationFailed
+from competitions.scheduler import (
+    GenerationAborted,
+    ScheduleGenerationFailed,
+    vectorized,
+)
+from competitions.scheduler.scheduler import (
+    GenerationObserver,
+    GenerationStats,
+    RetryPolicy,
+)
+from competitions.scheduler.templates import TemplateLibrary
 from competitions.scheduler.roundrobin import (
     RoundRobinScheduler,
     SingleRoundRobinScheduler,
@@ -62,9 +72,10 @@ class TestOddRoundRobin(TestCase):
     """Tests for odd-numbered round-robin scheduling."""
 
     def _test_matrix_generation(self, meetings, teams,
-                                known_home_teams=None):
+                                known_home_teams=None, backend='python'):
         """Test odd-numbered round-robin matrix generation."""
-        scheduler = RoundRobinScheduler(teams, meetings=meetings)
+        scheduler = RoundRobinScheduler(teams, meetings=meetings,
+                                        matrix_backend=backend)
         self.assertSequenceEqual(scheduler.home_teams, (),
                                  'Default home teams not returned.')
         matrix = scheduler.generate_matrix(home_teams=known_home_teams)
@@ -123,6 +134,48 @@ class TestOddRoundRobin(TestCase):
                 for home_teams in itertools.permutations(team_list, half):
                     self._test_matrix_generation(meetings, teams, home_teams)
 
+    def test_large_matrix_generation(self):
+        """Test odd-numbered round-robin matrix generation for large leagues."""
+        self._test_matrix_generation(1, 301)
+        self._test_matrix_generation(1, 400)
+
+    def test_invalid_home_teams(self):
+        """Test matrix generation with the wrong number of home teams."""
+        scheduler = RoundRobinScheduler(6, meetings=1)
+        self.assertRaises(ValueError, scheduler.generate_matrix,
+                          home_teams=(1, 2))
+
+    @unittest.skipIf(vectorized.numpy is None, 'NumPy is not installed.')
+    def test_numpy_matrix_generation(self):
+        """Test odd-numbered round-robin matrix generation with NumPy."""
+        for teams in range(3, 21):
+            self._test_matrix_generation(1, teams, backend='numpy')
+            if teams > 6:
+                continue
+            team_list = list(range(1, teams + 1))
+            half = int(teams / 2)
+            if teams % 2 == 1:
+                team_list.append(None)
+                half += 1
+            for home_teams in itertools.permutations(team_list, half):
+                self._test_matrix_generation(1, teams, home_teams, 'numpy')
+
+    @unittest.skipIf(vectorized.numpy is None, 'NumPy is not installed.')
+    def test_numpy_matrix_array(self):
+        """Test converting NumPy matrices to lists."""
+        scheduler = RoundRobinScheduler(5, meetings=1)
+        matrix = scheduler.generate_matrix_array()
+        self.assertEqual((6, 6), matrix.shape)
+        self.assertEqual(vectorized.numpy.int8, matrix.dtype)
+        self.assertListEqual([[None if cell < 0 else bool(cell) for cell in row]
+                              for row in matrix.tolist()],
+                             vectorized.matrix_to_list(matrix))
+        for engine in RoundRobinScheduler.ENGINES:
+            scheduler = RoundRobinScheduler(9, meetings=3, engine=engine,
+                                            matrix_backend='numpy')
+            self.assertEqual(scheduler.round_count,
+                             len(scheduler.generate_schedule()))
+
     def _test_match_generation(self, teams, evens=0, known_home_teams=None):
         """Test odd-numbered round-robin match generation."""
         meetings = 2 * evens + 1
@@ -239,30 +292,30 @@ class TestSingleRoundRobin(TestCase):
         """Test single round-robin schedule generation."""
         scheduler = SingleRoundRobinScheduler(8)
         # Failed attempt
-        random.seed(17)
+        random.seed(20)
         self.assertRaises(ScheduleGenerationFailed,
                           scheduler.generate_schedule, try_once=True)
         # Successful attempt
-        random.seed(4)
+        random.seed(5)
         if PY2:
             expected_schedule = [
-                [(2, 5), (8, 6), (7, 1), (3, 4)],
-                [(5, 8), (3, 7), (1, 2), (4, 6)],
-                [(5, 4), (6, 3), (2, 7), (8, 1)],
-                [(7, 8), (6, 5), (2, 4), (3, 1)],
-                [(6, 2), (3, 8), (7, 5), (1, 4)],
-                [(7, 6), (2, 3), (4, 8), (1, 5)],
-                [(5, 3), (1, 6), (4, 7), (8, 2)]
+                [(7, 6), (4, 2), (5, 1), (8, 3)],
+                [(7, 1), (5, 6), (2, 3), (8, 4)],
+                [(4, 7), (2, 8), (6, 1), (3, 5)],
+                [(1, 3), (6, 4), (8, 5), (2, 7)],
+                [(3, 4), (1, 2), (7, 5), (8, 6)],
+                [(1, 8), (5, 4), (3, 7), (6, 2)],
+                [(5, 2), (6, 3), (7, 8), (4, 1)]
             ]
         elif PY3:
             expected_schedule = [
-                [(5, 7), (8, 4), (3, 6), (1, 2)],
-                [(4, 2), (6, 8), (1, 5), (3, 7)],
-                [(8, 1), (6, 4), (3, 5), (7, 2)],
-                [(4, 1), (2, 3), (5, 8), (6, 7)],
-                [(8, 3), (2, 6), (4, 5), (7, 1)],
-                [(8, 2), (1, 3), (5, 6), (4, 7)],
-                [(1, 6), (3, 4), (7, 8), (2, 5)]
+                [(1, 7), (5, 6), (8, 2), (3, 4)],
+                [(7, 8), (6, 1), (2, 4), (3, 5)],
+                [(8, 1), (3, 7), (2, 6), (4, 5)],
+                [(3, 1), (6, 8), (5, 2), (4, 7)],
+                [(6, 7), (5, 8), (2, 3), (1, 4)],
+                [(8, 3), (5, 1), (4, 6), (7, 2)],
+                [(7, 5), (1, 2), (6, 3), (8, 4)]
             ]
         schedule = scheduler.generate_schedule(try_once=True)
         self.assertListEqual(expected_schedule, schedule,
@@ -272,26 +325,26 @@ class TestSingleRoundRobin(TestCase):
     def test_repeated_schedule_generation(self):
         """Test repeated single round-robin schedule generation."""
         scheduler = SingleRoundRobinScheduler(8)
-        random.seed(17)
+        random.seed(20)
         if PY2:
             expected_schedule = [
-                [(7, 5), (3, 6), (2, 1), (4, 8)],
-                [(7, 3), (6, 5), (1, 8), (4, 2)],
-                [(5, 3), (8, 6), (1, 4), (2, 7)],
-                [(1, 6), (5, 2), (7, 8), (3, 4)],
-                [(8, 5), (2, 3), (6, 4), (7, 1)],
-                [(4, 7), (8, 3), (6, 2), (5, 1)],
-                [(6, 7), (2, 8), (3, 1), (4, 5)]
+                [(4, 2), (5, 1), (6, 3), (8, 7)],
+                [(6, 5), (4, 8), (7, 2), (3, 1)],
+                [(1, 7), (5, 3), (4, 6), (2, 8)],
+                [(6, 2), (5, 4), (8, 1), (7, 3)],
+                [(1, 4), (3, 2), (6, 8), (5, 7)],
+                [(2, 5), (7, 4), (1, 6), (8, 3)],
+                [(2, 1), (8, 5), (7, 6), (3, 4)]
             ]
         elif PY3:
             expected_schedule = [
-                [(8, 7), (1, 6), (3, 5), (4, 2)],
-                [(2, 6), (4, 3), (7, 1), (5, 8)],
-                [(7, 3), (4, 1), (6, 8), (2, 5)],
-                [(7, 4), (3, 1), (5, 6), (8, 2)],
-                [(7, 2), (3, 6), (1, 5), (8, 4)],
-                [(6, 4), (8, 3), (2, 1), (5, 7)],
-                [(2, 3), (6, 7), (5, 4), (1, 8)]
+                [(2, 5), (3, 6), (8, 1), (7, 4)],
+                [(2, 8), (6, 4), (1, 7), (3, 5)],
+                [(5, 1), (4, 8), (6, 2), (3, 7)],
+                [(1, 6), (4, 3), (5, 8), (7, 2)],
+                [(1, 3), (7, 5), (4, 2), (8, 6)],
+                [(8, 7), (6, 5), (3, 2), (1, 4)],
+                [(8, 3), (6, 7), (5, 4), (2, 1)]
             ]
         schedule = scheduler.generate_schedule()
         self.assertListEqual(expected_schedule, schedule,
@@ -307,44 +360,44 @@ class TestDoubleRoundRobin(TestCase):
         """Test double round-robin schedule generation."""
         scheduler = DoubleRoundRobinScheduler(8)
         # Failed attempt
-        random.seed(5)
+        random.seed(6)
         self.assertRaises(ScheduleGenerationFailed,
                           scheduler.generate_schedule, try_once=True)
         # Successful attempt
         random.seed(2)
         if PY2:
             expected_schedule = [
-                [(5, 6), (7, 4), (3, 8), (1, 2)],
-                [(5, 1), (8, 4), (3, 6), (2, 7)],
-                [(3, 1), (6, 5), (4, 8), (7, 2)],
-                [(8, 5), (3, 2), (1, 4), (7, 6)],
-                [(1, 8), (7, 3), (2, 6), (4, 5)],
-                [(8, 1), (6, 3), (5, 7), (4, 2)],
-                [(6, 1), (2, 5), (4, 3), (8, 7)],
-                [(2, 4), (6, 8), (7, 5), (1, 3)],
-                [(5, 4), (2, 1), (8, 6), (3, 7)],
-                [(4, 7), (2, 8), (3, 5), (1, 6)],
-                [(4, 6), (1, 7), (2, 3), (5, 8)],
-                [(5, 3), (7, 8), (6, 2), (4, 1)],
-                [(7, 1), (5, 2), (6, 4), (8, 3)],
-                [(1, 5), (3, 4), (8, 2), (6, 7)]
+                [(8, 5), (1, 6), (7, 2), (3, 4)],
+                [(8, 2), (6, 3), (7, 4), (1, 5)],
+                [(4, 1), (7, 3), (2, 8), (5, 6)],
+                [(2, 7), (6, 1), (3, 8), (4, 5)],
+                [(6, 2), (3, 7), (8, 1), (5, 4)],
+                [(5, 1), (4, 3), (7, 8), (2, 6)],
+                [(7, 1), (2, 3), (8, 4), (6, 5)],
+                [(6, 7), (3, 5), (2, 4), (1, 8)],
+                [(6, 4), (5, 8), (1, 7), (3, 2)],
+                [(2, 5), (4, 7), (3, 1), (6, 8)],
+                [(7, 5), (1, 2), (4, 8), (3, 6)],
+                [(8, 7), (5, 3), (4, 6), (2, 1)],
+                [(8, 6), (1, 3), (5, 7), (4, 2)],
+                [(7, 6), (1, 4), (5, 2), (8, 3)]
             ]
         elif PY3:
             expected_schedule = [
-                [(3, 2), (4, 1), (8, 5), (6, 7)],
-                [(3, 8), (1, 6), (7, 5), (2, 4)],
-                [(6, 8), (4, 7), (2, 3), (5, 1)],
-                [(2, 1), (5, 7), (3, 6), (8, 4)],
-                [(5, 4), (6, 2), (3, 7), (1, 8)],
-                [(4, 3), (7, 2), (5, 6), (8, 1)],
-                [(3, 1), (5, 2), (8, 6), (7, 4)],
-                [(7, 1), (6, 4), (5, 3), (2, 8)],
-                [(8, 7), (4, 6), (3, 5), (1, 2)],
-                [(3, 4), (7, 8), (6, 1), (2, 5)],
-                [(1, 4), (7, 3), (5, 8), (2, 6)],
-                [(1, 3), (2, 7), (4, 8), (6, 5)],
-                [(4, 5), (8, 2), (6, 3), (1, 7)],
-                [(1, 5), (4, 2), (7, 6), (8, 3)]
+                [(8, 7), (1, 5), (4, 3), (6, 2)],
+                [(3, 5), (6, 8), (1, 7), (2, 4)],
+                [(1, 3), (5, 2), (7, 8), (6, 4)],
+                [(3, 6), (4, 7), (2, 5), (1, 8)],
+                [(3, 1), (5, 7), (2, 6), (4, 8)],
+                [(5, 4), (8, 1), (2, 7), (6, 3)],
+                [(2, 8), (6, 5), (3, 7), (1, 4)],
+                [(3, 2), (7, 6), (5, 8), (4, 1)],
+                [(3, 4), (8, 6), (1, 2), (7, 5)],
+                [(7, 3), (1, 6), (4, 2), (8, 5)],
+                [(6, 1), (5, 3), (8, 2), (7, 4)],
+                [(3, 8), (6, 7), (2, 1), (4, 5)],
+                [(2, 3), (5, 6), (8, 4), (7, 1)],
+                [(7, 2), (8, 3), (5, 1), (4, 6)]
             ]
         schedule = scheduler.generate_schedule(try_once=True)
         self.assertListEqual(expected_schedule, schedule,
@@ -354,40 +407,40 @@ class TestDoubleRoundRobin(TestCase):
     def test_repeated_schedule_generation(self):
         """Test repeated double round-robin schedule generation."""
         scheduler = DoubleRoundRobinScheduler(8)
-        random.seed(5)
+        random.seed(6)
         if PY2:
             expected_schedule = [
-                [(8, 4), (3, 7), (1, 6), (2, 5)],
-                [(7, 1), (6, 4), (8, 2), (5, 3)],
-                [(1, 8), (2, 4), (7, 6), (3, 5)],
-                [(2, 6), (5, 7), (4, 3), (8, 1)],
-                [(8, 5), (1, 3), (7, 4), (6, 2)],
-                [(2, 7), (4, 8), (5, 1), (3, 6)],
-                [(1, 7), (6, 5), (2, 8), (3, 4)],
-                [(1, 4), (8, 3), (5, 2), (6, 7)],
-                [(2, 3), (4, 1), (6, 8), (7, 5)],
-                [(1, 2), (5, 8), (7, 3), (4, 6)],
-                [(4, 2), (6, 3), (1, 5), (7, 8)],
-                [(4, 5), (8, 7), (3, 2), (6, 1)],
-                [(2, 1), (4, 7), (3, 8), (5, 6)],
-                [(7, 2), (8, 6), (5, 4), (3, 1)]
+                [(5, 8), (1, 7), (6, 3), (4, 2)],
+                [(5, 6), (3, 1), (7, 8), (2, 4)],
+                [(7, 3), (4, 1), (8, 2), (6, 5)],
+                [(4, 7), (6, 1), (3, 2), (8, 5)],
+                [(5, 4), (3, 7), (2, 1), (8, 6)],
+                [(8, 4), (5, 7), (2, 6), (1, 3)],
+                [(2, 8), (1, 6), (4, 3), (7, 5)],
+                [(5, 2), (1, 8), (3, 6), (7, 4)],
+                [(3, 5), (1, 2), (4, 8), (6, 7)],
+                [(6, 4), (5, 3), (8, 1), (7, 2)],
+                [(7, 6), (3, 8), (1, 4), (2, 5)],
+                [(2, 7), (8, 3), (5, 1), (4, 6)],
+                [(6, 8), (4, 5), (7, 1), (2, 3)],
+                [(6, 2), (1, 5), (3, 4), (8, 7)]
             ]
         elif PY3:
             expected_schedule = [
-                [(4, 3), (8, 2), (6, 7), (5, 1)],
-                [(5, 6), (2, 4), (3, 8), (1, 7)],
-                [(6, 5), (4, 8), (1, 3), (7, 2)],
-                [(8, 4), (1, 2), (5, 3), (7, 6)],
-                [(8, 5), (2, 3), (7, 1), (4, 6)],
-                [(4, 5), (8, 6), (2, 7), (3, 1)],
-                [(2, 8), (3, 5), (1, 6), (7, 4)],
-                [(6, 2), (1, 8), (3, 4), (7, 5)],
-                [(5, 4), (8, 7), (2, 1), (6, 3)],
-                [(8, 1), (3, 6), (4, 7), (2, 5)],
-                [(4, 1), (5, 2), (7, 3), (6, 8)],
-                [(6, 4), (7, 8), (1, 5), (3, 2)],
-                [(8, 3), (5, 7), (2, 6), (1, 4)],
-                [(5, 8), (3, 7), (6, 1), (4, 2)]
+                [(7, 6), (8, 5), (4, 3), (1, 2)],
+                [(3, 5), (2, 7), (8, 4), (1, 6)],
+                [(6, 4), (7, 5), (3, 1), (2, 8)],
+                [(6, 1), (3, 2), (5, 8), (7, 4)],
+                [(6, 5), (7, 3), (2, 4), (1, 8)],
+                [(3, 4), (5, 2), (1, 7), (8, 6)],
+                [(4, 7), (1, 5), (2, 6), (8, 3)],
+                [(4, 1), (6, 2), (5, 7), (3, 8)],
+                [(5, 4), (7, 2), (6, 8), (1, 3)],
+                [(8, 1), (4, 6), (2, 5), (3, 7)],
+                [(4, 8), (5, 6), (7, 1), (2, 3)],
+                [(5, 3), (8, 2), (6, 7), (1, 4)],
+                [(7, 8), (4, 5), (2, 1), (6, 3)],
+                [(8, 7), (3, 6), (5, 1), (4, 2)]
             ]
         schedule = scheduler.generate_schedule()
         self.assertListEqual(expected_schedule, schedule,
@@ -403,58 +456,58 @@ class TestTripleRoundRobin(TestCase):
         """Test triple round-robin schedule generation."""
         scheduler = TripleRoundRobinScheduler(8)
         # Failed attempt
-        random.seed(12)
+        random.seed(15)
         self.assertRaises(ScheduleGenerationFailed,
                           scheduler.generate_schedule, try_once=True)
         # Successful attempt
-        random.seed(1)
+        random.seed(3)
         if PY2:
             expected_schedule = [
-                [(6, 5), (1, 7), (3, 4), (2, 8)],
-                [(7, 5), (4, 3), (8, 6), (1, 2)],
-                [(1, 8), (5, 3), (7, 2), (6, 4)],
-                [(5, 8), (3, 1), (4, 6), (7, 2)],
-                [(5, 4), (8, 6), (1, 2), (3, 7)],
-                [(6, 7), (3, 8), (2, 5), (4, 1)],
-                [(4, 3), (5, 1), (2, 7), (6, 8)],
-                [(7, 4), (2, 3), (6, 5), (1, 8)],
-                [(5, 8), (1, 3), (4, 7), (6, 2)],
-                [(4, 5), (7, 6), (3, 8), (2, 1)],
-                [(3, 5), (7, 1), (8, 2), (4, 6)],
-                [(1, 4), (6, 3), (7, 5), (2, 8)],
-                [(7, 8), (1, 5), (4, 2), (3, 6)],
-                [(7, 3), (5, 2), (8, 4), (1, 6)],
-                [(3, 7), (4, 8), (2, 6), (1, 5)],
-                [(2, 4), (5, 7), (6, 1), (8, 3)],
-                [(3, 2), (8, 5), (4, 1), (7, 6)],
-                [(5, 4), (8, 7), (6, 1), (2, 3)],
-                [(5, 3), (6, 2), (4, 7), (8, 1)],
-                [(5, 6), (8, 7), (3, 1), (2, 4)],
-                [(8, 4), (5, 2), (1, 7), (3, 6)]
+                [(7, 6), (8, 3), (4, 5), (1, 2)],
+                [(2, 1), (4, 7), (5, 6), (8, 3)],
+                [(5, 4), (6, 8), (3, 1), (7, 2)],
+                [(1, 3), (2, 6), (8, 4), (5, 7)],
+                [(7, 1), (3, 4), (6, 2), (5, 8)],
+                [(2, 7), (5, 1), (4, 3), (6, 8)],
+                [(1, 8), (2, 3), (7, 5), (6, 4)],
+                [(1, 6), (7, 3), (4, 8), (2, 5)],
+                [(8, 6), (1, 7), (5, 2), (3, 4)],
+                [(3, 7), (4, 1), (2, 8), (6, 5)],
+                [(6, 1), (7, 5), (4, 2), (3, 8)],
+                [(6, 7), (2, 8), (5, 4), (3, 1)],
+                [(1, 5), (8, 2), (4, 7), (3, 6)],
+                [(8, 7), (5, 1), (3, 6), (2, 4)],
+                [(1, 8), (7, 2), (5, 3), (4, 6)],
+                [(1, 4), (7, 6), (8, 5), (2, 3)],
+                [(5, 2), (7, 3), (4, 8), (6, 1)],
+                [(6, 5), (4, 1), (3, 2), (7, 8)],
+                [(8, 1), (2, 6), (7, 4), (3, 5)],
+                [(6, 3), (1, 7), (8, 5), (2, 4)],
+                [(4, 6), (8, 7), (3, 5), (1, 2)]
             ]
         elif PY3:
             expected_schedule = [
-                [(6, 5), (4, 3), (8, 1), (7, 2)],
-                [(7, 4), (6, 2), (8, 5), (3, 1)],
-                [(1, 5), (3, 2), (7, 4), (8, 6)],
-                [(7, 8), (6, 4), (3, 5), (1, 2)],
-                [(4, 7), (2, 8), (3, 1), (5, 6)],
-                [(3, 6), (8, 7), (4, 5), (1, 2)],
-                [(5, 7), (3, 4), (2, 6), (8, 1)],
-                [(2, 4), (6, 3), (5, 7), (1, 8)],
-                [(8, 2), (7, 1), (5, 3), (4, 6)],
-                [(7, 3), (1, 5), (8, 4), (2, 6)],
-                [(6, 8), (7, 2), (5, 4), (1, 3)],
-                [(1, 7), (8, 5), (2, 3), (4, 6)],
-                [(2, 7), (1, 6), (4, 5), (8, 3)],
-                [(6, 7), (5, 2), (8, 3), (4, 1)],
-                [(6, 3), (4, 8), (7, 5), (2, 1)],
-                [(1, 4), (3, 7), (5, 6), (2, 8)],
-                [(2, 4), (6, 1), (5, 8), (3, 7)],
-                [(5, 3), (1, 6), (4, 2), (7, 8)],
-                [(5, 2), (3, 4), (6, 8), (1, 7)],
-                [(3, 2), (8, 4), (6, 7), (5, 1)],
-                [(7, 6), (4, 1), (3, 8), (2, 5)]
+                [(3, 5), (2, 7), (1, 6), (4, 8)],
+                [(5, 7), (6, 4), (8, 1), (2, 3)],
+                [(2, 1), (5, 8), (7, 3), (4, 6)],
+                [(6, 5), (7, 1), (4, 3), (2, 8)],
+                [(3, 4), (5, 6), (1, 2), (7, 8)],
+                [(4, 5), (7, 3), (1, 2), (6, 8)],
+                [(7, 2), (8, 4), (6, 3), (1, 5)],
+                [(7, 6), (5, 4), (3, 2), (1, 8)],
+                [(5, 2), (6, 3), (4, 1), (8, 7)],
+                [(8, 4), (1, 7), (3, 6), (2, 5)],
+                [(4, 7), (6, 1), (3, 5), (2, 8)],
+                [(5, 8), (4, 2), (1, 3), (6, 7)],
+                [(8, 3), (2, 6), (5, 7), (1, 4)],
+                [(3, 8), (2, 4), (1, 7), (5, 6)],
+                [(4, 6), (8, 7), (2, 3), (5, 1)],
+                [(6, 8), (7, 2), (4, 5), (3, 1)],
+                [(7, 4), (2, 6), (5, 1), (3, 8)],
+                [(7, 6), (4, 2), (8, 5), (3, 1)],
+                [(8, 2), (7, 5), (6, 1), (4, 3)],
+                [(2, 5), (1, 4), (8, 6), (3, 7)],
+                [(7, 4), (5, 3), (6, 2), (8, 1)]
             ]
         schedule = scheduler.generate_schedule(try_once=True)
         self.assertListEqual(expected_schedule, schedule,
@@ -464,54 +517,54 @@ class TestTripleRoundRobin(TestCase):
     def test_repeated_schedule_generation(self):
         """Test repeated triple round-robin schedule generation."""
         scheduler = TripleRoundRobinScheduler(8)
-        random.seed(12)
+        random.seed(15)
         if PY2:
             expected_schedule = [
-                [(2, 3), (4, 1), (7, 5), (6, 8)],
-                [(2, 1), (8, 7), (6, 3), (5, 4)],
-                [(5, 6), (1, 7), (4, 8), (3, 2)],
-                [(3, 5), (7, 6), (8, 2), (1, 4)],
-                [(5, 7), (3, 6), (4, 2), (8, 1)],
-                [(1, 5), (7, 3), (2, 8), (4, 6)],
-                [(5, 8), (6, 1), (3, 4), (2, 7)],
-                [(3, 6), (8, 4), (7, 1), (2, 5)],
-                [(4, 5), (3, 8), (7, 1), (6, 2)],
-                [(4, 3), (8, 6), (1, 5), (2, 7)],
-                [(7, 6), (4, 2), (8, 3), (5, 1)],
-                [(2, 6), (4, 7), (5, 3), (1, 8)],
-                [(3, 2), (1, 6), (5, 8), (4, 7)],
-                [(3, 7), (6, 1), (2, 4), (8, 5)],
-                [(1, 3), (7, 4), (6, 5), (2, 8)],
-                [(4, 3), (5, 7), (6, 2), (1, 8)],
-                [(8, 3), (7, 2), (6, 5), (4, 1)],
-                [(2, 1), (5, 3), (8, 4), (6, 7)],
-                [(1, 3), (7, 8), (6, 4), (5, 2)],
-                [(2, 5), (7, 8), (3, 1), (6, 4)],
-                [(8, 6), (5, 4), (3, 7), (1, 2)]
+                [(7, 4), (3, 6), (2, 5), (8, 1)],
+                [(8, 4), (7, 1), (6, 5), (2, 3)],
+                [(4, 1), (5, 7), (3, 8), (2, 6)],
+                [(2, 7), (6, 4), (5, 3), (1, 8)],
+                [(8, 5), (1, 6), (2, 4), (7, 3)],
+                [(5, 1), (2, 3), (4, 8), (6, 7)],
+                [(8, 6), (7, 3), (2, 4), (5, 1)],
+                [(3, 1), (5, 2), (6, 4), (7, 8)],
+                [(6, 3), (8, 2), (4, 5), (1, 7)],
+                [(4, 7), (8, 3), (2, 1), (6, 5)],
+                [(1, 3), (5, 8), (7, 6), (4, 2)],
+                [(4, 6), (1, 5), (2, 7), (8, 3)],
+                [(4, 3), (1, 2), (7, 8), (5, 6)],
+                [(5, 7), (1, 4), (8, 2), (3, 6)],
+                [(7, 2), (6, 1), (3, 4), (5, 8)],
+                [(2, 8), (3, 7), (4, 5), (1, 6)],
+                [(7, 5), (6, 2), (1, 8), (4, 3)],
+                [(6, 8), (4, 7), (3, 1), (5, 2)],
+                [(3, 5), (6, 2), (8, 7), (1, 4)],
+                [(5, 4), (7, 1), (3, 2), (8, 6)],
+                [(3, 5), (8, 4), (7, 6), (1, 2)]
             ]
         elif PY3:
             expected_schedule = [
-                [(2, 5), (4, 1), (6, 7), (8, 3)],
-                [(8, 4), (3, 6), (1, 5), (2, 7)],
-                [(3, 2), (8, 5), (4, 1), (7, 6)],
-                [(8, 1), (2, 5), (4, 6), (3, 7)],
-                [(1, 7), (5, 3), (6, 8), (2, 4)],
-                [(7, 2), (3, 6), (8, 1), (5, 4)],
-                [(5, 7), (6, 2), (4, 3), (1, 8)],
-                [(5, 8), (6, 1), (4, 7), (2, 3)],
-                [(3, 1), (2, 4), (7, 8), (5, 6)],
-                [(8, 4), (7, 1), (6, 2), (5, 3)],
-                [(7, 3), (8, 5), (1, 6), (4, 2)],
-                [(5, 6), (7, 4), (3, 1), (8, 2)],
-                [(8, 2), (4, 7), (6, 3), (1, 5)],
-                [(1, 7), (8, 6), (4, 5), (2, 3)],
-                [(7, 8), (1, 4), (2, 6), (3, 5)],
-                [(1, 3), (6, 4), (8, 7), (5, 2)],
-                [(3, 8), (1, 2), (4, 6), (5, 7)],
-                [(5, 1), (2, 8), (3, 4), (6, 7)],
-                [(2, 1), (7, 5), (3, 4), (6, 8)],
-                [(4, 5), (7, 2), (6, 1), (3, 8)],
-                [(6, 5), (7, 3), (4, 8), (1, 2)]
+                [(7, 5), (6, 3), (4, 8), (1, 2)],
+                [(7, 6), (5, 4), (2, 8), (1, 3)],
+                [(7, 4), (3, 6), (1, 2), (5, 8)],
+                [(1, 4), (7, 8), (5, 3), (2, 6)],
+                [(4, 6), (3, 1), (2, 5), (7, 8)],
+                [(3, 7), (8, 2), (1, 5), (4, 6)],
+                [(5, 3), (6, 4), (2, 8), (1, 7)],
+                [(7, 1), (2, 4), (6, 5), (3, 8)],
+                [(5, 7), (8, 3), (1, 4), (6, 2)],
+                [(6, 1), (4, 7), (3, 2), (8, 5)],
+                [(6, 7), (4, 5), (8, 1), (2, 3)],
+                [(5, 4), (7, 3), (8, 1), (6, 2)],
+                [(5, 2), (6, 1), (3, 4), (8, 7)],
+                [(4, 1), (3, 8), (5, 6), (2, 7)],
+                [(5, 1), (7, 3), (8, 6), (4, 2)],
+                [(2, 4), (7, 5), (3, 6), (1, 8)],
+                [(3, 2), (4, 7), (6, 8), (5, 1)],
+                [(7, 6), (8, 5), (4, 3), (2, 1)],
+                [(3, 5), (4, 8), (7, 2), (1, 6)],
+                [(8, 4), (2, 7), (1, 3), (6, 5)],
+                [(8, 6), (5, 2), (4, 3), (1, 7)]
             ]
         schedule = scheduler.generate_schedule()
         self.assertListEqual(expected_schedule, schedule,
@@ -527,56 +580,56 @@ class TestQuadrupleRoundRobin(TestCase):
         """Test quadruple round-robin schedule generation."""
         scheduler = QuadrupleRoundRobinScheduler(6)
         # Failed attempt
-        random.seed(4)
+        random.seed(15)
         self.assertRaises(ScheduleGenerationFailed,
                           scheduler.generate_schedule, try_once=True)
         # Successful attempt
         random.seed(1)
         if PY2:
             expected_schedule = [
-                [(5, 2), (6, 1), (4, 3)],
-                [(1, 2), (3, 5), (4, 6)],
-                [(5, 6), (3, 1), (4, 2)],
-                [(4, 6), (1, 5), (2, 3)],
-                [(2, 6), (5, 3), (4, 1)],
-                [(2, 5), (3, 4), (6, 1)],
-                [(4, 5), (2, 1), (3, 6)],
-                [(2, 4), (1, 3), (6, 5)],
-                [(3, 5), (2, 4), (1, 6)],
-                [(2, 5), (4, 1), (3, 6)],
-                [(5, 1), (6, 4), (3, 2)],
-                [(4, 2), (5, 3), (1, 6)],
-                [(1, 2), (4, 5), (6, 3)],
-                [(2, 6), (1, 5), (4, 3)],
-                [(6, 2), (3, 4), (5, 1)],
-                [(5, 6), (3, 2), (1, 4)],
-                [(5, 4), (6, 3), (2, 1)],
-                [(5, 4), (1, 3), (6, 2)],
-                [(3, 1), (5, 2), (6, 4)],
-                [(2, 3), (6, 5), (1, 4)]
+                [(2, 5), (4, 6), (1, 3)],
+                [(4, 3), (5, 6), (1, 2)],
+                [(6, 3), (2, 5), (4, 1)],
+                [(5, 1), (6, 2), (4, 3)],
+                [(3, 1), (4, 6), (5, 2)],
+                [(6, 4), (3, 5), (2, 1)],
+                [(5, 4), (6, 1), (3, 2)],
+                [(2, 3), (4, 1), (6, 5)],
+                [(2, 6), (3, 1), (5, 4)],
+                [(2, 1), (6, 4), (5, 3)],
+                [(4, 5), (3, 6), (1, 2)],
+                [(1, 6), (4, 2), (5, 3)],
+                [(1, 4), (3, 6), (5, 2)],
+                [(3, 4), (1, 5), (6, 2)],
+                [(5, 6), (2, 3), (1, 4)],
+                [(6, 3), (2, 4), (1, 5)],
+                [(2, 4), (3, 5), (6, 1)],
+                [(6, 5), (4, 2), (1, 3)],
+                [(1, 6), (3, 2), (4, 5)],
+                [(2, 6), (5, 1), (3, 4)]
             ]
         elif PY3:
             expected_schedule = [
-                [(6, 2), (5, 4), (3, 1)],
-                [(5, 3), (2, 4), (1, 6)],
-                [(1, 4), (6, 2), (5, 3)],
-                [(6, 5), (1, 3), (4, 2)],
-                [(1, 6), (3, 4), (5, 2)],
-                [(1, 2), (5, 4), (3, 6)],
-                [(2, 1), (6, 4), (3, 5)],
-                [(4, 6), (5, 1), (3, 2)],
-                [(5, 2), (3, 1), (4, 6)],
-                [(2, 4), (5, 6), (1, 3)],
-                [(5, 1), (2, 6), (3, 4)],
-                [(6, 1), (2, 3), (4, 5)],
-                [(4, 3), (2, 1), (6, 5)],
-                [(3, 5), (6, 1), (4, 2)],
-                [(1, 5), (2, 3), (6, 4)],
-                [(1, 2), (6, 3), (4, 5)],
-                [(2, 5), (4, 1), (6, 3)],
+                [(2, 5), (1, 6), (4, 3)],
+                [(5, 6), (1, 3), (4, 2)],
+                [(2, 3), (5, 6), (4, 1)],
+                [(3, 1), (5, 2), (6, 4)],
+                [(6, 2), (3, 4), (1, 5)],
+                [(3, 1), (2, 4), (6, 5)],
+                [(1, 3), (4, 2), (6, 5)],
+                [(5, 1), (6, 3), (2, 4)],
+                [(2, 3), (6, 1), (5, 4)],
+                [(2, 6), (1, 5), (3, 4)],
+                [(4, 5), (6, 3), (1, 2)],
+                [(4, 3), (6, 2), (5, 1)],
+                [(6, 4), (2, 1), (5, 3)],
                 [(1, 4), (3, 6), (2, 5)],
-                [(3, 2), (4, 1), (5, 6)],
-                [(1, 5), (2, 6), (4, 3)]
+                [(2, 1), (3, 5), (4, 6)],
+                [(3, 2), (5, 4), (6, 1)],
+                [(3, 2), (1, 6), (4, 5)],
+                [(5, 2), (3, 6), (1, 4)],
+                [(2, 6), (5, 3), (4, 1)],
+                [(4, 6), (3, 5), (1, 2)]
             ]
         schedule = scheduler.generate_schedule(try_once=True)
         self.assertListEqual(expected_schedule, schedule,
@@ -586,52 +639,52 @@ class TestQuadrupleRoundRobin(TestCase):
     def test_repeated_schedule_generation(self):
         """Test repeated quadruple round-robin schedule generation."""
         scheduler = QuadrupleRoundRobinScheduler(6)
-        random.seed(4)
+        random.seed(15)
         if PY2:
             expected_schedule = [
-                [(4, 1), (2, 6), (3, 5)],
-                [(5, 2), (3, 6), (1, 4)],
-                [(1, 5), (4, 6), (2, 3)],
-                [(1, 3), (6, 5), (2, 4)],
-                [(6, 2), (3, 4), (5, 1)],
-                [(1, 2), (6, 3), (4, 5)],
-                [(5, 2), (1, 6), (4, 3)],
-                [(6, 1), (4, 2), (5, 3)],
-                [(1, 3), (4, 5), (6, 2)],
-                [(3, 2), (4, 6), (5, 1)],
-                [(2, 6), (4, 3), (1, 5)],
-                [(5, 6), (4, 1), (3, 2)],
-                [(1, 4), (6, 5), (2, 3)],
-                [(5, 6), (3, 1), (4, 2)],
-                [(2, 1), (3, 6), (5, 4)],
-                [(1, 6), (2, 4), (5, 3)],
-                [(6, 3), (2, 1), (5, 4)],
-                [(3, 4), (2, 5), (6, 1)],
-                [(3, 5), (6, 4), (1, 2)],
-                [(3, 1), (2, 5), (6, 4)]
+                [(4, 6), (2, 3), (1, 5)],
+                [(4, 1), (5, 3), (2, 6)],
+                [(6, 3), (4, 2), (5, 1)],
+                [(2, 6), (1, 3), (5, 4)],
+                [(6, 1), (3, 2), (4, 5)],
+                [(5, 2), (1, 3), (6, 4)],
+                [(2, 5), (3, 4), (6, 1)],
+                [(3, 1), (6, 5), (4, 2)],
+                [(1, 4), (6, 5), (3, 2)],
+                [(4, 3), (6, 2), (1, 5)],
+                [(2, 4), (5, 1), (3, 6)],
+                [(1, 2), (5, 6), (3, 4)],
+                [(6, 2), (5, 3), (1, 4)],
+                [(2, 1), (4, 6), (3, 5)],
+                [(6, 4), (3, 1), (5, 2)],
+                [(5, 4), (1, 2), (3, 6)],
+                [(1, 6), (4, 5), (2, 3)],
+                [(1, 6), (2, 4), (3, 5)],
+                [(2, 1), (5, 6), (4, 3)],
+                [(6, 3), (2, 5), (4, 1)]
             ]
         elif PY3:
             expected_schedule = [
-                [(4, 6), (3, 2), (1, 5)],
-                [(6, 2), (3, 4), (5, 1)],
-                [(1, 4), (2, 5), (3, 6)],
-                [(3, 1), (4, 2), (6, 5)],
-                [(4, 1), (5, 2), (6, 3)],
-                [(6, 1), (3, 5), (2, 4)],
-                [(1, 3), (6, 2), (4, 5)],
-                [(2, 5), (6, 4), (3, 1)],
-                [(3, 4), (1, 2), (6, 5)],
-                [(2, 3), (1, 6), (4, 5)],
-                [(2, 4), (1, 3), (5, 6)],
-                [(2, 1), (5, 4), (6, 3)],
-                [(6, 4), (2, 1), (5, 3)],
-                [(3, 2), (4, 6), (5, 1)],
-                [(4, 1), (3, 6), (5, 2)],
-                [(5, 6), (4, 3), (1, 2)],
-                [(2, 3), (6, 1), (5, 4)],
-                [(1, 5), (4, 3), (2, 6)],
-                [(2, 6), (3, 5), (1, 4)],
-                [(5, 3), (1, 6), (4, 2)]
+                [(4, 6), (3, 5), (1, 2)],
+                [(2, 3), (1, 5), (4, 6)],
+                [(5, 4), (6, 3), (2, 1)],
+                [(1, 6), (3, 5), (2, 4)],
+                [(5, 3), (6, 4), (1, 2)],
+                [(6, 1), (2, 5), (3, 4)],
+                [(3, 2), (6, 5), (4, 1)],
+                [(5, 2), (4, 3), (6, 1)],
+                [(2, 3), (5, 6), (1, 4)],
+                [(2, 6), (5, 1), (4, 3)],
+                [(6, 3), (4, 1), (2, 5)],
+                [(4, 5), (2, 1), (3, 6)],
+                [(5, 2), (1, 6), (3, 4)],
+                [(3, 6), (4, 2), (1, 5)],
+                [(5, 3), (6, 2), (1, 4)],
+                [(1, 3), (4, 5), (2, 6)],
+                [(5, 4), (3, 1), (6, 2)],
+                [(1, 3), (2, 4), (5, 6)],
+                [(6, 5), (4, 2), (3, 1)],
+                [(6, 4), (5, 1), (3, 2)]
             ]
         schedule = scheduler.generate_schedule()
         self.assertListEqual(expected_schedule, schedule,
@@ -647,66 +700,66 @@ class TestQuintupleRoundRobin(TestCase):
         """Test quintuple round-robin schedule generation."""
         scheduler = RoundRobinScheduler(6, meetings=5)
         # Failed attempt
-        random.seed(8)
+        random.seed(12)
         self.assertRaises(ScheduleGenerationFailed,
                           scheduler.generate_schedule, try_once=True)
         # Successful attempt
         random.seed(1)
         if PY2:
             expected_schedule = [
+                [(1, 4), (2, 6), (3, 5)],
+                [(1, 5), (3, 6), (2, 4)],
+                [(3, 6), (5, 1), (2, 4)],
                 [(5, 2), (4, 1), (3, 6)],
-                [(2, 1), (4, 3), (5, 6)],
-                [(2, 5), (6, 3), (1, 4)],
-                [(3, 5), (6, 4), (2, 1)],
-                [(3, 6), (4, 1), (2, 5)],
-                [(4, 2), (3, 1), (6, 5)],
-                [(3, 4), (5, 6), (2, 1)],
-                [(3, 5), (2, 6), (4, 1)],
-                [(6, 3), (2, 4), (5, 1)],
-                [(3, 2), (5, 1), (6, 4)],
-                [(1, 6), (5, 4), (2, 3)],
-                [(5, 3), (2, 6), (1, 4)],
+                [(6, 4), (3, 1), (5, 2)],
+                [(3, 2), (6, 5), (4, 1)],
+                [(6, 3), (1, 5), (4, 2)],
+                [(4, 6), (3, 5), (1, 2)],
+                [(3, 1), (6, 2), (4, 5)],
+                [(6, 1), (3, 2), (5, 4)],
+                [(2, 5), (4, 3), (6, 1)],
+                [(3, 1), (5, 4), (2, 6)],
+                [(6, 3), (4, 2), (5, 1)],
+                [(3, 4), (1, 6), (2, 5)],
+                [(5, 3), (2, 1), (4, 6)],
+                [(6, 1), (3, 4), (5, 2)],
+                [(4, 2), (1, 3), (6, 5)],
+                [(1, 4), (5, 6), (2, 3)],
+                [(1, 3), (6, 2), (5, 4)],
                 [(4, 3), (1, 2), (5, 6)],
-                [(6, 1), (2, 3), (4, 5)],
-                [(3, 6), (4, 2), (1, 5)],
-                [(5, 2), (1, 6), (3, 4)],
-                [(4, 6), (3, 1), (2, 5)],
-                [(6, 2), (5, 4), (1, 3)],
-                [(6, 2), (1, 3), (4, 5)],
-                [(1, 5), (4, 3), (6, 2)],
-                [(5, 3), (6, 1), (2, 4)],
-                [(3, 2), (1, 6), (5, 4)],
-                [(1, 5), (3, 2), (6, 4)],
-                [(5, 3), (1, 2), (4, 6)],
-                [(1, 3), (4, 2), (6, 5)]
+                [(4, 6), (2, 3), (1, 5)],
+                [(2, 1), (6, 5), (4, 3)],
+                [(5, 3), (2, 6), (1, 4)],
+                [(5, 3), (6, 4), (1, 2)],
+                [(1, 6), (4, 5), (2, 3)]
             ]
         elif PY3:
             expected_schedule = [
-                [(4, 6), (2, 5), (3, 1)],
-                [(3, 4), (2, 5), (6, 1)],
-                [(5, 1), (4, 3), (2, 6)],
-                [(3, 6), (4, 5), (2, 1)],
-                [(6, 4), (5, 3), (2, 1)],
-                [(2, 4), (1, 3), (5, 6)],
-                [(2, 3), (4, 1), (6, 5)],
-                [(2, 5), (1, 4), (6, 3)],
-                [(6, 4), (2, 3), (5, 1)],
-                [(3, 1), (4, 2), (6, 5)],
-                [(6, 1), (4, 5), (3, 2)],
-                [(3, 2), (1, 5), (4, 6)],
+                [(1, 6), (3, 5), (4, 2)],
                 [(6, 2), (1, 4), (5, 3)],
-                [(6, 1), (4, 3), (5, 2)],
-                [(5, 4), (1, 2), (6, 3)],
-                [(4, 6), (3, 2), (5, 1)],
-                [(5, 6), (3, 4), (1, 2)],
-                [(2, 4), (6, 3), (1, 5)],
-                [(1, 6), (3, 4), (5, 2)],
-                [(6, 2), (1, 4), (3, 5)],
-                [(2, 4), (1, 6), (5, 3)],
-                [(5, 4), (1, 3), (2, 6)],
-                [(1, 2), (3, 6), (4, 5)],
-                [(3, 5), (2, 6), (4, 1)],
-                [(4, 2), (1, 3), (5, 6)]
+                [(1, 4), (6, 5), (3, 2)],
+                [(6, 4), (5, 1), (2, 3)],
+                [(2, 5), (4, 6), (1, 3)],
+                [(6, 1), (3, 5), (2, 4)],
+                [(4, 2), (1, 5), (3, 6)],
+                [(4, 3), (5, 1), (2, 6)],
+                [(1, 2), (4, 3), (5, 6)],
+                [(5, 6), (3, 1), (4, 2)],
+                [(6, 5), (1, 4), (2, 3)],
+                [(3, 6), (5, 4), (1, 2)],
+                [(6, 2), (5, 1), (3, 4)],
+                [(4, 5), (2, 1), (6, 3)],
+                [(1, 3), (5, 2), (6, 4)],
+                [(1, 6), (2, 3), (5, 4)],
+                [(5, 4), (2, 6), (3, 1)],
+                [(2, 1), (5, 3), (4, 6)],
+                [(6, 1), (2, 5), (3, 4)],
+                [(5, 2), (4, 1), (3, 6)],
+                [(4, 1), (2, 5), (6, 3)],
+                [(6, 1), (5, 3), (2, 4)],
+                [(3, 4), (6, 5), (1, 2)],
+                [(1, 3), (2, 6), (4, 5)],
+                [(3, 2), (1, 5), (4, 6)]
             ]
         schedule = scheduler.generate_schedule(try_once=True)
         self.assertListEqual(expected_schedule, schedule,
@@ -722,78 +775,476 @@ class TestSextupleRoundRobin(TestCase):
         """Test sextuple round-robin schedule generation."""
         scheduler = RoundRobinScheduler(6, meetings=6)
         # Failed attempt
-        random.seed(35)
+        random.seed(24)
         self.assertRaises(ScheduleGenerationFailed,
                           scheduler.generate_schedule, try_once=True)
         # Successful attempt
         random.seed(1)
         if PY2:
             expected_schedule = [
-                [(6, 4), (3, 1), (2, 5)],
-                [(3, 1), (6, 5), (4, 2)],
-                [(6, 1), (2, 3), (5, 4)],
-                [(5, 1), (2, 6), (3, 4)],
-                [(1, 6), (2, 5), (3, 4)],
-                [(5, 6), (4, 3), (2, 1)],
-                [(2, 6), (3, 5), (4, 1)],
-                [(3, 1), (2, 5), (4, 6)],
-                [(1, 4), (3, 5), (6, 2)],
-                [(1, 2), (5, 4), (6, 3)],
+                [(3, 4), (2, 5), (1, 6)],
+                [(4, 6), (1, 2), (3, 5)],
+                [(5, 1), (3, 6), (4, 2)],
+                [(1, 2), (4, 3), (6, 5)],
+                [(4, 5), (3, 6), (1, 2)],
+                [(1, 4), (2, 3), (6, 5)],
+                [(5, 6), (2, 4), (3, 1)],
+                [(5, 1), (6, 3), (4, 2)],
+                [(5, 4), (6, 3), (2, 1)],
+                [(3, 2), (1, 6), (5, 4)],
+                [(2, 5), (1, 6), (3, 4)],
+                [(1, 4), (5, 3), (6, 2)],
+                [(6, 2), (4, 5), (3, 1)],
+                [(6, 4), (1, 3), (2, 5)],
+                [(2, 3), (4, 1), (5, 6)],
+                [(6, 1), (5, 2), (4, 3)],
+                [(2, 6), (3, 5), (1, 4)],
+                [(2, 6), (5, 3), (4, 1)],
+                [(3, 5), (2, 4), (6, 1)],
+                [(3, 2), (4, 5), (6, 1)],
+                [(1, 5), (3, 6), (2, 4)],
+                [(5, 1), (6, 4), (3, 2)],
+                [(4, 3), (6, 5), (2, 1)],
+                [(6, 2), (4, 1), (5, 3)],
+                [(4, 6), (3, 1), (5, 2)],
+                [(2, 6), (1, 5), (3, 4)],
                 [(5, 2), (6, 4), (1, 3)],
-                [(1, 3), (4, 2), (6, 5)],
-                [(5, 3), (2, 6), (4, 1)],
-                [(5, 1), (4, 6), (3, 2)],
-                [(3, 2), (1, 6), (4, 5)],
-                [(1, 3), (4, 6), (5, 2)],
-                [(3, 6), (4, 5), (2, 1)],
-                [(2, 3), (4, 5), (1, 6)],
-                [(1, 2), (5, 3), (6, 4)],
-                [(4, 1), (3, 2), (6, 5)],
-                [(1, 4), (6, 3), (5, 2)],
-                [(1, 5), (3, 6), (4, 2)],
-                [(5, 1), (2, 4), (6, 3)],
-                [(1, 2), (3, 6), (5, 4)],
-                [(5, 6), (1, 4), (2, 3)],
-                [(5, 3), (6, 1), (2, 4)],
-                [(4, 3), (1, 5), (6, 2)],
-                [(2, 1), (3, 4), (5, 6)],
-                [(6, 1), (2, 4), (3, 5)],
-                [(1, 5), (6, 2), (4, 3)]
+                [(4, 2), (5, 6), (1, 3)],
+                [(4, 6), (1, 5), (2, 3)],
+                [(6, 3), (2, 1), (5, 4)]
             ]
         elif PY3:
             expected_schedule = [
-                [(6, 4), (2, 3), (5, 1)],
-                [(4, 5), (1, 2), (3, 6)],
-                [(3, 4), (1, 2), (6, 5)],
-                [(2, 6), (5, 3), (4, 1)],
-                [(6, 3), (1, 5), (2, 4)],
-                [(5, 6), (3, 2), (1, 4)],
-                [(6, 1), (4, 2), (5, 3)],
-                [(1, 3), (6, 4), (5, 2)],
-                [(5, 1), (3, 4), (6, 2)],
-                [(4, 1), (5, 6), (3, 2)],
-                [(4, 5), (6, 1), (2, 3)],
-                [(2, 1), (5, 4), (3, 6)],
-                [(6, 2), (4, 5), (3, 1)],
-                [(1, 5), (2, 4), (3, 6)],
-                [(2, 6), (1, 5), (4, 3)],
-                [(4, 6), (2, 1), (5, 3)],
-                [(3, 1), (2, 5), (6, 4)],
-                [(1, 6), (4, 2), (3, 5)],
-                [(6, 1), (2, 3), (5, 4)],
-                [(1, 4), (6, 2), (3, 5)],
-                [(5, 2), (1, 4), (6, 3)],
-                [(5, 6), (2, 4), (3, 1)],
-                [(3, 4), (6, 5), (1, 2)],
-                [(2, 5), (4, 1), (6, 3)],
-                [(4, 3), (5, 1), (2, 6)],
-                [(2, 5), (4, 6), (1, 3)],
+                [(4, 3), (2, 5), (6, 1)],
+                [(1, 5), (4, 3), (2, 6)],
                 [(1, 3), (5, 2), (4, 6)],
-                [(1, 6), (5, 4), (3, 2)],
-                [(2, 1), (4, 3), (6, 5)],
-                [(3, 5), (1, 6), (4, 2)]
+                [(2, 4), (5, 6), (3, 1)],
+                [(1, 2), (3, 6), (5, 4)],
+                [(1, 4), (3, 5), (6, 2)],
+                [(5, 1), (4, 2), (3, 6)],
+                [(5, 3), (6, 2), (4, 1)],
+                [(5, 3), (4, 6), (2, 1)],
+                [(1, 6), (2, 5), (4, 3)],
+                [(1, 2), (6, 5), (3, 4)],
+                [(5, 6), (1, 3), (2, 4)],
+                [(5, 1), (6, 4), (2, 3)],
+                [(1, 3), (6, 5), (4, 2)],
+                [(2, 1), (6, 4), (3, 5)],
+                [(2, 3), (6, 5), (4, 1)],
+                [(3, 2), (4, 6), (1, 5)],
+                [(5, 2), (1, 4), (6, 3)],
+                [(1, 4), (2, 3), (5, 6)],
+                [(2, 4), (1, 6), (3, 5)],
+                [(2, 5), (3, 1), (6, 4)],
+                [(6, 1), (3, 4), (5, 2)],
+                [(3, 2), (4, 5), (1, 6)],
+                [(2, 6), (1, 5), (3, 4)],
+                [(5, 4), (6, 2), (3, 1)],
+                [(3, 2), (4, 5), (6, 1)],
+                [(5, 4), (6, 3), (1, 2)],
+                [(3, 6), (4, 5), (2, 1)],
+                [(5, 1), (4, 2), (6, 3)],
+                [(4, 1), (2, 6), (5, 3)]
             ]
         schedule = scheduler.generate_schedule(try_once=True)
         self.assertListEqual(expected_schedule, schedule,
                              ('Wrong schedule created for '
                               'sextuple round-robin competition'))
+
+
+class TestRetryPolicy(TestCase):
+
+    """Tests for retrying failed schedule generation."""
+
+    def test_round_tries(self):
+        """Test the number of tries per round for each attempt."""
+        self.assertEqual([10, 10, 10], list(RetryPolicy(max_attempts=3)))
+        self.assertEqual([2, 4, 8, 10],
+                         list(RetryPolicy(4, round_tries=2, backoff=2,
+                                          max_round_tries=10)))
+        self.assertEqual([5], list(RetryPolicy(round_tries=5).once()))
+        self.assertEqual([[2], [4], [8]],
+                         [list(policy) for policy
+                          in RetryPolicy(3, round_tries=2, backoff=2).split()])
+
+    def test_exhausted_budget(self):
+        """Test schedule generation with an exhausted attempt budget."""
+        scheduler = SingleRoundRobinScheduler(8, retry=RetryPolicy(max_attempts=1))
+        random.seed(20)
+        with self.assertRaises(ScheduleGenerationFailed) as context:
+            scheduler.generate_schedule()
+        self.assertEqual(1, context.exception.attempts)
+        self.assertLess(context.exception.max_rounds, scheduler.round_count)
+
+    def test_bounded_generation(self):
+        """Test that large leagues are generated without recursion."""
+        scheduler = RoundRobinScheduler(30, meetings=1)
+        random.seed(20)
+        scheduler.generate_schedule(retry=RetryPolicy(backoff=1.5))
+
+
+class TestGenerationStats(TestCase):
+
+    """Tests for schedule generation statistics."""
+
+    def test_restarts(self):
+        """Test the statistics of failed attempts."""
+        scheduler = SingleRoundRobinScheduler(8)
+        stats = GenerationStats()
+        random.seed(20)
+        with self.assertRaises(ScheduleGenerationFailed) as context:
+            scheduler.generate_schedule(stats=stats, retry=RetryPolicy(3, round_tries=1))
+        self.assertEqual(2, stats.restarts)
+        self.assertEqual(1, stats.matrix_attempts)
+        self.assertEqual(context.exception.max_rounds + 1, len(stats.round_attempts))
+        self.assertGreaterEqual(sum(stats.round_attempts), 3)
+        self.assertGreater(stats.timings['rounds'], 0)
+
+    def test_engines(self):
+        """Test the statistics of each engine."""
+        for engine in RoundRobinScheduler.ENGINES:
+            scheduler = RoundRobinScheduler(10, meetings=2, engine=engine)
+            stats = GenerationStats()
+            scheduler.generate_schedule(rng=0, stats=stats)
+            self.assertEqual(0, stats.matrix_attempts)
+            self.assertEqual(0, stats.restarts)
+            self.assertEqual(scheduler.round_count, len(stats.round_attempts))
+            self.assertEqual(set(['matches', 'rounds']), set(stats.timings))
+            self.assertFalse(stats.as_dict()['cache_hit'])
+
+
+class RecordingObserver(GenerationObserver):
+
+    """Observer recording the callbacks it receives."""
+
+    def __init__(self, abort_round=None):
+        self.events = []
+        self.abort_round = abort_round
+
+    def on_matches_started(self):
+        self.events.append(('matches_started',))
+
+    def on_matrix_generated(self, matrix):
+        self.events.append(('matrix_generated',))
+
+    def on_matches_generated(self, count):
+        self.events.append(('matches_generated', count))
+
+    def on_round_started(self, number):
+        if number == self.abort_round:
+            raise GenerationAborted('Stopped at round {}.'.format(number))
+        self.events.append(('round_started', number))
+
+    def on_round_failed(self, number):
+        self.events.append(('round_failed', number))
+
+    def on_round_completed(self, number, round):
+        self.events.append(('round_completed', number, len(round)))
+
+    def on_restart(self, attempt):
+        self.events.append(('restart', attempt))
+
+
+class TestGenerationObserver(TestCase):
+
+    """Tests for observers of schedule generation."""
+
+    def test_callbacks(self):
+        """Test the callbacks of each engine."""
+        for engine in RoundRobinScheduler.ENGINES:
+            observer = RecordingObserver()
+            scheduler = RoundRobinScheduler(6, meetings=3, engine=engine,
+                                            observer=observer)
+            stats = GenerationStats()
+            scheduler.generate_schedule(rng=1, stats=stats)
+            events = observer.events
+            self.assertEqual(('matches_started',), events[0])
+            self.assertEqual(('matrix_generated',), events[1])
+            self.assertEqual(('matches_generated', 45), events[2])
+            completed = [event[1] for event in events
+                         if event[0] == 'round_completed']
+            self.assertEqual(scheduler.round_count, len(completed))
+            self.assertEqual(('round_completed', scheduler.round_count - 1,
+                              scheduler.match_count), events[-1])
+            started = [event for event in events if event[0] == 'round_started']
+            self.assertEqual(len(started), sum(stats.round_attempts))
+            self.assertEqual(1, stats.matrix_attempts)
+
+    def test_even_meetings(self):
+        """Test that match generation is observed for even meeting counts."""
+        for engine in RoundRobinScheduler.ENGINES:
+            observer = RecordingObserver()
+            scheduler = RoundRobinScheduler(6, meetings=2, engine=engine,
+                                            observer=observer)
+            scheduler.generate_schedule(rng=1)
+            self.assertEqual([('matches_started',), ('matches_generated', 30)],
+                             observer.events[:2])
+
+    def test_restarts(self):
+        """Test that restarts are observed."""
+        observer = RecordingObserver()
+        scheduler = SingleRoundRobinScheduler(8, observer=observer)
+        random.seed(20)
+        with self.assertRaises(ScheduleGenerationFailed):
+            scheduler.generate_schedule(retry=RetryPolicy(3, round_tries=1))
+        self.assertEqual([('restart', 2), ('restart', 3)],
+                         [event for event in observer.events
+                          if event[0] == 'restart'])
+        self.assertIn('round_failed', [event[0] for event in observer.events])
+
+    def test_abort(self):
+        """Test that an observer stops generation."""
+        for engine in RoundRobinScheduler.ENGINES:
+            observer = RecordingObserver(abort_round=3)
+            scheduler = RoundRobinScheduler(8, meetings=2, engine=engine,
+                                            observer=observer)
+            rounds = scheduler.iter_schedule(rng=0)
+            with self.assertRaises(GenerationAborted):
+                list(rounds)
+            self.assertNotIn('restart', [event[0] for event in observer.events])
+
+
+class ScheduleTestCase(TestCase):
+
+    """Test case with round-robin schedule checks."""
+
+    def assertValidSchedule(self, scheduler, schedule):
+        """Assert that a schedule is a valid round-robin schedule."""
+        teams = scheduler.teams
+        self.assertEqual(scheduler.round_count, len(schedule),
+                         'Wrong number of rounds.')
+        pairs = collections.Counter()
+        homes = collections.Counter()
+        for round in schedule:
+            self.assertCountEqual(teams, [team for match in round for team in match],
+                                  'Teams not scheduled exactly once per round.')
+            for (home, away) in round:
+                pairs[frozenset((home, away))] += 1
+                homes[home] += 1
+        for (team, opp) in itertools.combinations(teams, 2):
+            self.assertEqual(scheduler.meetings, pairs[frozenset((team, opp))],
+                             'Teams do not meet the right number of times.')
+        if scheduler.meetings % 2 == 1:
+            for team in teams:
+                home_count = homes[team] - scheduler.meetings // 2 * (len(teams) - 1)
+                expected = (len(teams) // 2 if team in scheduler.home_teams
+                            else (len(teams) - 1) // 2)
+                self.assertEqual(expected, home_count,
+                                 'Home and away matches not balanced.')
+
+
+class TestCircleRoundRobin(ScheduleTestCase):
+
+    """Tests for circle method round-robin scheduling."""
+
+    def test_schedule_generation(self):
+        """Test circle method schedule generation."""
+        for meetings in range(1, 7):
+            for teams in range(3, 21):
+                scheduler = RoundRobinScheduler(teams, meetings=meetings,
+                                                engine='circle')
+                self.assertValidSchedule(scheduler, scheduler.generate_schedule())
+
+    def test_home_teams(self):
+        """Test circle method schedule generation with known home teams."""
+        for teams in range(3, 9):
+            team_list = list(range(1, teams + 1))
+            if teams % 2 == 1:
+                team_list.append(None)
+            home_teams = tuple(random.sample(team_list, len(team_list) // 2))
+            scheduler = RoundRobinScheduler(teams, meetings=3)
+            schedule = scheduler.generate_schedule(home_teams=home_teams,
+                                                   engine='circle')
+            self.assertSequenceEqual(home_teams, scheduler.home_teams,
+                                     'Home teams not stored.')
+            self.assertValidSchedule(scheduler, schedule)
+
+    def test_engine_selection(self):
+        """Test that unknown engines are rejected."""
+        self.assertRaises(ValueError, RoundRobinScheduler, 4, meetings=1,
+                          engine='unknown')
+        scheduler = SingleRoundRobinScheduler(4, engine='circle')
+        self.assertEqual('circle', scheduler.engine)
+        self.assertRaises(ValueError, scheduler.generate_schedule,
+                          engine='unknown')
+
+
+class TestMatchingRoundRobin(ScheduleTestCase):
+
+    """Tests for perfect matching round-robin scheduling."""
+
+    def test_schedule_generation(self):
+        """Test perfect matching schedule generation."""
+        for meetings in range(1, 7):
+            for teams in range(3, 21):
+                scheduler = RoundRobinScheduler(teams, meetings=meetings,
+                                                engine='matching')
+                self.assertValidSchedule(scheduler, scheduler.generate_schedule())
+
+    def test_large_league(self):
+        """Test perfect matching schedule generation for a large league."""
+        scheduler = DoubleRoundRobinScheduler(151, engine='matching')
+        self.assertValidSchedule(scheduler, scheduler.generate_schedule())
+
+
+class TestBacktrackRoundRobin(ScheduleTestCase):
+
+    """Tests for backtracking round-robin scheduling."""
+
+    def test_schedule_generation(self):
+        """Test backtracking schedule generation."""
+        for meetings in range(1, 7):
+            for teams in range(3, 21):
+                scheduler = RoundRobinScheduler(teams, meetings=meetings,
+                                                engine='backtrack')
+                self.assertValidSchedule(scheduler, scheduler.generate_schedule())
+
+    def test_first_attempt(self):
+        """Test that larger leagues are generated in a single attempt."""
+        random.seed(7)
+        for teams in (31, 40):
+            scheduler = RoundRobinScheduler(teams, meetings=2, engine='backtrack')
+            schedule = scheduler.generate_schedule(try_once=True)
+            self.assertValidSchedule(scheduler, schedule)
+
+
+class TestTemplateRoundRobin(ScheduleTestCase):
+
+    """Tests for template round-robin scheduling."""
+
+    def test_schedule_generation(self):
+        """Test template schedule generation."""
+        for meetings in range(1, 7):
+            for teams in range(3, 21):
+                scheduler = RoundRobinScheduler(teams, meetings=meetings,
+                                                engine='template')
+                self.assertValidSchedule(scheduler, scheduler.generate_schedule())
+
+    def test_templates(self):
+        """Test that libraries hold the same valid templates."""
+        library = TemplateLibrary(count=3, max_teams=10)
+        self.assertEqual(3, len(library.templates(10)))
+        self.assertEqual(1, len(library.templates(12)))
+        self.assertListEqual(library.templates(10),
+                             TemplateLibrary(count=3).templates(10))
+        scheduler = DoubleRoundRobinScheduler(list(range(10)))
+        for template in library.templates(10):
+            mirrored = [[(opp, team) for (team, opp) in round]
+                        for round in template]
+            self.assertValidSchedule(scheduler, template + mirrored)
+
+
+class TestIndexRoundRobin(ScheduleTestCase):
+
+    """Tests for round-robin scheduling with team indices."""
+
+    def test_index_matches(self):
+        """Test generating matches in index form."""
+        scheduler = RoundRobinScheduler(['A', 'B', 'C', 'D', 'E'], meetings=3)
+        (homes, aways) = scheduler.generate_index_matches()
+        self.assertEqual('H', homes.typecode)
+        self.assertEqual(len(homes), len(aways))
+        pairs = collections.Counter(frozenset(match) for match in zip(homes, aways))
+        self.assertEqual(set([3]), set(pairs.values()))
+        self.assertEqual(15, len(pairs))
+
+    def test_index_schedule(self):
+        """Test generating schedules in index form."""
+        for engine in RoundRobinScheduler.ENGINES:
+            scheduler = RoundRobinScheduler(['A', 'B', 'C', 'D', 'E', 'F'],
+                                            meetings=2, engine=engine)
+            schedule = scheduler.generate_schedule(indices=True)
+            scheduler.teams = list(range(6))
+            self.assertValidSchedule(scheduler, schedule)
+
+    def test_unhashable_teams(self):
+        """Test that teams are not compared or hashed during generation."""
+        for engine in RoundRobinScheduler.ENGINES:
+            teams = [[name] for name in 'ABCDEFG']
+            scheduler = RoundRobinScheduler(teams, meetings=3, engine=engine)
+            schedule = scheduler.generate_schedule()
+            self.assertEqual(scheduler.round_count, len(schedule))
+            self.assertIn(schedule[0][0][0], teams)
+        scheduler = RoundRobinScheduler([[name] for name in 'ABCDEF'], meetings=2)
+        matches = scheduler.generate_matches()
+        round = scheduler.generate_round(matches)
+        self.assertEqual(3, len(round))
+        self.assertEqual(27, len(matches))
+        self.assertNotIn(round[0], matches)
+
+
+class TestStreamingRoundRobin(ScheduleTestCase):
+
+    """Tests for generating round-robin schedules one round at a time."""
+
+    def test_schedule_generation(self):
+        """Test streaming schedule generation with every engine."""
+        for engine in RoundRobinScheduler.ENGINES:
+            for meetings in range(1, 5):
+                for teams in range(3, 13):
+                    scheduler = RoundRobinScheduler(teams, meetings=meetings,
+                                                    engine=engine)
+                    self.assertValidSchedule(scheduler,
+                                             list(scheduler.iter_schedule()))
+
+    def test_constructive_engines(self):
+        """Test that constructive engines stream the same schedules."""
+        for engine in ('circle', 'matching'):
+            scheduler = RoundRobinScheduler(9, meetings=3, engine=engine)
+            random.seed(4)
+            rounds = scheduler.iter_schedule(home_teams=(1, 3, 5, 7, 9))
+            self.assertIsInstance(next(rounds), list)
+            streamed = list(rounds)
+            random.seed(4)
+            schedule = scheduler.generate_schedule(home_teams=(1, 3, 5, 7, 9))
+            self.assertListEqual(schedule[1:], streamed)
+
+    def test_final_rounds(self):
+        """Test that rounds are final once they are yielded."""
+        for (engine, window) in (('random', 0), ('backtrack', 2)):
+            scheduler = RoundRobinScheduler(10, meetings=2, engine=engine)
+            schedule = list(scheduler.iter_schedule(window=window, indices=True,
+                                                    rng=1))
+            scheduler.teams = list(range(10))
+            self.assertValidSchedule(scheduler, schedule)
+
+    def test_dead_end_after_yield(self):
+        """Test that a dead end after a round is yielded is not retried."""
+        scheduler = RoundRobinScheduler(8, meetings=1, engine='random')
+        schedule = []
+        with self.assertRaises(ScheduleGenerationFailed):
+            for round in scheduler.iter_schedule(window=0, rng=20):
+                schedule.append(round)
+        self.assertEqual(5, len(schedule))
+
+
+class TestReproducibleRoundRobin(TestCase):
+
+    """Tests for round-robin scheduling with a given random number generator."""
+
+    def test_schedule_generation(self):
+        """Test that the same seed gives the same schedule."""
+        for engine in RoundRobinScheduler.ENGINES:
+            scheduler = RoundRobinScheduler(9, meetings=3, engine=engine)
+            state = random.getstate()
+            schedule = scheduler.generate_schedule(rng=12)
+            self.assertEqual(state, random.getstate())
+            self.assertListEqual(schedule, scheduler.generate_schedule(rng=12))
+            self.assertListEqual(schedule, scheduler.generate_schedule(
+                rng=random.Random(12)))
+            random.seed(12)
+            self.assertListEqual(schedule, scheduler.generate_schedule())
+            self.assertListEqual(schedule, list(scheduler.iter_schedule(
+                rng=12, window=scheduler.round_count)))
+
+    def test_matches(self):
+        """Test that the same seed gives the same matrix, matches and round."""
+        scheduler = RoundRobinScheduler(7, meetings=1)
+        self.assertListEqual(scheduler.generate_matrix(rng=3),
+                             scheduler.generate_matrix(rng=3))
+        self.assertEqual(scheduler.generate_index_matches(rng=3),
+                         scheduler.generate_index_matches(rng=3))
+        matches = scheduler.generate_matches(rng=3)
+        self.assertListEqual(matches, scheduler.generate_matches(rng=3))
+        self.assertListEqual(scheduler.generate_round(list(matches), rng=4),
+                             scheduler.generate_round(list(matches), rng=4))
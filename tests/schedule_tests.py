@@ -0,0 +1,118 @@
+# -*- coding: utf-8  -*-
+"""Tests for compact schedules."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import pickle
+
+from . import TestCase
+
+from competitions.scheduler.roundrobin import RoundRobinScheduler
+from competitions.scheduler.schedule import Schedule, Sequence
+
+
+class TestSchedule(TestCase):
+
+    """Tests for compact schedules."""
+
+    def setUp(self):
+        """Set up a schedule between team indices."""
+        self.rounds = [[(0, 1), (2, 3)], [(3, 0), (1, 2)], [(0, 2), (3, 1)]]
+        self.schedule = Schedule.from_rounds(self.rounds, 2)
+
+    def test_sequence(self):
+        """Test that a schedule is used like a list of rounds."""
+        schedule = self.schedule
+        self.assertIsInstance(schedule, Sequence)
+        self.assertEqual(3, len(schedule))
+        self.assertEqual([(3, 0), (1, 2)], schedule[1])
+        self.assertEqual([(0, 2), (3, 1)], schedule[-1])
+        self.assertEqual(self.rounds[1:], schedule[1:])
+        self.assertListEqual(self.rounds, list(schedule))
+        self.assertListEqual(self.rounds[::-1], list(reversed(schedule)))
+        self.assertIn([(3, 0), (1, 2)], schedule)
+        self.assertEqual(2, schedule.index([(0, 2), (3, 1)]))
+        self.assertEqual(self.rounds, schedule)
+        self.assertEqual(schedule, self.rounds)
+        self.assertNotEqual(self.rounds[:2], schedule)
+        with self.assertRaises(IndexError):
+            schedule[3]
+        self.assertFalse(hasattr(schedule, '__dict__'))
+
+    def test_teams(self):
+        """Test that a schedule gives matches between its teams."""
+        schedule = Schedule(self.schedule.homes, self.schedule.aways, 2,
+                            ['a', 'b', 'c', None])
+        self.assertEqual([('a', 'b'), ('c', None)], schedule[0])
+        self.assertEqual(self.schedule, schedule.indices())
+        self.assertNotEqual(self.schedule, schedule)
+
+    def test_invalid(self):
+        """Test that rounds must all have the same number of matches."""
+        self.assertRaises(ValueError, Schedule.from_rounds, self.rounds, 4)
+
+    def test_pickle(self):
+        """Test that a schedule is pickled with every protocol."""
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            schedule = pickle.loads(pickle.dumps(self.schedule, protocol))
+            self.assertEqual(self.schedule, schedule)
+
+    def test_generate(self):
+        """Test that compact schedules have the same rounds as lists."""
+        scheduler = RoundRobinScheduler(9, meetings=3)
+        for indices in (False, True):
+            schedule = scheduler.generate_schedule(rng=4, indices=indices,
+                                                   compact=True)
+            self.assertIsInstance(schedule, Schedule)
+            self.assertEqual(scheduler.round_count, len(schedule))
+            self.assertListEqual(
+                scheduler.generate_schedule(rng=4, indices=indices),
+                schedule.to_list())
+
+    def test_fixtures(self):
+        """Test looking up the fixtures of teams."""
+        schedule = self.schedule
+        self.assertEqual(0, schedule.opponent(3, 1))
+        self.assertTrue(schedule.is_home(3, 1))
+        self.assertFalse(schedule.is_home(0, 1))
+        self.assertEqual(1, schedule.opponent(3, -1))
+        self.assertEqual([(0, 2, False), (1, 0, True), (2, 1, True)],
+                         schedule.fixtures(3))
+        self.assertRaises(ValueError, schedule.fixtures, 4)
+        self.assertRaises(IndexError, schedule.opponent, 0, 3)
+
+    def test_team_fixtures(self):
+        """Test looking up fixtures against a generated schedule."""
+        scheduler = RoundRobinScheduler(['a', 'b', 'c'], meetings=2)
+        rounds = scheduler.generate_schedule(rng=2)
+        schedule = scheduler.generate_schedule(rng=2, compact=True)
+        for team in scheduler.teams:
+            fixtures = schedule.fixtures(team)
+            self.assertEqual(len(rounds), len(fixtures))
+            for (number, opp, at_home) in fixtures:
+                match = (team, opp) if at_home else (opp, team)
+                self.assertIn(match, rounds[number])
+                self.assertEqual(opp, schedule.opponent(team, number))
+                self.assertEqual(at_home, schedule.is_home(team, number))
+        self.assertRaises(ValueError, schedule.opponent, 'd', 0)
+
+    def test_missing_fixture(self):
+        """Test a team without a match in a round."""
+        schedule = Schedule.from_rounds([[(0, 1), (1, 0)], [(1, 2), (3, 0)]], 2)
+        self.assertIsNone(schedule.opponent(2, 0))
+        self.assertEqual([(1, 1, False)], schedule.fixtures(2))
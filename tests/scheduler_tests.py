@@ -0,0 +1,56 @@
+# -*- coding: utf-8  -*-
+"""Tests for the scheduler base class."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import itertools
+import random
+
+from . import TestCase
+
+from competitions.scheduler import NoMatchFound
+from competitions.scheduler.scheduler import Scheduler
+
+
+class TestUniqueMatches(TestCase):
+
+    """Tests for finding unique matches."""
+
+    def test_find_unique_match_mask(self):
+        """Test that bitmask and match comparisons agree."""
+        teams = ['A', 'B', 'C', 'D', 'E', 'F']
+        masks = Scheduler.team_masks(teams)
+        matches = list(itertools.permutations(teams, 2))
+        for __ in range(20):
+            random.shuffle(matches)
+            round = [matches[0]]
+            used = masks[matches[0][0]] | masks[matches[0][1]]
+            rest = matches[1:]
+            possibilities = iter(matches[1:])
+            while True:
+                try:
+                    expected = Scheduler.find_unique_match(round, rest)
+                except NoMatchFound:
+                    self.assertRaises(NoMatchFound, Scheduler.find_unique_match_mask,
+                                      used, possibilities, masks)
+                    break
+                (match, mask) = Scheduler.find_unique_match_mask(used, possibilities,
+                                                                 masks)
+                self.assertEqual(expected, match)
+                round.append(match)
+                used |= mask
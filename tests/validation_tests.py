@@ -0,0 +1,99 @@
+# -*- coding: utf-8  -*-
+"""Tests for schedule validation."""
+
+# Copyright (C) 2015 Alexander Jones
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import unittest
+
+from . import TestCase
+
+from competitions.scheduler import vectorized
+from competitions.scheduler.roundrobin import RoundRobinScheduler
+from competitions.scheduler.validation import Violation, validate_schedule
+
+
+class TestValidateSchedule(TestCase):
+
+    """Tests for schedule validation."""
+
+    def test_valid(self):
+        """Test that generated schedules are valid."""
+        for engine in RoundRobinScheduler.ENGINES:
+            for (teams, meetings) in ((5, 1), (6, 2), (8, 3)):
+                scheduler = RoundRobinScheduler(teams, meetings=meetings,
+                                                engine=engine)
+                schedule = scheduler.generate_schedule(rng=3)
+                self.assertEqual([], validate_schedule(
+                    schedule, scheduler.teams, meetings,
+                    scheduler.home_teams or None))
+                compact = scheduler.generate_schedule(rng=3, compact=True)
+                self.assertEqual([], validate_schedule(
+                    compact, len(scheduler.teams), meetings))
+
+    def test_violations(self):
+        """Test that violations are found."""
+        teams = ['a', 'b', 'c', 'd']
+        schedule = [[('a', 'b'), ('c', 'd')],
+                    [('d', 'a'), ('b', 'c')],
+                    [('a', 'c'), ('d', 'b')]]
+        self.assertEqual([], validate_schedule(schedule, teams, 1))
+        self.assertEqual(
+            [Violation('home_matches', None, ('a',), 1, 2),
+             Violation('home_matches', None, ('b',), 2, 1)],
+            validate_schedule(schedule, teams, 1, home_teams=['b', 'd']))
+
+        schedule[2] = [('a', 'c'), ('d', 'a')]
+        self.assertEqual(
+            [Violation('round_team', 2, ('a',), 1, 2),
+             Violation('round_team', 2, ('b',), 1, 0),
+             Violation('meetings', None, ('a', 'd'), 1, 2),
+             Violation('meetings', None, ('b', 'd'), 1, 0)],
+            validate_schedule(schedule, teams, 1))
+
+        schedule[2] = [('a', 'c'), ('d', 'e')]
+        self.assertEqual(
+            [Violation('round_team', 2, ('b',), 1, 0),
+             Violation('unknown_team', 2, ('e',), 0, 1),
+             Violation('meetings', None, ('b', 'd'), 1, 0)],
+            validate_schedule(schedule, teams, 1))
+
+    def test_round_sizes(self):
+        """Test that rounds of the wrong size are reported on their own."""
+        schedule = [[(0, 1), (2, 3)], [(3, 0)]]
+        self.assertEqual(
+            [Violation('round_count', None, (), 3, 2),
+             Violation('round_size', 1, (), 2, 1)],
+            validate_schedule(schedule, 4, 1))
+
+    def test_backend(self):
+        """Test that an unknown backend is rejected."""
+        self.assertRaises(ValueError, validate_schedule, [], 4, 1,
+                          backend='fortran')
+
+    @unittest.skipIf(vectorized.numpy is None, 'NumPy is not installed.')
+    def test_numpy(self):
+        """Test that NumPy finds the same violations."""
+        scheduler = RoundRobinScheduler(10, meetings=3)
+        schedule = scheduler.generate_schedule(rng=5, indices=True)
+        self.assertEqual([], validate_schedule(schedule, 10, 3, backend='numpy'))
+        schedule[4][1] = schedule[7][2]
+        schedule[9][0] = (schedule[9][0][0], 12)
+        violations = validate_schedule(schedule, 10, 3)
+        self.assertTrue(violations)
+        self.assertEqual(violations,
+                         validate_schedule(schedule, 10, 3, backend='numpy'))